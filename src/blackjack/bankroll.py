@@ -0,0 +1,300 @@
+"""
+Bet ramps, and bankrolls simulated under them.
+
+A counting player bets more when the true count is high. How big their
+bankroll needs to be for that bet ramp depends on the whole distribution
+of their results, not just the average, so it is estimated by simulating
+many bankrolls at once, each as a row of an array.
+
+The bet ramp that grows a bankroll fastest (the Kelly ramp) is solved
+directly from the count profile, without simulating any hands.
+
+Rather than playing every hand through the game, each hand's result is
+drawn from a count profile: how often hands are played at each true count,
+and the mean and variance of a hand's result there. A hand's result is
+drawn from a normal distribution with that mean and variance, which is
+accurate over the thousands of hands that a bankroll lasts, and the true
+count of each hand is drawn independently of the last.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+# The most results to draw at once, across every bankroll
+CHUNK_SIZE = 2**22
+
+
+@dataclasses.dataclass(frozen=True)
+class CountProfile:
+    """
+    The results of a hand at each true count, per unit bet.
+
+    Each true count is the start of a bucket of true counts, in increasing
+    order, and the frequencies, means and variances are for the hands
+    played with a true count in that bucket.
+    """
+
+    true_counts: npt.NDArray[np.float64]
+    frequencies: npt.NDArray[np.float64]
+    means: npt.NDArray[np.float64]
+    variances: npt.NDArray[np.float64]
+
+    def __post_init__(self) -> None:
+        shapes = {
+            np.shape(self.true_counts),
+            np.shape(self.frequencies),
+            np.shape(self.means),
+            np.shape(self.variances),
+        }
+        if len(shapes) != 1 or len(shapes.pop()) != 1:
+            raise ValueError(
+                "The profile needs one frequency, mean and variance for each"
+                " true count"
+            )
+        if np.any(np.diff(self.true_counts) <= 0):
+            raise ValueError("The true counts must be in increasing order")
+        if np.any(self.frequencies < 0) or not np.isclose(
+            np.sum(self.frequencies), 1
+        ):
+            raise ValueError("The frequencies must be probabilities")
+        if np.any(self.variances < 0):
+            raise ValueError("The variances cannot be negative")
+
+
+@dataclasses.dataclass
+class BankrollResult:
+    """
+    The simulated bankrolls, with one entry for each bankroll.
+    """
+
+    starting_bankroll: float
+    final_bankroll: npt.NDArray[np.float64]
+    ruined: npt.NDArray[np.bool_]
+    # The number of hands taken to double the bankroll, or infinity if it
+    # was not doubled before it was ruined or the simulation ended
+    hands_to_double: npt.NDArray[np.float64]
+    # The largest fall of the bankroll from its highest point so far
+    max_drawdown: npt.NDArray[np.float64]
+
+    @property
+    def risk_of_ruin(self) -> float:
+        """
+        The fraction of bankrolls that were ruined.
+        """
+        return float(self.ruined.mean())
+
+    @property
+    def median_hands_to_double(self) -> float:
+        """
+        The median number of hands taken to double the bankroll, which is
+        infinite if fewer than half the bankrolls doubled.
+        """
+        return float(np.median(self.hands_to_double))
+
+    def drawdown_quantiles(
+        self,
+        quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+    ) -> dict[float, float]:
+        """
+        The quantiles of the largest drawdown of each bankroll.
+
+        :param quantiles: The quantiles to calculate, between 0 and 1.
+
+        :return: The largest drawdown at each quantile.
+        """
+        values = np.quantile(self.max_drawdown, quantiles)
+        return dict(zip(quantiles, values.tolist(), strict=True))
+
+
+@dataclasses.dataclass(frozen=True)
+class BetRamp:
+    """
+    A bet for each bucket of true counts, in increasing order.
+
+    The bet at a true count is the bet of the bucket that it falls in, or
+    of the lowest bucket for a true count below every bucket.
+    """
+
+    true_counts: npt.NDArray[np.float64]
+    bets: npt.NDArray[np.float64]
+
+    def __call__(self, true_count: float) -> float:
+        bucket = np.searchsorted(self.true_counts, true_count, side="right")
+        return float(self.bets[max(bucket - 1, 0)])
+
+
+def growth_rate(
+    profile: CountProfile,
+    ramp: Callable[[float], float],
+    bankroll: float,
+) -> float:
+    """
+    The expected growth of the logarithm of the bankroll per hand.
+
+    This uses the usual second-order approximation of the logarithm, which
+    is accurate when each bet is a small part of the bankroll.
+
+    :param profile: The results of a hand at each true count.
+    :param ramp: The bet to place at each true count.
+    :param bankroll: The current bankroll.
+
+    :return: The expected growth rate per hand.
+    """
+    bets = np.array([ramp(true_count) for true_count in profile.true_counts])
+    fractions = bets / bankroll
+    second_moments = profile.variances + np.square(profile.means)
+    return float(
+        profile.frequencies
+        @ (
+            fractions * profile.means
+            - np.square(fractions) * second_moments / 2
+        )
+    )
+
+
+def kelly_ramp(
+    profile: CountProfile,
+    bankroll: float,
+    min_bet: float,
+    max_bet: float,
+    fraction: float = 1.0,
+) -> BetRamp:
+    """
+    Solve for the bet ramp that maximises the growth rate of the bankroll
+    within the table's limits.
+
+    The growth rate (see ``growth_rate``) is a sum of concave quadratics,
+    one for each true count, so it is maximised by maximising each of them:
+    the best bet is the Kelly bet, ``bankroll * mean / E[result^2]``,
+    clipped to the table's limits. Counts with a negative mean get the
+    minimum bet.
+
+    :param profile: The results of a hand at each true count.
+    :param bankroll: The current bankroll.
+    :param min_bet: The table's minimum bet, such as ``Game.min_bet``.
+    :param max_bet: The table's maximum bet.
+    :param fraction: The fraction of the Kelly bet to bet, before clipping
+        to the limits. Fractional Kelly gives up a little growth for far
+        smaller swings.
+
+    :return: The bet ramp, with a bet for each of the profile's true counts.
+    """
+    if bankroll <= 0 or not 0 < min_bet <= max_bet:
+        raise ValueError(
+            "The bankroll must be positive, and the minimum bet must be"
+            " positive and no more than the maximum bet"
+        )
+    if not 0 < fraction <= 1:
+        raise ValueError("The Kelly fraction must be between 0 and 1")
+
+    second_moments = profile.variances + np.square(profile.means)
+    kelly = np.divide(
+        bankroll * profile.means,
+        second_moments,
+        out=np.zeros(len(profile.means)),
+        where=second_moments > 0,
+    )
+    return BetRamp(
+        true_counts=np.asarray(profile.true_counts, dtype=float),
+        bets=np.clip(fraction * kelly, min_bet, max_bet),
+    )
+
+
+def simulate(  # noqa: PLR0913
+    profile: CountProfile,
+    ramp: Callable[[float], float],
+    bankroll: float,
+    number_of_hands: int,
+    *,
+    number_of_bankrolls: int = 100_000,
+    rng: np.random.Generator | None = None,
+) -> BankrollResult:
+    """
+    Simulate bankrolls that play a number of hands under a bet ramp.
+
+    A bankroll is ruined once it falls to zero, and stops playing.
+
+    :param profile: The results of a hand at each true count.
+    :param ramp: The bet to place at each true count.
+    :param bankroll: The money that each bankroll starts with.
+    :param number_of_hands: The number of hands for each bankroll to play.
+    :param number_of_bankrolls: The number of bankrolls to simulate.
+    :param rng: The random number generator to draw the results with.
+
+    :return: The simulated bankrolls.
+    """
+    if bankroll <= 0:
+        raise ValueError("The bankroll must be positive")
+    if number_of_hands < 0 or number_of_bankrolls < 1:
+        raise ValueError(
+            "There must be at least one bankroll, playing a non-negative"
+            " number of hands"
+        )
+    rng = rng or np.random.default_rng()
+
+    bets = np.array([ramp(true_count) for true_count in profile.true_counts])
+    means = bets * profile.means
+    deviations = bets * np.sqrt(profile.variances)
+    thresholds = np.cumsum(profile.frequencies)
+    thresholds[-1] = 1  # Guard against rounding
+
+    money = np.full(number_of_bankrolls, float(bankroll))
+    peak = money.copy()
+    ruined = np.zeros(number_of_bankrolls, dtype=bool)
+    hands_to_double = np.full(number_of_bankrolls, np.inf)
+    max_drawdown = np.zeros(number_of_bankrolls)
+
+    chunk = max(1, CHUNK_SIZE // number_of_bankrolls)
+    for start in range(0, number_of_hands, chunk):
+        playing = np.flatnonzero(~ruined)
+        if not playing.size:
+            break
+        hands = min(chunk, number_of_hands - start)
+        buckets = np.searchsorted(
+            thresholds,
+            rng.random((playing.size, hands)),
+            side="right",
+        )
+        results = means[buckets] + deviations[buckets] * rng.standard_normal(
+            (playing.size, hands)
+        )
+        path = money[playing, np.newaxis] + np.cumsum(results, axis=1)
+
+        # Only the hands up to and including the one that ruins the
+        # bankroll are played
+        broke = path <= 0
+        ruined_at = np.where(broke.any(axis=1), broke.argmax(axis=1), hands)
+        played = np.arange(hands) <= ruined_at[:, np.newaxis]
+
+        peaks = np.maximum(
+            np.maximum.accumulate(path, axis=1),
+            peak[playing, np.newaxis],
+        )
+        # A ruined bankroll can only lose what it had left
+        drawdown = peaks - np.maximum(path, 0)
+        drawdown = np.where(played, drawdown, 0).max(axis=1)
+        max_drawdown[playing] = np.maximum(max_drawdown[playing], drawdown)
+
+        doubled = (path >= 2 * bankroll) & played
+        first = np.where(doubled.any(axis=1), doubled.argmax(axis=1), np.inf)
+        newly_doubled = np.isinf(hands_to_double[playing]) & np.isfinite(first)
+        hands_to_double[playing[newly_doubled]] = (
+            start + first[newly_doubled] + 1
+        )
+
+        ruined[playing] = ruined_at < hands
+        money[playing] = np.where(ruined_at < hands, 0, path[:, -1])
+        peak[playing] = peaks[:, -1]
+
+    return BankrollResult(
+        starting_bankroll=bankroll,
+        final_bankroll=money,
+        ruined=ruined,
+        hands_to_double=hands_to_double,
+        max_drawdown=max_drawdown,
+    )
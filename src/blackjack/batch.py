@@ -0,0 +1,327 @@
+"""
+Simulate many independent hands of Blackjack at once, as arrays.
+
+Rather than playing each round through ``Game.play_round``, a batch of
+rounds is played together: every round's cards are drawn, looked up in a
+compiled strategy, and settled as arrays, so there is no Python-level
+work per hand. This is for sweeping many strategies and rule variants,
+where the per-object overhead of the game dominates.
+
+Each player's hand is dealt from its own full shoe, so the rounds are
+independent, and cards are drawn without replacement from the shoe's
+composition. The rules match ``rules``, except that a hand is split at
+most once and the player always has the money to double down or split.
+"""
+
+from __future__ import annotations
+
+import collections
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+import playing_cards
+
+from blackjack import constants, participants, sim
+from blackjack import strategy as strategy_
+
+BATCH_SIZE = 100_000
+
+_HIT = strategy_.OPTIONS.index(participants.PlayerOption.HIT)
+_STAND = strategy_.OPTIONS.index(participants.PlayerOption.STAND)
+_DOUBLE_DOWN = strategy_.OPTIONS.index(participants.PlayerOption.DOUBLE_DOWN)
+_SPLIT = strategy_.OPTIONS.index(participants.PlayerOption.SPLIT)
+
+
+def _values(ranks: npt.NDArray[np.int_]) -> npt.NDArray[np.int_]:
+    return np.minimum(ranks, 10)
+
+
+def _totals(
+    hard: npt.NDArray[np.int_],
+    ace: npt.NDArray[np.bool_],
+) -> npt.NDArray[np.int_]:
+    soft = ace & (hard + constants.ACE_BONUS <= constants.BLACKJACK)
+    return np.where(soft, hard + constants.ACE_BONUS, hard)
+
+
+class _Batch:
+    """
+    The state of a batch of rounds.
+
+    Each round has two player hand slots: the hand that is dealt, and the
+    hand that it is split into. Hand ``i`` and hand ``i + rounds`` are in
+    round ``i``.
+    """
+
+    rng: np.random.Generator
+    rounds: int
+    cards_per_rank: int
+    composition: npt.NDArray[np.int16]
+    hard: npt.NDArray[np.int_]
+    ace: npt.NDArray[np.bool_]
+    cards: npt.NDArray[np.int_]
+    ranks: npt.NDArray[np.int_]
+    bet: npt.NDArray[np.int_]
+    dealt: npt.NDArray[np.bool_]
+    playing: npt.NDArray[np.bool_]
+    from_split: npt.NDArray[np.bool_]
+
+    def __init__(
+        self,
+        rounds: int,
+        number_of_decks: int,
+        rng: np.random.Generator,
+    ) -> None:
+        self.rng = rng
+        self.rounds = rounds
+        self.cards_per_rank = len(playing_cards.Suit) * number_of_decks
+        self.composition = np.full(
+            (rounds, len(playing_cards.Rank)),
+            self.cards_per_rank,
+            dtype=np.int16,
+        )
+
+        hands = 2 * rounds
+        self.hard = np.zeros(hands, dtype=int)
+        self.ace = np.zeros(hands, dtype=bool)
+        self.cards = np.zeros(hands, dtype=int)
+        self.ranks = np.zeros((hands, 2), dtype=int)
+        self.bet = np.ones(hands, dtype=int)
+        self.dealt = np.arange(hands) < rounds
+        self.playing = self.dealt.copy()
+        self.from_split = np.zeros(hands, dtype=bool)
+
+    def draw(self, rounds: npt.NDArray[np.int_]) -> npt.NDArray[np.int_]:
+        """
+        Draw a card from the shoe of each of the rounds, which must be
+        different rounds.
+
+        A full shoe has the same number of cards of each rank, so a rank is
+        picked uniformly and then kept with the probability that a card of
+        that rank is still in the shoe. Only a few cards are dealt from each
+        shoe, so this rarely needs to pick again, and avoids summing every
+        shoe's composition for every card.
+
+        :return: The rank of each card drawn.
+        """
+        ranks = np.empty(len(rounds), dtype=int)
+        pending = np.arange(len(rounds))
+        while pending.size:
+            rank = self.rng.integers(len(playing_cards.Rank), size=pending.size)
+            kept = (
+                self.rng.integers(self.cards_per_rank, size=pending.size)
+                < self.composition[rounds[pending], rank]
+            )
+            ranks[pending[kept]] = rank[kept]
+            pending = pending[~kept]
+
+        self.composition[rounds, ranks] -= 1
+        return ranks + 1
+
+    def hit(self, hands: npt.NDArray[np.int_]) -> None:
+        """
+        Draw a card for each of the hands.
+        """
+        # Both hands in a round draw from the same shoe, so they draw in turn
+        for slot in (hands[hands < self.rounds], hands[hands >= self.rounds]):
+            ranks = self.draw(slot % self.rounds)
+            first_two = self.cards[slot] < constants.BLACKJACK_CARD_COUNT
+            self.ranks[slot[first_two], self.cards[slot[first_two]]] = ranks[
+                first_two
+            ]
+            self.hard[slot] += _values(ranks)
+            self.ace[slot] |= ranks == 1
+            self.cards[slot] += 1
+
+    def split(self, hands: npt.NDArray[np.int_]) -> None:
+        """
+        Split each of the hands, which must be pairs, into two hands.
+        """
+        for hand in (hands, hands + self.rounds):
+            self.hard[hand] = _values(self.ranks[hands, 0])
+            self.ace[hand] = self.ranks[hands, 0] == 1
+            self.cards[hand] = 1
+            self.ranks[hand, 0] = self.ranks[hands, 0]
+            self.dealt[hand] = True
+            self.playing[hand] = True
+            self.from_split[hand] = True
+            self.hit(hand)
+
+        # Splitting Aces only gets one card each
+        aces = hands[self.ranks[hands, 0] == 1]
+        self.playing[aces] = False
+        self.playing[aces + self.rounds] = False
+
+
+def _play_batch(
+    strategy: strategy_.Strategy,
+    rounds: int,
+    number_of_decks: int,
+    rng: np.random.Generator,
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.bool_]]:
+    """
+    Play a batch of rounds.
+
+    :return: The outcome of each hand (1 for a win, -1 for a loss and 0 for
+        a draw), the bet on each hand as a multiple of the minimum bet, and
+        whether each hand slot was dealt.
+    """
+    batch = _Batch(rounds, number_of_decks, rng)
+    every_round = np.arange(rounds)
+    batch.hit(every_round)
+    batch.hit(every_round)
+
+    upcard = batch.draw(every_round)
+    dealer_hard = _values(upcard)
+    dealer_ace = upcard == 1
+    hole_card = batch.draw(every_round)
+    dealer_hard += _values(hole_card)
+    dealer_ace |= hole_card == 1
+    column = (_values(upcard) - 2) % len(strategy_.DEALER_CARDS)
+
+    # Play the player's hands, with the options from
+    # ``rules.get_options_for_player_hand``
+    dealer_has_ace = np.tile(upcard == 1, 2)
+    while True:
+        blackjack = (batch.cards == constants.BLACKJACK_CARD_COUNT) & (
+            _totals(batch.hard, batch.ace) == constants.BLACKJACK
+        )
+        batch.playing &= batch.hard <= constants.BLACKJACK
+        batch.playing &= ~blackjack | dealer_has_ace
+        hands = np.flatnonzero(batch.playing)
+        if not hands.size:
+            break
+
+        can_double = batch.cards[hands] == constants.DOUBLE_DOWN_CARD_COUNT
+        can_split = (
+            can_double
+            & (batch.ranks[hands, 0] == batch.ranks[hands, 1])
+            & ~batch.from_split[hands]
+        )
+        cells = strategy.lookup(
+            batch.hard[hands],
+            batch.ace[hands],
+            np.where(can_split, _values(batch.ranks[hands, 0]), 0),
+            column[hands % rounds],
+        )
+        preferred, fallback = cells[:, 0], cells[:, 1]
+        available = (
+            (preferred == _HIT)
+            | (preferred == _STAND)
+            | ((preferred == _DOUBLE_DOWN) & can_double)
+            | ((preferred == _SPLIT) & can_split)
+        )
+        decision = np.where(available, preferred, fallback)
+
+        batch.playing[hands[decision == _STAND]] = False
+        batch.hit(hands[decision == _HIT])
+        doubled = hands[decision == _DOUBLE_DOWN]
+        batch.bet[doubled] *= 2
+        batch.hit(doubled)
+        batch.playing[doubled] = False
+        batch.split(hands[decision == _SPLIT])
+
+    # Play the dealer's hands, as in ``rules.play_hand__dealer``
+    dealer_cards = np.full(rounds, constants.BLACKJACK_CARD_COUNT)
+    while True:
+        drawing = np.flatnonzero(
+            _totals(dealer_hard, dealer_ace) < constants.DEALER_LOWER_LIMIT
+        )
+        if not drawing.size:
+            break
+        card = batch.draw(drawing)
+        dealer_hard[drawing] += _values(card)
+        dealer_ace[drawing] |= card == 1
+        dealer_cards[drawing] += 1
+
+    # Settle the hands, as in ``rules.get_hand_outcome``
+    player_total = _totals(batch.hard, batch.ace)
+    player_blackjack = (batch.cards == constants.BLACKJACK_CARD_COUNT) & (
+        player_total == constants.BLACKJACK
+    )
+    dealer_total = np.tile(_totals(dealer_hard, dealer_ace), 2)
+    dealer_blackjack = np.tile(
+        (dealer_cards == constants.BLACKJACK_CARD_COUNT)
+        & (_totals(dealer_hard, dealer_ace) == constants.BLACKJACK),
+        2,
+    )
+    outcome = np.select(
+        [
+            batch.hard > constants.BLACKJACK,
+            dealer_total > constants.BLACKJACK,
+            dealer_blackjack,
+        ],
+        [-1, 1, np.where(player_blackjack, 0, -1)],
+        np.sign(player_total - dealer_total),
+    )
+    return outcome, batch.bet, batch.dealt
+
+
+def simulate(  # noqa: PLR0913
+    strategy: strategy_.Strategy,
+    number_of_rounds: int,
+    table: sim.Table = sim.STANDARD_TABLE,
+    rng: np.random.Generator | None = None,
+    *,
+    progress: Callable[[sim.SimulationResult], None] | None = None,
+    stop: Callable[[sim.SimulationResult], bool] | None = None,
+) -> sim.SimulationResult:
+    """
+    Simulate a number of rounds of Blackjack as arrays.
+
+    :param strategy: The compiled strategy that the players use.
+    :param number_of_rounds: The number of rounds to play.
+    :param table: The set-up of the table to play at. Each player's hand
+        is dealt from its own full shoe, so the penetration is not used.
+    :param rng: The random number generator to draw the cards with.
+    :param progress: Called with the result so far after each batch, for
+        reporting on long simulations.
+    :param stop: Called with the result so far after each batch, to stop
+        the simulation early once it returns true, such as
+        ``sim.precise_to``.
+
+    :return: The aggregated result of all the rounds played.
+    """
+    if number_of_rounds < 0:
+        raise ValueError("The number of rounds cannot be negative")
+    rng = rng or np.random.default_rng()
+
+    # Each batch is a whole number of rounds, so that the rounds can be
+    # added up batch by batch
+    rounds_per_batch = max(BATCH_SIZE // table.number_of_players, 1)
+    result = sim.SimulationResult()
+    for start in range(0, number_of_rounds, rounds_per_batch):
+        rounds = min(rounds_per_batch, number_of_rounds - start)
+        outcome, bet, dealt = _play_batch(
+            strategy,
+            rounds * table.number_of_players,
+            table.number_of_decks,
+            rng,
+        )
+        # Put each round's split hand after its first hand, so that the
+        # hands are in the order they would be played
+        dealt = dealt.reshape(2, -1).T.ravel()
+        outcome = outcome.reshape(2, -1).T.ravel()[dealt]
+        stake = table.min_bet * bet.reshape(2, -1).T.ravel()[dealt]
+        net = outcome * stake
+        result.rounds += rounds
+        result.hands += len(outcome)
+        result.staked += int(stake.sum())
+        result.net += int(net.sum())
+        result.outcomes.update(
+            collections.Counter(
+                {
+                    participants.HandOutcome.WIN: int((outcome == 1).sum()),
+                    participants.HandOutcome.LOSE: int((outcome == -1).sum()),
+                    participants.HandOutcome.DRAW: int((outcome == 0).sum()),
+                }
+            )
+        )
+        result.per_hand.add__many(net)
+        if progress:
+            progress(result)
+        if stop and stop(result):
+            break
+
+    return result
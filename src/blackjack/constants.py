@@ -6,6 +6,7 @@ BLACKJACK = 21
 BLACKJACK_CARD_COUNT = 2
 DOUBLE_DOWN_CARD_COUNT = 2
 DEALER_LOWER_LIMIT = 17
+ACE_BONUS = 10  # An Ace can count as 11 rather than 1
 
 
 # https://stackoverflow.com/a/39452138/8213085
@@ -0,0 +1,85 @@
+"""
+Card counting systems.
+
+A counting system tags each rank with a small whole number. Counting
+players keep a running count of the tags of the cards they have seen, and
+divide it by the number of decks left to get the true count, which tells
+them how favourable the rest of the shoe is.
+
+The deck keeps the count itself (see ``Deck.running_count`` and
+``Deck.true_count``), adding each card's tag as it is dealt, so the count
+never needs to be recomputed from the cards that have been played.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import playing_cards
+
+
+@dataclasses.dataclass(frozen=True)
+class CountingSystem:
+    """
+    A card counting system.
+
+    A balanced system's tags add up to zero over a full deck, so its
+    running count starts at zero. An unbalanced system's running count
+    starts at ``initial_count_per_deck`` for every deck after the first,
+    so that its key counts do not depend on the number of decks.
+    """
+
+    name: str
+    # The tag of each rank, from Aces to Kings
+    tags: tuple[int, ...]
+    initial_count_per_deck: int = 0
+
+    def __post_init__(self) -> None:
+        if len(self.tags) != len(playing_cards.Rank):
+            raise ValueError(
+                f"A counting system needs a tag for each of the"
+                f" {len(playing_cards.Rank)} ranks"
+            )
+
+    @property
+    def balanced(self) -> bool:
+        """
+        Whether the tags add up to zero over a full deck.
+        """
+        return sum(self.tags) == 0
+
+    def initial_count(self, number_of_decks: int) -> int:
+        """
+        The running count of a freshly shuffled shoe.
+
+        :param number_of_decks: The number of 52-card decks in the shoe.
+        """
+        return self.initial_count_per_deck * (number_of_decks - 1)
+
+
+def _by_value(*tags: int) -> tuple[int, ...]:
+    """
+    The tag of each rank, from the tag of each value from Ace to ten.
+    """
+    return *tags, tags[-1], tags[-1], tags[-1]
+
+
+HI_LO = CountingSystem(
+    "Hi-Lo",
+    #          A  2  3  4  5  6  7  8  9  T
+    _by_value(-1, 1, 1, 1, 1, 1, 0, 0, 0, -1),
+)
+KO = CountingSystem(
+    "KO",
+    #          A  2  3  4  5  6  7  8  9  T
+    _by_value(-1, 1, 1, 1, 1, 1, 1, 0, 0, -1),
+    initial_count_per_deck=-4,
+)
+OMEGA_II = CountingSystem(
+    "Omega II",
+    #         A  2  3  4  5  6  7  8  9   T
+    _by_value(0, 1, 1, 2, 2, 2, 1, 0, -1, -2),
+)
+
+# A system that tags every card as zero, for a deck that is not counted
+NO_COUNT = CountingSystem("No count", (0,) * len(playing_cards.Rank))
@@ -6,93 +6,163 @@ from __future__ import annotations
 
 import dataclasses
 import functools
-import itertools
 from collections.abc import Generator
+from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import playing_cards
 
-from blackjack import constants
+from blackjack import constants, counting
 
 
 @functools.total_ordering
 class Values:
     """
-    Values for a playing card.
+    Values for a playing card, or for a hand of cards.
 
     Usually, a playing card's value is the same as its rank. However, an ace
     can have a value of 1 and 11, and face cards have a value of 10.
+
+    Since at most one Ace in a hand can ever count as 11, the values are
+    stored as the hard total (every Ace counting as 1) and whether there
+    is an Ace that could count as 11 instead. This makes adding values and
+    checking for bust or Blackjack constant-time integer operations.
     """
 
-    _values: set[int]
+    __slots__ = ("ace", "hard")
+
+    hard: int
+    ace: bool
+
+    def __init__(self, hard: int, ace: bool = False) -> None:
+        """
+        Instantiate values from a hard total.
 
-    def __init__(self, values: set[int]) -> None:
-        self._values = values
+        :param hard: The total when every Ace counts as 1.
+        :param ace: Whether there is an Ace that could count as 11.
+        """
+        self.hard = hard
+        self.ace = ace
 
     @classmethod
     def from_rank(cls, rank: playing_cards.Rank) -> Values:
         """
         Return a ``Value`` from a ``Rank``.
         """
-        return cls(
-            {1, 11} if rank == playing_cards.Rank.ACE else {min(rank.value, 10)}
-        )
+        if rank == playing_cards.Rank.ACE:
+            return cls(1, ace=True)
+        return cls(min(rank.value, 10))
 
     def __str__(self) -> str:
-        return str(self._values) if self._values else "BUST!"
+        if self.bust:
+            return "BUST!"
+        if self.soft:
+            return f"{{{self.hard}, {self.hard + constants.ACE_BONUS}}}"
+        return f"{{{self.hard}}}"
 
     def __repr__(self) -> str:
-        return f"Value(value={self._values})"
+        return f"Values(hard={self.hard}, ace={self.ace})"
 
     def __hash__(self) -> int:
-        return hash(frozenset(self._values))
+        return hash((self.hard, self.ace))
 
     def __eq__(self, other: Values) -> bool:
         if isinstance(other, Values):
-            return self._values == other._values
+            return self.hard == other.hard and self.ace == other.ace
         return NotImplemented
 
     def __lt__(self, other: Values) -> bool:
-        return max(self._values) < max(other._values)
+        return self.total < other.total
 
     def __add__(self, other: int | Values) -> Values:
         if isinstance(other, int):
-            other_ = {other}
-        elif isinstance(other, Values):
-            other_ = other._values
-        else:
-            return NotImplemented
+            return Values(self.hard + other, self.ace)
+        if isinstance(other, Values):
+            return Values(self.hard + other.hard, self.ace or other.ace)
+        return NotImplemented
 
-        return Values({sum(p) for p in itertools.product(self._values, other_)})
+    def __radd__(self, other: int) -> Values:
+        return self + other
 
     def __iter__(self) -> Generator[int]:
-        yield from self._values
+        """
+        Yield every possible total, including any that are bust.
+        """
+        yield self.hard
+        if self.ace:
+            yield self.hard + constants.ACE_BONUS
 
     @property
-    def eligible_values(self) -> Values:
+    def soft(self) -> bool:
         """
-        The eligible values for winning.
+        Whether an Ace counts as 11 in the best total.
         """
-        return Values(
-            {value for value in self._values if value <= constants.BLACKJACK}
+        return (
+            self.ace and self.hard + constants.ACE_BONUS <= constants.BLACKJACK
         )
 
+    @property
+    def total(self) -> int:
+        """
+        The best total: the highest total that is not bust, if there is one.
+        """
+        if self.soft:
+            return self.hard + constants.ACE_BONUS
+        return self.hard
+
+    @property
+    def bust(self) -> bool:
+        """
+        Whether every total is over 21.
+        """
+        return self.hard > constants.BLACKJACK
+
+
+_SUITS = list(playing_cards.Suit)
+
+
+def _card_code(rank: playing_cards.Rank, suit: playing_cards.Suit) -> int:
+    return (rank.value - 1) * len(_SUITS) + _SUITS.index(suit)
+
 
 @dataclasses.dataclass
 class Card(playing_cards.Card):
     """
     A playing card from the French-suited, standard 52-card pack.
+
+    Cards are immutable and hashable. There are only 52 distinct cards, so
+    they are made once, in ``CARDS``, and shared by every deck; a card's
+    ``code`` is its position in ``CARDS``.
     """
 
     values: Values = dataclasses.field(repr=False)
+    code: int = dataclasses.field(repr=False, compare=False)
 
     def __init__(
         self,
         rank: playing_cards.Rank,
         suit: playing_cards.Suit,
     ) -> None:
-        self.rank = rank
-        self.suit = suit
-        self.values = Values.from_rank(rank)
+        object.__setattr__(self, "rank", rank)
+        object.__setattr__(self, "suit", suit)
+        object.__setattr__(self, "values", Values.from_rank(rank))
+        object.__setattr__(self, "code", _card_code(rank, suit))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise dataclasses.FrozenInstanceError(
+            f"cannot assign to field {name!r}"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __hash__(self) -> int:
+        return self.code
+
+    def __reduce__(self) -> tuple[object, tuple[int]]:
+        # Unpickle to the shared card rather than to a copy of it
+        return _card_from_code, (self.code,)
 
     def __add__(self, other: int | Card) -> Values:
         """
@@ -118,24 +188,309 @@ class Card(playing_cards.Card):
         return f"{constants.Colours.BLUE}{face}{constants.Colours.END}"
 
 
+CARDS = tuple(
+    Card(rank, suit)
+    for rank in playing_cards.Rank
+    for suit in playing_cards.Suit
+)
+
+
+def _card_from_code(code: int) -> Card:
+    return CARDS[code]
+
+
+@dataclasses.dataclass(frozen=True)
+class DeckState:
+    """
+    A snapshot of a deck, which a deck can be restored to in order to deal
+    the same cards again.
+
+    The random number generator's state is included, so that any shuffles
+    after the snapshot are the same too.
+    """
+
+    codes: npt.NDArray[np.uint8]
+    position: int
+    composition: npt.NDArray[np.int64]
+    discards: tuple[Card, ...]
+    rng_state: dict[str, Any]
+    running_count: int = 0
+
+
 class Deck(playing_cards.Decks):
     """
-    A set of multiple decks of cards.
+    A set of multiple decks of cards, dealt from a shoe.
+
+    The shoe is stored as an array of card codes (positions in ``CARDS``)
+    and cards are dealt by moving a position forward through it, so
+    shuffling and dealing never move ``Card`` objects around.
+
+    The shoe keeps dealing across rounds. The cards from finished rounds
+    go on the discard pile, and the deck is only reset and reshuffled once
+    the cut card is reached.
+
+    The deck also counts the cards left of each rank as they are dealt, so
+    the composition of the rest of the shoe never needs to be recounted:
+    ``composition[rank - 1]`` is the number of cards of that rank left.
+    Likewise, it keeps the running count of a counting system, adding each
+    card's tag as it is dealt.
     """
 
+    rng: np.random.Generator
+    penetration: float
+    counting_system: counting.CountingSystem
+    discards: list[Card]
+    codes: npt.NDArray[np.uint8]
+    position: int
+    composition: npt.NDArray[np.int64]
+    running_count: int
+    _shoe: npt.NDArray[np.uint8]
+    _tags: list[int]
+    _tag_array: npt.NDArray[np.int64]
+
+    def __init__(
+        self,
+        number_of_decks: int,
+        rng: np.random.Generator | None = None,
+        penetration: float = 0.75,
+        counting_system: counting.CountingSystem = counting.NO_COUNT,
+    ) -> None:
+        """
+        Instantiate a set of multiple decks of cards.
+
+        :param number_of_decks: The number of 52-card decks to use.
+        :param rng: The random number generator to shuffle the cards with.
+            Defaults to a new, randomly seeded generator.
+        :param penetration: The fraction of the cards to deal before the cut
+            card is reached and the deck needs reshuffling.
+        :param counting_system: The counting system to keep the count of.
+            Defaults to not counting.
+        """
+        if not 0 < penetration <= 1:
+            raise ValueError("The penetration must be between 0 and 1")
+
+        # The tag of each card, by its code
+        self._tag_array = np.repeat(counting_system.tags, len(_SUITS))
+        self._tags = self._tag_array.tolist()
+        self.counting_system = counting_system
+
+        self._shoe = np.tile(
+            np.arange(len(CARDS), dtype=np.uint8),
+            number_of_decks,
+        )
+        self.rng = rng or np.random.default_rng()
+        self.penetration = penetration
+        self.discards = []
+        super().__init__(number_of_decks)
+
+    def __len__(self) -> int:
+        return len(self.codes) - self.position
+
+    @property
+    def cards(self) -> list[Card]:
+        """
+        The cards left in the deck, in the order that they will be dealt.
+        """
+        return [CARDS[code] for code in self.codes[self.position :]]
+
+    @cards.setter
+    def cards(self, cards: list[playing_cards.Card]) -> None:
+        self.codes = np.fromiter(
+            (_card_code(card.rank, card.suit) for card in cards),
+            dtype=np.uint8,
+            count=len(cards),
+        )
+        self.position = 0
+        self.composition = np.bincount(
+            self.codes // len(_SUITS),
+            minlength=len(playing_cards.Rank),
+        )
+        # Count every card in the shoe that is not in the new deck as seen
+        self.running_count = int(
+            self._initial_count
+            + self._tag_array[self._shoe].sum()
+            - self._tag_array[self.codes].sum()
+        )
+
+    @property
+    def value_counts(self) -> npt.NDArray[np.int64]:
+        """
+        The number of cards left of each value, from Aces (index 0) to
+        ten-valued cards (index 9).
+        """
+        tens = playing_cards.Rank.TEN - 1
+        return np.append(
+            self.composition[:tens],
+            self.composition[tens:].sum(),
+        )
+
+    @property
+    def _initial_count(self) -> int:
+        return self.counting_system.initial_count(len(self._shoe) // len(CARDS))
+
+    @property
+    def true_count(self) -> float:
+        """
+        The running count per deck left to deal.
+
+        An empty deck counts as having one card left, so that the true
+        count is always defined.
+        """
+        return self.running_count * len(CARDS) / max(len(self), 1)
+
+    @property
+    def cut_card(self) -> int:
+        """
+        The number of cards that can be dealt before the cut card is reached.
+        """
+        return int(self.penetration * len(self._shoe))
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """
+        Whether the cut card has been reached.
+        """
+        return len(self._shoe) - len(self) >= self.cut_card
+
+    def shuffle(self) -> None:
+        """
+        Shuffle the cards left in the deck using the deck's random number
+        generator.
+        """
+        self.rng.shuffle(self.codes[self.position :])
+
     def reset(self) -> None:
         """
         Reset the deck to have all cards in it, then shuffle it.
+
+        This clears the discard pile, and reuses the shared cards in
+        ``CARDS`` rather than making new ones.
         """
-        rank: playing_cards.Rank  # noqa: F842
-        suit: playing_cards.Suit  # noqa: F842
-        self.cards = [
-            Card(rank, suit)
-            for _, rank, suit in itertools.product(
-                range(self.number_of_decks),
-                playing_cards.Rank,
-                playing_cards.Suit,
+        self.codes = self.rng.permutation(self._shoe)
+        self.position = 0
+        self.composition = np.full(
+            len(playing_cards.Rank),
+            len(self._shoe) // len(playing_cards.Rank),
+        )
+        self.running_count = self._initial_count
+        self.discards = []
+
+    def load(self, codes: npt.NDArray[np.uint8]) -> None:
+        """
+        Reset the deck to a shoe that has already been shuffled, rather
+        than shuffling it again.
+
+        This clears the discard pile, like ``reset``.
+
+        :param codes: The codes of the cards in the shoe, in the order that
+            they will be dealt, which must be a full shoe. They are copied,
+            so they can be shared between decks.
+        """
+        if len(codes) != len(self._shoe):
+            raise ValueError(
+                f"A shoe of {len(codes)} cards cannot be loaded into a deck"
+                f" of {len(self._shoe)}"
+            )
+
+        self.codes = np.array(codes, dtype=np.uint8)
+        self.position = 0
+        self.composition = np.full(
+            len(playing_cards.Rank),
+            len(self._shoe) // len(playing_cards.Rank),
+        )
+        self.running_count = self._initial_count
+        self.discards = []
+
+    def snapshot(self) -> DeckState:
+        """
+        Take a snapshot of the deck.
+
+        :return: The state of the deck, which ``restore`` can restore.
+        """
+        return DeckState(
+            codes=self.codes.copy(),
+            position=self.position,
+            composition=self.composition.copy(),
+            discards=tuple(self.discards),
+            rng_state=self.rng.bit_generator.state,
+            running_count=self.running_count,
+        )
+
+    def restore(self, state: DeckState) -> None:
+        """
+        Restore the deck to a snapshot, so that it deals the same cards and
+        shuffles the same way as it did after the snapshot was taken.
+
+        :param state: The snapshot to restore, from a deck with the same
+            number of decks and the same kind of random number generator.
+        """
+        self.codes = state.codes.copy()
+        self.position = state.position
+        self.composition = state.composition.copy()
+        self.discards = list(state.discards)
+        self.rng.bit_generator.state = state.rng_state
+        self.running_count = state.running_count
+
+    def discard(self, cards: list[Card]) -> None:
+        """
+        Put cards that have been played onto the discard pile.
+        """
+        self.discards.extend(cards)
+
+    def take_card(self, key: str | None = None) -> Card:
+        """
+        Take a card from the deck.
+
+        If the deck runs out in the middle of a round, the discard pile is
+        shuffled and becomes the deck. If there is no discard pile either,
+        such as when every card was dealt in one round, the deck is reset.
+
+        :param key: The key of the card to take (for testing only).
+        """
+        if not len(self):
+            if self.discards:
+                self.cards, self.discards = self.discards, []
+                self.shuffle()
+            else:
+                self.reset()
+        if key is not None:
+            card = Card.from_id(key)
+            # Swap the card to the front of the deck so that it's dealt next
+            index = self.position + int(
+                np.flatnonzero(self.codes[self.position :] == card.code)[0]
             )
-        ]
+            self.codes[[self.position, index]] = self.codes[
+                [index, self.position]
+            ]
 
-        self.shuffle()
+        code = self.codes.item(self.position)
+        self.position += 1
+        self.composition[code // len(_SUITS)] -= 1
+        self.running_count += self._tags[code]
+        return CARDS[code]
+
+    def take_cards(self, number_of_cards: int) -> npt.NDArray[np.uint8]:
+        """
+        Take several cards from the deck at once.
+
+        Unlike ``take_card``, this does not turn the discard pile into the
+        deck if it runs out.
+
+        :param number_of_cards: The number of cards to take.
+
+        :return: The codes of the cards taken, as a view onto the deck
+            rather than a copy of it. Use ``CARDS`` to look up the cards.
+        """
+        if not 0 <= number_of_cards <= len(self):
+            raise ValueError(
+                f"Cannot take {number_of_cards} cards from a deck of {len(self)}"
+            )
+
+        codes = self.codes[self.position : self.position + number_of_cards]
+        self.position += number_of_cards
+        self.composition -= np.bincount(
+            codes // len(_SUITS),
+            minlength=len(playing_cards.Rank),
+        )
+        self.running_count += int(self._tag_array[codes].sum())
+        return codes
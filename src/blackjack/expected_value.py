@@ -0,0 +1,222 @@
+"""
+Exact expected values of the player's options.
+
+The expected value of each option is calculated by enumerating every card
+that could be drawn from the shoe's composition, with the dealer's final
+results from ``probabilities``, and with the payouts from
+``rules.get_hand_outcome`` and ``rules.apply_outcome``: a win pays the
+bet, a loss costs it, and a draw returns it. A Blackjack only differs
+from another 21 in that it draws with a dealer Blackjack.
+
+Expected values are per unit of the hand's bet. The calculations share
+caches keyed on the canonical state of the hand (its hard total and
+whether it has an Ace), the dealer's face-up card and the composition,
+since the order in which the cards were drawn does not matter.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+
+import numpy as np
+
+from blackjack import constants, participants, probabilities
+from blackjack import deck as deck_
+
+# The payout of each of the dealer's results (in the order of
+# ``probabilities``) against each player total up to 21. A player total
+# below the dealer's lowest total loses to every total the dealer stands on
+PAYOUTS = np.array(
+    [
+        [
+            *np.sign(total - np.array(probabilities.DEALER_TOTALS)),
+            -1,  # Dealer Blackjack
+            1,  # Dealer bust
+        ]
+        for total in range(constants.BLACKJACK + 1)
+    ]
+)
+
+
+def _total(hard: int, ace: bool) -> int:
+    if ace and hard + constants.ACE_BONUS <= constants.BLACKJACK:
+        return hard + constants.ACE_BONUS
+    return hard
+
+
+def _draws(
+    composition: tuple[int, ...],
+) -> list[tuple[int, float, tuple[int, ...]]]:
+    """
+    Each card value that could be drawn, with its probability and the
+    composition left after drawing it.
+    """
+    number_of_cards = sum(composition)
+    if number_of_cards == 0:
+        raise ValueError("The shoe ran out of cards for the player")
+
+    return [
+        (
+            value,
+            count / number_of_cards,
+            probabilities.without(composition, value),
+        )
+        for value, count in zip(
+            probabilities.CARD_VALUES, composition, strict=True
+        )
+        if count
+    ]
+
+
+@functools.lru_cache(maxsize=2**18)
+def _stand(
+    hard: int,
+    ace: bool,
+    blackjack: bool,
+    upcard: int,
+    composition: tuple[int, ...],
+) -> float:
+    if hard > constants.BLACKJACK:
+        return -1.0
+
+    results = probabilities.dealer_results(upcard, composition)
+    expected_value = float(results @ PAYOUTS[_total(hard, ace)])
+    if blackjack:
+        # A Blackjack draws with a dealer Blackjack rather than losing
+        expected_value += float(results[probabilities.BLACKJACK])
+    return expected_value
+
+
+@functools.lru_cache(maxsize=2**18)
+def _hit(
+    hard: int,
+    ace: bool,
+    upcard: int,
+    composition: tuple[int, ...],
+) -> float:
+    """
+    The expected value of hitting, then hitting or standing, whichever is
+    better, until the hand stands or is bust.
+    """
+    expected_value = 0.0
+    for value, probability, rest in _draws(composition):
+        new_hard, new_ace = hard + value, ace or value == 1
+        if new_hard > constants.BLACKJACK:
+            expected_value -= probability
+        else:
+            expected_value += probability * max(
+                _stand(new_hard, new_ace, False, upcard, rest),
+                _hit(new_hard, new_ace, upcard, rest),
+            )
+    return expected_value
+
+
+def _double_down(
+    hard: int,
+    ace: bool,
+    upcard: int,
+    composition: tuple[int, ...],
+) -> float:
+    return 2 * sum(
+        probability
+        * _stand(hard + value, ace or value == 1, False, upcard, rest)
+        for value, probability, rest in _draws(composition)
+    )
+
+
+@functools.lru_cache(maxsize=2**16)
+def _split(
+    value: int,
+    upcard: int,
+    composition: tuple[int, ...],
+) -> float:
+    """
+    The expected value of splitting a pair, for both hands together.
+
+    Each hand is played as well as it can be by hitting, standing or
+    doubling down, and is not split again. Like the rules, split Aces
+    get one card each. The hands are assumed to be independent: each is
+    dealt from the composition at the split, ignoring the cards that the
+    other hand draws.
+    """
+    expected_value = 0.0
+    for second, probability, rest in _draws(composition):
+        hard, ace = value + second, value == 1 or second == 1
+        blackjack = _total(hard, ace) == constants.BLACKJACK
+        if value == 1:
+            option_value = _stand(hard, ace, blackjack, upcard, rest)
+        else:
+            option_value = max(
+                _stand(hard, ace, blackjack, upcard, rest),
+                _hit(hard, ace, upcard, rest),
+                _double_down(hard, ace, upcard, rest),
+            )
+        expected_value += probability * option_value
+    return 2 * expected_value
+
+
+def expected_values(
+    hand: participants.Hand,
+    dealer_card: deck_.Card,
+    composition: Sequence[int],
+) -> dict[participants.PlayerOption, float]:
+    """
+    The exact expected value of each of the options for the hand.
+
+    Hitting and splitting are valued assuming that the rest of the hand
+    is played to maximise its expected value. Taking insurance is not
+    valued, since the rules do not pay it out yet.
+
+    :param hand: The hand being played.
+    :param dealer_card: The dealer's face-up card.
+    :param composition: The number of cards of each value, from Aces to
+        ten-valued cards, that could still be drawn: the shoe without the
+        hand's cards or the dealer's face-up card.
+
+    :return: The expected value of each option, per unit of the hand's
+        bet. Doubling down and splitting are only valued for the first
+        two cards, and splitting only for a pair.
+    """
+    composition = tuple(int(count) for count in composition)
+    if len(composition) != len(probabilities.CARD_VALUES):
+        raise ValueError(
+            f"The composition needs a count for each of the"
+            f" {len(probabilities.CARD_VALUES)} card values"
+        )
+
+    values = hand.values
+    upcard = dealer_card.values.hard
+    options = {
+        participants.PlayerOption.STAND: _stand(
+            values.hard,
+            values.ace,
+            hand.blackjack,
+            upcard,
+            composition,
+        ),
+    }
+    if values.bust:
+        return options
+
+    options[participants.PlayerOption.HIT] = _hit(
+        values.hard,
+        values.ace,
+        upcard,
+        composition,
+    )
+    if len(hand) == constants.DOUBLE_DOWN_CARD_COUNT:
+        options[participants.PlayerOption.DOUBLE_DOWN] = _double_down(
+            values.hard,
+            values.ace,
+            upcard,
+            composition,
+        )
+        if hand[0].rank == hand[1].rank:
+            options[participants.PlayerOption.SPLIT] = _split(
+                hand[0].values.hard,
+                upcard,
+                composition,
+            )
+
+    return options
@@ -6,8 +6,75 @@ This brings together the participants and the deck to play the game.
 
 from __future__ import annotations
 
+import numpy as np
+import numpy.typing as npt
+
+from blackjack import counting, participants, rules
 from blackjack import deck as deck_
-from blackjack import participants, rules
+
+
+class Reporter:
+    """
+    Receive updates as a round of Blackjack is played.
+
+    The base reporter ignores every update, which is what a game played
+    without a terminal wants.
+    """
+
+    def round_dealt(self, game: Game) -> None:
+        """
+        The bets have been placed and the cards have been dealt.
+        """
+
+    def player_turn(self, player: participants.Player) -> None:
+        """
+        The player is about to play their hands.
+        """
+
+    def dealer_played(self, dealer: participants.Dealer) -> None:
+        """
+        The dealer has played their hand.
+        """
+
+    def hand_settled(
+        self,
+        player: participants.Player,
+        hand: participants.PlayerHand,
+        outcome: participants.HandOutcome,
+    ) -> None:
+        """
+        The outcome of the player's hand has been applied to their money.
+        """
+
+
+class ConsoleReporter(Reporter):
+    """
+    Print updates to the terminal as a round of Blackjack is played.
+    """
+
+    def round_dealt(self, game: Game) -> None:
+        print(game.dealer, game.dealer.hand.show(masked=True), sep="\n")
+        print()
+        for player in game.players:
+            print(player.name_and_money, "\n")
+
+    def player_turn(self, player: participants.Player) -> None:
+        print(f"\n{player.name}'s turn:")
+
+    def dealer_played(self, dealer: participants.Dealer) -> None:
+        print()
+        print(dealer.name, dealer.hand.show())
+        print()
+
+    def hand_settled(
+        self,
+        player: participants.Player,
+        hand: participants.PlayerHand,
+        outcome: participants.HandOutcome,
+    ) -> None:
+        print()
+        print(player.name, hand.show())
+        print(f"Outcome: {outcome.formatted}")
 
 
 class Game:
@@ -35,32 +102,56 @@ class Game:
         self,
         number_of_players: int,
         number_of_decks: int,
+        rng: np.random.Generator | None = None,
+        penetration: float = 0.75,
+        counting_system: counting.CountingSystem = counting.NO_COUNT,
     ) -> None:
         """
         Set up a standard game of Blackjack.
 
         :param number_of_players: The number of players to add to the game.
         :param number_of_decks: The number of 52-card decks to use in the game.
+        :param rng: The random number generator to shuffle the deck with.
+        :param penetration: The fraction of the deck to deal before it is
+            reshuffled.
+        :param counting_system: The counting system for the deck to keep
+            the count of.
         """
-        self.add_deck(number_of_decks)
+        self.add_deck(number_of_decks, rng, penetration, counting_system)
         self.add_dealer()
         [
             self.add_player(f"Player_{i + 1}", 500)
             for i in range(number_of_players)
         ]
 
-    def add_deck(self, number_of_decks: int) -> deck_.Deck:
+    def add_deck(
+        self,
+        number_of_decks: int,
+        rng: np.random.Generator | None = None,
+        penetration: float = 0.75,
+        counting_system: counting.CountingSystem = counting.NO_COUNT,
+    ) -> deck_.Deck:
         """
         Add a stack of deck to the game.
 
         :param number_of_decks: The number of 52-card decks to add.
+        :param rng: The random number generator to shuffle the deck with.
+        :param penetration: The fraction of the deck to deal before it is
+            reshuffled.
+        :param counting_system: The counting system for the deck to keep
+            the count of.
 
         :return: The stack of decks for the game.
         """
         if hasattr(self, "deck"):
             raise AssertionError("A deck already exists in this game")
 
-        self.deck = deck_.Deck(number_of_decks)
+        self.deck = deck_.Deck(
+            number_of_decks,
+            rng,
+            penetration,
+            counting_system,
+        )
         return self.deck
 
     def add_dealer(self) -> participants.Dealer:
@@ -92,55 +183,72 @@ class Game:
 
         return new_player
 
-    def reset_round(self) -> None:
+    def reset_round(self, shoe: npt.NDArray[np.uint8] | None = None) -> None:
         """
         Reset the game for a new round.
+
+        The cards from the round go onto the discard pile, and the deck is
+        only reset once its cut card has been reached.
+
+        :param shoe: A shoe that has already been shuffled to deal the next
+            round from (see ``Deck.load``), rather than carrying on with
+            the current one.
         """
-        self.round = 0
-        self.deck.reset()
+        self.deck.discard(self.dealer.hand.cards)
+        for player in self.players:
+            for hand in player.hands:
+                self.deck.discard(hand.cards)
+
+        if shoe is not None:
+            self.deck.load(shoe)
+        elif self.deck.needs_shuffle:
+            self.deck.reset()
         self.dealer.hand.cards = []
         for player in self.players:
             player.hands = []
 
-    def play_round(self) -> None:
+    def play_round(
+        self,
+        strategy: rules.Strategy = rules.ask_player,
+        reporter: Reporter | None = None,
+    ) -> None:
         """
         Play a round of Blackjack.
 
         TODO: Improve the feedback loop.
+
+        :param strategy: The strategy that chooses the players' options.
+            Defaults to asking the players at the terminal.
+        :param reporter: The reporter to send updates on the round to.
+            Defaults to printing the updates to the terminal.
         """
+        reporter = reporter or ConsoleReporter()
         self.round += 1
 
         # Place bets, then deal
         [player.add_hand(self.min_bet) for player in self.players]
         [player.hands[0].deal(self.deck) for player in self.players]
         self.dealer.hand.deal(self.deck)
-
-        print(self.dealer, self.dealer.hand.show(masked=True), sep="\n")
-        print()
-        for player in self.players:
-            print(player.name_and_money, "\n")
+        reporter.round_dealt(self)
 
         for player in self.players:
-            print(f"\n{player.name}'s turn:")
+            reporter.player_turn(player)
             for hand in player.hands:
                 rules.play_hand__player(
                     hand,
                     self.dealer.hand,
                     player,
                     self.deck,
+                    strategy,
                 )
 
         rules.play_hand__dealer(self.dealer.hand, self.deck)
-        print()
-        print(self.dealer.name, self.dealer.hand.show())
-        print()
+        reporter.dealer_played(self.dealer)
         for player in self.players:
             for hand in player.hands:
                 outcome = rules.get_hand_outcome(hand, self.dealer.hand)
-                print()
-                print(player.name, hand.show())
-                print(f"Outcome: {outcome.formatted}")
                 rules.apply_outcome(player, outcome, hand.bet)
+                reporter.hand_settled(player, hand, outcome)
 
     def play_game(self) -> None:
         """
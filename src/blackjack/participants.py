@@ -59,14 +59,22 @@ class PlayerOption(enum.Enum):
 class Hand:
     """
     A hand, which holds cards.
+
+    The values of the hand are kept as a running total that is updated as
+    cards are added, so reading them (and whether the hand is bust or a
+    Blackjack) does not re-add every card.
     """
 
-    cards: list[deck_.Card]
+    __slots__ = ("_cards", "_values", "bet", "playing")
+
+    _cards: list[deck_.Card]
+    _values: deck_.Values
     bet: int | None
-    playing: bool = True
+    playing: bool
 
     def __init__(self, bet: int | None) -> None:
         self.bet = bet
+        self.playing = True
         self.cards = []
 
     def __str__(self) -> str:
@@ -78,18 +86,31 @@ class Hand:
     def __getitem__(self, position: int) -> deck_.Card:
         return self.cards[position]
 
+    @property
+    def cards(self) -> list[deck_.Card]:
+        """
+        The cards in the hand.
+
+        Replace the cards by assigning to this property rather than by
+        changing the list in place, so that the hand's values are kept up
+        to date.
+        """
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: list[deck_.Card]) -> None:
+        self._cards = cards
+        self._values = sum(
+            (card.values for card in cards),
+            start=deck_.Values(0),
+        )
+
     @property
     def values(self) -> deck_.Values:
         """
-        The set-value of the hand accounting for Aces.
+        The values of the hand accounting for Aces.
         """
-        if self.cards:
-            # `start` tells the typing system that the return value is `Values`
-            return sum(
-                (card.values for card in self.cards),
-                start=deck_.Values({0}),
-            )
-        return deck_.Values({0})
+        return self._values
 
     @property
     def blackjack(self) -> bool:
@@ -98,7 +119,7 @@ class Hand:
         """
         return (
             len(self) == constants.BLACKJACK_CARD_COUNT
-            and max(self.values.eligible_values) == constants.BLACKJACK
+            and self.values.total == constants.BLACKJACK
         )
 
     @property
@@ -106,7 +127,7 @@ class Hand:
         """
         Whether the hand is a bust.
         """
-        return min(self.values) > constants.BLACKJACK
+        return self.values.bust
 
     def hit(self, deck: deck_.Deck, _key: str | None = None) -> None:
         """
@@ -115,7 +136,7 @@ class Hand:
         :param deck: The deck to take the card from.
         :param _key: The key of the card to take (for testing only).
         """
-        self.cards.append(deck.take_card(_key))
+        self._add_card(deck.take_card(_key))
 
     def deal(self, deck: deck_.Deck, _keys: list[str] | None = None) -> None:
         """
@@ -132,6 +153,10 @@ class Hand:
         else:
             self.hit(deck), self.hit(deck)
 
+    def _add_card(self, card: deck_.Card) -> None:
+        self._cards.append(card)
+        self._values += card.values
+
     def show(self, masked: bool = False) -> str:
         """
         Show the cards in the hand.
@@ -144,7 +169,7 @@ class Hand:
             return f"[{self.cards[0].face} ??] [{self.cards[0].values}]"
 
         faces = " ".join(card.face for card in self.cards)
-        return f"[{faces}] {self.values.eligible_values}"
+        return f"[{faces}] {self.values}"
 
 
 class PlayerHand(Hand):
@@ -152,6 +177,8 @@ class PlayerHand(Hand):
     A player's hand in Blackjack.
     """
 
+    __slots__ = ("from_split", "insurance")
+
     from_split: bool
     insurance: int  # TODO: need to include insurance somewhere
 
@@ -165,7 +192,8 @@ class PlayerHand(Hand):
         Split the hand into two hands.
         """
         new_hand = player.add_hand(bet=self.bet, from_split=True)
-        new_hand.cards.append(self.cards.pop(1))
+        new_hand._add_card(self._cards.pop(1))
+        self._values = self._cards[0].values
         new_hand.from_split = True
         self.from_split = True
         self.hit(deck), new_hand.hit(deck)
@@ -181,6 +209,8 @@ class Dealer:
     The dealer in a game of Blackjack.
     """
 
+    __slots__ = ("hand", "name")
+
     name: str
     hand: Hand
 
@@ -197,6 +227,8 @@ class Player:
     A player in a game of Blackjack.
     """
 
+    __slots__ = ("hands", "money", "name")
+
     name: str
     hands: list[PlayerHand]
     money: float
@@ -0,0 +1,185 @@
+"""
+Exact probabilities of the dealer's final result.
+
+The dealer's play is fixed by ``rules.play_hand__dealer``: hit on 16 or
+less, stand on 17 or more (including a soft 17). This means that the
+probability of each final result can be calculated exactly from the
+dealer's face-up card and the cards left in the shoe, rather than
+estimated by simulating millions of dealer hands.
+
+Compositions are the number of cards left of each value, from Aces
+(index 0) to ten-valued cards (index 9), like ``Deck.value_counts``.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from blackjack import constants
+
+# The dealer's final results, in the order of the calculated probabilities
+DEALER_TOTALS = range(constants.DEALER_LOWER_LIMIT, constants.BLACKJACK + 1)
+BLACKJACK = len(DEALER_TOTALS)
+BUST = BLACKJACK + 1
+NUMBER_OF_RESULTS = BUST + 1
+
+# Card values, from Aces (1) to ten-valued cards (10)
+CARD_VALUES = range(1, 11)
+
+
+def full_composition(number_of_decks: int) -> tuple[int, ...]:
+    """
+    The composition of a full shoe.
+
+    :param number_of_decks: The number of 52-card decks in the shoe.
+
+    :return: The number of cards of each value in the shoe.
+    """
+    return (*(4 * number_of_decks for _ in range(9)), 16 * number_of_decks)
+
+
+def without(composition: tuple[int, ...], value: int) -> tuple[int, ...]:
+    """
+    The composition after taking a card of the value.
+
+    :param composition: The number of cards of each value.
+    :param value: The value of the card to take, with an Ace as 1.
+
+    :return: The composition without the card.
+    """
+    index = value - 1
+    return (
+        *composition[:index],
+        composition[index] - 1,
+        *composition[index + 1 :],
+    )
+
+
+def _total(hard: int, ace: bool) -> int:
+    if ace and hard + constants.ACE_BONUS <= constants.BLACKJACK:
+        return hard + constants.ACE_BONUS
+    return hard
+
+
+# Keyed by the dealer's hand (as its hard total and whether it has an Ace)
+# and the composition, which is all that the dealer's play depends on. The
+# cache is bounded so that long simulations over many compositions do not
+# grow it without limit
+@functools.lru_cache(maxsize=2**18)
+def _dealer_results(
+    hard: int,
+    ace: bool,
+    composition: tuple[int, ...],
+) -> npt.NDArray[np.float64]:
+    """
+    The probabilities of the final results of a dealer's hand that has to
+    hit, and is no longer a possible Blackjack.
+    """
+    number_of_cards = sum(composition)
+    if number_of_cards == 0:
+        raise ValueError("The shoe ran out of cards for the dealer")
+
+    # Draws that end the dealer's hand are added up directly, rather than
+    # recursing (and caching) one step further
+    results = np.zeros(NUMBER_OF_RESULTS)
+    for value, count in zip(CARD_VALUES, composition, strict=True):
+        if not count:
+            continue
+        probability = count / number_of_cards
+        new_hard, new_ace = hard + value, ace or value == 1
+        total = _total(new_hard, new_ace)
+        if new_hard > constants.BLACKJACK:
+            results[BUST] += probability
+        elif total >= constants.DEALER_LOWER_LIMIT:
+            results[total - DEALER_TOTALS.start] += probability
+        else:
+            results += probability * _dealer_results(
+                new_hard,
+                new_ace,
+                without(composition, value),
+            )
+
+    results.flags.writeable = False
+    return results
+
+
+def dealer_results(
+    upcard: int,
+    composition: Sequence[int],
+) -> npt.NDArray[np.float64]:
+    """
+    The exact probabilities of the dealer's final results.
+
+    A Blackjack is counted separately from other totals of 21, since it
+    beats a player's 21.
+
+    :param upcard: The value of the dealer's face-up card, with an Ace as
+        1 and face cards as 10.
+    :param composition: The number of cards left of each value in the
+        shoe, once the face-up card has been dealt.
+
+    :return: The probability of each of the dealer's final results: the
+        totals in ``DEALER_TOTALS``, then Blackjack, then bust. This array
+        is shared, so must not be changed.
+    """
+    composition = tuple(int(count) for count in composition)
+    number_of_cards = sum(composition)
+    if len(composition) != len(CARD_VALUES) or min(composition) < 0:
+        raise ValueError(
+            f"The composition needs a non-negative count for each of the"
+            f" {len(CARD_VALUES)} card values"
+        )
+    if number_of_cards == 0:
+        raise ValueError("The shoe ran out of cards for the dealer")
+
+    # The hole card is dealt separately since it's the only card that can
+    # make a Blackjack
+    results = np.zeros(NUMBER_OF_RESULTS)
+    for value, count in zip(CARD_VALUES, composition, strict=True):
+        if not count:
+            continue
+        probability = count / number_of_cards
+        hard, ace = upcard + value, upcard == 1 or value == 1
+        total = _total(hard, ace)
+        if total == constants.BLACKJACK:
+            results[BLACKJACK] += probability
+        elif total >= constants.DEALER_LOWER_LIMIT:
+            results[total - DEALER_TOTALS.start] += probability
+        else:
+            results += probability * _dealer_results(
+                hard,
+                ace,
+                without(composition, value),
+            )
+
+    results.flags.writeable = False
+    return results
+
+
+def dealer_results__by_upcard(
+    composition: Sequence[int],
+) -> npt.NDArray[np.float64]:
+    """
+    The exact probabilities of the dealer's final results for each
+    face-up card.
+
+    :param composition: The number of cards left of each value in the
+        shoe, before the face-up card is dealt.
+
+    :return: The probabilities of the dealer's final results (as in
+        ``dealer_results``), with a row for each face-up card from Ace to
+        ten. The row is all zero for a face-up card that is not in the shoe.
+    """
+    composition = tuple(int(count) for count in composition)
+    return np.array(
+        [
+            dealer_results(upcard, without(composition, upcard))
+            if composition[upcard - 1]
+            else np.zeros(NUMBER_OF_RESULTS)
+            for upcard in CARD_VALUES
+        ]
+    )
@@ -4,11 +4,24 @@ Blackjack-specific rules and logic.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import assert_never
 
 from blackjack import constants, participants
 from blackjack import deck as deck_
 
+# A strategy is called with the hand being played, the dealer's face-up
+# card, the options available for the hand, and the deck being played from
+Strategy = Callable[
+    [
+        participants.PlayerHand,
+        deck_.Card,
+        list[participants.PlayerOption],
+        deck_.Deck,
+    ],
+    participants.PlayerOption,
+]
+
 
 def play_hand__dealer(
     dealer_hand: participants.Hand,
@@ -19,43 +32,70 @@ def play_hand__dealer(
 
     The dealer must hit on 16 or less and stand on 17 or more.
     """
-    while max(dealer_hand.values) < constants.DEALER_LOWER_LIMIT:
+    while dealer_hand.values.total < constants.DEALER_LOWER_LIMIT:
         dealer_hand.hit(deck)
 
     dealer_hand.playing = False
 
 
+def ask_player(
+    player_hand: participants.PlayerHand,
+    dealer_card: deck_.Card,
+    options: list[participants.PlayerOption],
+    deck: deck_.Deck,
+) -> participants.PlayerOption:
+    """
+    Ask the player at the terminal which option to take.
+    """
+    print(f"\nPlaying hand {player_hand.show()!s}")
+
+    player_options = ", ".join(option.readable for option in options) + "?"
+    allowed_options = [option.value for option in options]
+
+    decision_key = ""
+    while decision_key not in allowed_options:
+        decision_key = input(f"{player_options} ")
+
+    decision = participants.PlayerOption(decision_key)
+    print(f"Player chose {decision.name}")
+    return decision
+
+
 def play_hand__player(
     player_hand: participants.PlayerHand,
     dealer_hand: participants.Hand,
     player: participants.Player,
     deck: deck_.Deck,
+    strategy: Strategy = ask_player,
 ) -> None:
     """
     Play the player's hand.
+
+    :param player_hand: The hand the player is playing.
+    :param dealer_hand: The dealer's hand.
+    :param player: The player playing the hand.
+    :param deck: The deck to draw from.
+    :param strategy: The strategy that chooses the player's options.
+        Defaults to asking the player at the terminal.
     """
+    dealer_card = dealer_hand[0]
+    dealer_has_ace = dealer_card.rank == 1
 
     while player_hand.playing:
-        print(f"\nPlaying hand {player_hand.show()!s}")
-
         options = get_options_for_player_hand(
             player,
             player_hand,
-            dealer_hand[0].rank == 1,
+            dealer_has_ace,
         )
         if not options:
             player_hand.playing = False
             break
 
-        player_options = ", ".join(option.readable for option in options) + "?"
-        allowed_options = [option.value for option in options]
-
-        decision_key = ""
-        while decision_key not in allowed_options:
-            decision_key = input(f"{player_options} ")
-
-        decision = participants.PlayerOption(decision_key)
-        print(f"Player chose {decision.name}")
+        decision = strategy(player_hand, dealer_card, options, deck)
+        if decision not in options:
+            raise ValueError(
+                f"The strategy chose {decision.name}, which is not one of the available options"
+            )
         action(player_hand, decision, player, deck)
 
 
@@ -82,6 +122,7 @@ def action(
         case participants.PlayerOption.STAND:
             player_hand.playing = False
         case participants.PlayerOption.DOUBLE_DOWN:
+            player_hand.bet *= 2
             player_hand.hit(deck)
             player_hand.playing = False
         case participants.PlayerOption.SPLIT:
@@ -156,9 +197,6 @@ def get_hand_outcome(  # noqa: PLR0911
     """
     Evaluate the hand and update the outcome.
     """
-    hand_value = max(hand.values.eligible_values, default=99)
-    dealer_value = max(dealer_hand.values.eligible_values, default=99)
-
     if hand.bust:
         return participants.HandOutcome.LOSE
 
@@ -171,6 +209,9 @@ def get_hand_outcome(  # noqa: PLR0911
             return participants.HandOutcome.DRAW
         return participants.HandOutcome.LOSE
 
+    hand_value = hand.values.total
+    dealer_value = dealer_hand.values.total
+
     if hand_value > dealer_value:
         return participants.HandOutcome.WIN
 
@@ -0,0 +1,226 @@
+"""
+Search for strategies by evolving them.
+
+Published basic strategies only cover the usual tables, so for any other
+table a strategy is searched for instead: a population of strategies is
+mutated (see ``Strategy.mutate``), each new strategy is scored by
+simulating it, and the best of each generation are kept as the parents of
+the next.
+
+Simulating dominates the cost of the search, so the strategies are
+simulated in parallel, as arrays (see ``batch.simulate``), looking up
+their compiled tables rather than asking for each decision. Each score is
+cached by the strategy's fingerprint, so a strategy that has been scored
+before, such as a mutation that redrew its cells the same as they were,
+is never simulated again. Every strategy is simulated with the same
+seed, so their scores are comparable and the cache always holds the score
+that simulating again would give.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+from collections.abc import Callable
+
+import numpy as np
+
+from blackjack import batch, sim
+from blackjack import strategy as strategy_
+
+
+@dataclasses.dataclass
+class Candidate:
+    """
+    A strategy and its score: the average amount that it wins per hand,
+    per minimum bet.
+    """
+
+    strategy: strategy_.Strategy
+    fitness: float
+
+
+@dataclasses.dataclass
+class SearchResult:
+    """
+    The result of a search.
+
+    ``history`` has the fitness of the best strategy after each
+    generation, starting with the starting strategy's.
+    """
+
+    best: Candidate
+    history: list[float]
+    seed: int
+    # The number of strategies simulated, and the number of times a score
+    # was found in the cache instead
+    evaluations: int = 0
+    cache_hits: int = 0
+
+
+def _fitness(
+    strategy: strategy_.Strategy,
+    number_of_rounds: int,
+    table: sim.Table,
+    seed: int,
+) -> float:
+    """
+    Score a strategy by simulating it.
+    """
+    result = batch.simulate(
+        strategy,
+        number_of_rounds,
+        table,
+        np.random.default_rng(seed),
+    )
+    return result.return_per_hand / table.min_bet
+
+
+class _Evaluator:
+    """
+    Score strategies in a process pool, caching the scores by the
+    strategies' fingerprints.
+    """
+
+    executor: concurrent.futures.Executor
+    number_of_rounds: int
+    table: sim.Table
+    seed: int
+    cache: dict[str, float]
+    evaluations: int
+    cache_hits: int
+
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor,
+        number_of_rounds: int,
+        table: sim.Table,
+        seed: int,
+    ) -> None:
+        self.executor = executor
+        self.number_of_rounds = number_of_rounds
+        self.table = table
+        self.seed = seed
+        self.cache = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+
+    def score(self, strategies: list[strategy_.Strategy]) -> list[Candidate]:
+        """
+        Score the strategies, simulating each strategy that is not in the
+        cache once, however many times it appears.
+        """
+        fingerprints = [strategy.fingerprint() for strategy in strategies]
+        pending = {}
+        for fingerprint, strategy in zip(fingerprints, strategies, strict=True):
+            if fingerprint not in self.cache and fingerprint not in pending:
+                pending[fingerprint] = self.executor.submit(
+                    _fitness,
+                    strategy,
+                    self.number_of_rounds,
+                    self.table,
+                    self.seed,
+                )
+        for fingerprint, future in pending.items():
+            self.cache[fingerprint] = future.result()
+
+        self.evaluations += len(pending)
+        self.cache_hits += len(strategies) - len(pending)
+        return [
+            Candidate(strategy, self.cache[fingerprint])
+            for strategy, fingerprint in zip(
+                strategies, fingerprints, strict=True
+            )
+        ]
+
+
+def evolve(  # noqa: PLR0913
+    start: strategy_.Strategy,
+    generations: int,
+    table: sim.Table = sim.STANDARD_TABLE,
+    *,
+    population: int = 16,
+    survivors: int = 4,
+    mutation_rate: float = 0.02,
+    number_of_rounds: int = 100_000,
+    seed: int | None = None,
+    workers: int | None = None,
+    progress: Callable[[int, Candidate], None] | None = None,
+) -> SearchResult:
+    """
+    Search for a better strategy by evolving a starting strategy.
+
+    Each generation keeps the ``survivors`` best strategies so far, and
+    fills the rest of the population with mutations of them.
+
+    :param start: The strategy to start from, such as
+        ``strategy.BASIC_STRATEGY`` or ``solver.solve``.
+    :param generations: The number of generations to evolve.
+    :param table: The set-up of the table to search for a strategy at.
+    :param population: The number of strategies in each generation.
+    :param survivors: The number of the best strategies to keep from each
+        generation.
+    :param mutation_rate: The probability that each cell of a mutated
+        strategy is redrawn.
+    :param number_of_rounds: The number of rounds to simulate to score each
+        strategy. More rounds tell apart smaller differences.
+    :param seed: The master seed for the search. Defaults to a random
+        seed, which is recorded on the result so that the search can be
+        reproduced.
+    :param workers: The number of processes to simulate with. Defaults to
+        the number of CPUs on the machine.
+    :param progress: Called with the generation number and the best
+        strategy so far after each generation.
+
+    :return: The best strategy found, with the search's history.
+    """
+    if generations < 0 or number_of_rounds < 1:
+        raise ValueError(
+            "The number of generations cannot be negative, and there must be"
+            " at least one round to score a strategy"
+        )
+    if not 0 < survivors < population:
+        raise ValueError(
+            "There must be at least one survivor, and fewer survivors than"
+            " the population"
+        )
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+
+    rng = np.random.default_rng(seed)
+    simulation_seed = int(rng.integers(2**63))
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        evaluator = _Evaluator(
+            executor, number_of_rounds, table, simulation_seed
+        )
+        parents = evaluator.score([start])
+        history = [parents[0].fitness]
+        for generation in range(1, generations + 1):
+            children = [
+                parents[i].strategy.mutate(rng, mutation_rate)
+                for i in rng.integers(
+                    len(parents), size=population - len(parents)
+                )
+            ]
+            # Keep one of each strategy, so that copies of a strategy do
+            # not crowd out the other survivors
+            candidates = {
+                candidate.strategy.fingerprint(): candidate
+                for candidate in parents + evaluator.score(children)
+            }
+            parents = sorted(
+                candidates.values(),
+                key=lambda candidate: -candidate.fitness,
+            )[:survivors]
+
+            history.append(parents[0].fitness)
+            if progress:
+                progress(generation, parents[0])
+
+    return SearchResult(
+        best=parents[0],
+        history=history,
+        seed=seed,
+        evaluations=evaluator.evaluations,
+        cache_hits=evaluator.cache_hits,
+    )
@@ -0,0 +1,586 @@
+"""
+Simulate rounds of Blackjack without any user interaction.
+
+The simulation plays rounds through the same ``Game.play_round`` as the
+interactive game, but the player's decisions are made by a strategy
+rather than by prompting for input, and nothing is printed.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import copy
+import dataclasses
+import itertools
+import math
+import os
+import pathlib
+import pickle
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+from blackjack import constants, counting, participants, rules, stats
+from blackjack import deck as deck_
+from blackjack import game as game_
+
+
+def mimic_the_dealer(
+    hand: participants.PlayerHand,
+    dealer_card: deck_.Card,
+    options: list[participants.PlayerOption],
+    deck: deck_.Deck,
+) -> participants.PlayerOption:
+    """
+    Hit on 16 or less and stand on 17 or more, like the dealer does.
+    """
+    if hand.values.total < constants.DEALER_LOWER_LIMIT:
+        return participants.PlayerOption.HIT
+    return participants.PlayerOption.STAND
+
+
+@dataclasses.dataclass(frozen=True)
+class Table:
+    """
+    The set-up of the table that a simulation is played at.
+    """
+
+    number_of_players: int = 1
+    number_of_decks: int = 6
+    min_bet: int = 10
+    penetration: float = 0.75
+    counting_system: counting.CountingSystem = counting.NO_COUNT
+
+    def new_game(self, rng: np.random.Generator | None = None) -> game_.Game:
+        """
+        Set up a new game at this table.
+
+        :param rng: The random number generator to shuffle the deck with.
+
+        :return: The game, ready to play.
+        """
+        game = game_.Game(min_bet=self.min_bet)
+        game.standard_setup(
+            self.number_of_players,
+            self.number_of_decks,
+            rng,
+            self.penetration,
+            self.counting_system,
+        )
+        return game
+
+    def new_result(self) -> SimulationResult:
+        """
+        Start the result of a simulation at this table.
+
+        :return: An empty result, which keeps the statistics of each true
+            count if the table's deck is counted.
+        """
+        if self.counting_system == counting.NO_COUNT:
+            return SimulationResult()
+        return SimulationResult(by_count=stats.CountStatistics())
+
+
+STANDARD_TABLE = Table()
+SHARD_SIZE = 100_000
+PROGRESS_INTERVAL = 10_000
+STOP_INTERVAL = 100
+CHECKPOINT_INTERVAL = 10_000
+# The fewest hands to play before a simulation can stop early, so that the
+# variance is estimated well enough to trust its confidence interval
+MIN_HANDS_TO_STOP = 1_000
+
+# The amount won on a hand for each outcome, per unit of the bet
+_NET_PER_BET = {
+    participants.HandOutcome.WIN: 1,
+    participants.HandOutcome.LOSE: -1,
+    participants.HandOutcome.DRAW: 0,
+}
+
+
+@dataclasses.dataclass
+class SimulationResult:
+    """
+    The aggregated result of a simulation.
+
+    The statistics of the amount won on each hand are kept as the hands
+    are played, so a result takes the same memory however long the
+    simulation runs. At a counted table, ``by_count`` also keeps the
+    statistics of the amount won on each hand per minimum bet, keyed by
+    the true count when the bet was placed.
+    """
+
+    rounds: int = 0
+    hands: int = 0
+    staked: float = 0
+    net: float = 0
+    seed: int | None = None
+    outcomes: collections.Counter[participants.HandOutcome] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    per_hand: stats.Statistics = dataclasses.field(
+        default_factory=stats.Statistics
+    )
+    by_count: stats.CountStatistics | None = None
+
+    @property
+    def return_per_hand(self) -> float:
+        """
+        The average amount won (or lost, if negative) per hand played.
+        """
+        return self.net / self.hands if self.hands else 0.0
+
+    def merge(self, other: SimulationResult) -> None:
+        """
+        Add the result of another simulation to this one.
+        """
+        self.rounds += other.rounds
+        self.hands += other.hands
+        self.staked += other.staked
+        self.net += other.net
+        self.outcomes.update(other.outcomes)
+        self.per_hand.merge(other.per_hand)
+        if other.by_count is not None:
+            if self.by_count is None:
+                self.by_count = stats.CountStatistics(
+                    other.by_count.lowest_true_count,
+                    other.by_count.highest_true_count,
+                )
+            self.by_count.merge(other.by_count)
+
+
+class _ResultRecorder(game_.Reporter):
+    """
+    Record the outcome of every hand in a simulation result.
+
+    The true count is the one when the bets were placed, before the cards
+    were dealt.
+    """
+
+    result: SimulationResult
+    true_count: float
+    min_bet: int
+
+    def __init__(
+        self,
+        result: SimulationResult,
+        true_count: float,
+        min_bet: int,
+    ) -> None:
+        self.result = result
+        self.true_count = true_count
+        self.min_bet = min_bet
+
+    def hand_settled(
+        self,
+        player: participants.Player,
+        hand: participants.PlayerHand,
+        outcome: participants.HandOutcome,
+    ) -> None:
+        self.result.hands += 1
+        self.result.staked += hand.bet
+        self.result.outcomes[outcome] += 1
+        net = _NET_PER_BET[outcome] * hand.bet
+        self.result.per_hand.add(net)
+        if self.result.by_count is not None:
+            self.result.by_count.add(self.true_count, net / self.min_bet)
+
+
+def play_round(
+    game: game_.Game,
+    strategy: rules.Strategy,
+    result: SimulationResult,
+) -> None:
+    """
+    Play a round of Blackjack without any output, recording the outcomes
+    in the result.
+    """
+    money = sum(player.money for player in game.players)
+    recorder = _ResultRecorder(result, game.deck.true_count, game.min_bet)
+    game.play_round(strategy, recorder)
+
+    result.rounds += 1
+    result.net += sum(player.money for player in game.players) - money
+
+
+def precise_to(
+    half_width: float,
+    confidence: float = 0.95,
+) -> Callable[[SimulationResult], bool]:
+    """
+    Stop a simulation once its return per hand is known precisely enough.
+
+    The rule only looks at the width of the confidence interval, not at
+    where it lies, so checking it as the simulation runs does not bias the
+    estimate the way stopping on a significant result would.
+
+    :param half_width: The largest half-width of the confidence interval
+        for the return per hand to stop at.
+    :param confidence: The confidence of the interval, between 0 and 1.
+
+    :return: A stopping rule for ``simulate``, which is true once at least
+        ``MIN_HANDS_TO_STOP`` hands have been played and the confidence
+        interval is narrow enough.
+    """
+    if half_width <= 0:
+        raise ValueError("The half-width must be positive")
+    # Check the confidence now rather than part way through a simulation
+    stats.Statistics().half_width(confidence)
+
+    def stop(result: SimulationResult) -> bool:
+        return (
+            result.hands >= MIN_HANDS_TO_STOP
+            and result.per_hand.half_width(confidence) <= half_width
+        )
+
+    return stop
+
+
+def simulate(  # noqa: PLR0913
+    strategy: rules.Strategy,
+    number_of_rounds: int,
+    table: Table = STANDARD_TABLE,
+    rng: np.random.Generator | None = None,
+    *,
+    progress: Callable[[SimulationResult], None] | None = None,
+    stop: Callable[[SimulationResult], bool] | None = None,
+) -> SimulationResult:
+    """
+    Simulate a number of rounds of Blackjack.
+
+    Each player's money is topped back up at the start of every round so
+    that the options available to them do not drift as the simulation
+    runs.
+
+    :param strategy: The strategy that the players use.
+    :param number_of_rounds: The number of rounds to play.
+    :param table: The set-up of the table to play at.
+    :param rng: The random number generator to shuffle the deck with.
+    :param progress: Called with the result so far after every
+        ``PROGRESS_INTERVAL`` rounds, for reporting on long simulations.
+    :param stop: Called with the result so far after every
+        ``STOP_INTERVAL`` rounds, to stop the simulation early once it
+        returns true, such as ``precise_to``. The number of rounds is then
+        the most that are played.
+
+    :return: The aggregated result of all the rounds played.
+    """
+    game = table.new_game(rng)
+    bankrolls = {player.name: player.money for player in game.players}
+
+    result = table.new_result()
+    for _ in range(number_of_rounds):
+        for player in game.players:
+            player.money = bankrolls[player.name]
+        play_round(game, strategy, result)
+        game.reset_round()
+        if progress and result.rounds % PROGRESS_INTERVAL == 0:
+            progress(result)
+        if stop and result.rounds % STOP_INTERVAL == 0 and stop(result):
+            break
+
+    return result
+
+
+@dataclasses.dataclass
+class Comparison:
+    """
+    The results of strategies played against the same cards.
+
+    ``results[i]`` is the result of the ``i``-th strategy, and
+    ``differences[i]`` has the statistics of the amount that it won each
+    round minus the amount that the first strategy won, so
+    ``differences[0]`` is all zero.
+    """
+
+    results: list[SimulationResult]
+    differences: list[stats.Statistics]
+
+
+def compare(
+    strategies: Sequence[rules.Strategy],
+    number_of_rounds: int,
+    table: Table = STANDARD_TABLE,
+    rng: np.random.Generator | None = None,
+) -> Comparison:
+    """
+    Simulate strategies against the same cards, with common random numbers.
+
+    Every round is played once by each strategy, each at its own game,
+    from the same snapshot of the shoe: the strategies are dealt the same
+    cards until their decisions differ. The shoe then carries on from
+    where the first strategy left it. Since the luck of the cards is
+    shared, the difference between the strategies' returns varies far
+    less than it does between independent simulations, so it can be
+    resolved in far fewer rounds.
+
+    :param strategies: The strategies to compare, with the first as the
+        baseline that the others are compared to.
+    :param number_of_rounds: The number of rounds for each strategy to play.
+    :param table: The set-up of the table to play at.
+    :param rng: The random number generator to shuffle the deck with.
+
+    :return: The result of each strategy, and the statistics of how much
+        more each won per round than the first strategy.
+    """
+    if not strategies:
+        raise ValueError("There must be at least one strategy to compare")
+
+    # The other games' generators are restored from the first game's, so
+    # they need to be the same kind of generator
+    games = [table.new_game(rng)]
+    games += [
+        table.new_game(copy.deepcopy(games[0].deck.rng)) for _ in strategies[1:]
+    ]
+    bankrolls = {player.name: player.money for player in games[0].players}
+
+    comparison = Comparison(
+        results=[table.new_result() for _ in strategies],
+        differences=[stats.Statistics() for _ in strategies],
+    )
+    nets = [0.0] * len(strategies)
+    for _ in range(number_of_rounds):
+        state = games[0].deck.snapshot()
+        for i, (game, strategy, result) in enumerate(
+            zip(games, strategies, comparison.results, strict=True)
+        ):
+            if i:
+                game.deck.restore(state)
+            for player in game.players:
+                player.money = bankrolls[player.name]
+            net = result.net
+            play_round(game, strategy, result)
+            game.reset_round()
+            nets[i] = result.net - net
+
+        for net, difference in zip(nets, comparison.differences, strict=True):
+            difference.add(net - nets[0])
+
+    return comparison
+
+
+@dataclasses.dataclass
+class Checkpoint:
+    """
+    The state of a simulation between rounds, which it can be resumed from.
+
+    ``strategy`` identifies the strategy that the simulation plays (see
+    ``_identify``), so that it is only resumed with the same strategy.
+    """
+
+    number_of_rounds: int
+    strategy: str
+    table: Table
+    round: int
+    deck: deck_.DeckState
+    result: SimulationResult
+
+
+def _identify(strategy: rules.Strategy) -> str:
+    """
+    Identify a strategy: a compiled strategy by its fingerprint, and any
+    other strategy by its qualified name.
+    """
+    fingerprint = getattr(strategy, "fingerprint", None)
+    if fingerprint is not None:
+        return fingerprint()
+    name = getattr(strategy, "__qualname__", type(strategy).__qualname__)
+    return f"{strategy.__module__}.{name}"
+
+
+def _write_checkpoint(checkpoint: Checkpoint, path: pathlib.Path) -> None:
+    """
+    Write the checkpoint to the path.
+
+    The checkpoint is written to a temporary file first and then moved
+    into place, so that a simulation stopped part way through writing it
+    still has the previous checkpoint to resume from.
+    """
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with temporary.open("wb") as file:
+        pickle.dump(checkpoint, file, protocol=pickle.HIGHEST_PROTOCOL)
+    temporary.replace(path)
+
+
+def simulate__resumable(
+    strategy: rules.Strategy,
+    number_of_rounds: int,
+    path: str | os.PathLike[str],
+    table: Table = STANDARD_TABLE,
+    rng: np.random.Generator | None = None,
+) -> SimulationResult:
+    """
+    Simulate a number of rounds of Blackjack, saving checkpoints to resume
+    from if the simulation is stopped.
+
+    A checkpoint is written to the path every ``CHECKPOINT_INTERVAL``
+    rounds and when the simulation finishes. If the path already has a
+    checkpoint, the simulation resumes from it and plays exactly the
+    rounds that it would have played had it not stopped. A checkpoint is
+    only resumed with the number of rounds, strategy and table that it was
+    written with. Checkpoints are pickled, so only resume from checkpoints
+    that you wrote.
+
+    :param strategy: The strategy that the players use.
+    :param number_of_rounds: The number of rounds to play.
+    :param path: The path of the checkpoint file.
+    :param table: The set-up of the table to play at.
+    :param rng: The random number generator to shuffle the deck with. When
+        resuming, its state is replaced by the checkpoint's, so it must be
+        the same kind of generator as the one the simulation started with.
+
+    :return: The aggregated result of all the rounds played, including
+        the rounds played before resuming.
+    """
+    if number_of_rounds < 0:
+        raise ValueError("The number of rounds cannot be negative")
+
+    path = pathlib.Path(path)
+    game = table.new_game(rng)
+    bankrolls = {player.name: player.money for player in game.players}
+    if path.exists():
+        with path.open("rb") as file:
+            checkpoint = pickle.load(file)  # noqa: S301
+        if checkpoint.number_of_rounds != number_of_rounds:
+            raise ValueError(
+                f"The checkpoint at {path} is for a simulation of"
+                f" {checkpoint.number_of_rounds} rounds"
+            )
+        if checkpoint.strategy != _identify(strategy):
+            raise ValueError(
+                f"The checkpoint at {path} is for a different strategy"
+            )
+        if checkpoint.table != table:
+            raise ValueError(
+                f"The checkpoint at {path} is for a different table:"
+                f" {checkpoint.table}"
+            )
+        game.deck.restore(checkpoint.deck)
+        game.round = checkpoint.round
+        result = checkpoint.result
+    else:
+        result = table.new_result()
+
+    while result.rounds < number_of_rounds:
+        for player in game.players:
+            player.money = bankrolls[player.name]
+        play_round(game, strategy, result)
+        game.reset_round()
+        if (
+            result.rounds % CHECKPOINT_INTERVAL == 0
+            or result.rounds == number_of_rounds
+        ):
+            _write_checkpoint(
+                Checkpoint(
+                    number_of_rounds=number_of_rounds,
+                    strategy=_identify(strategy),
+                    table=table,
+                    round=game.round,
+                    deck=game.deck.snapshot(),
+                    result=result,
+                ),
+                path,
+            )
+
+    return result
+
+
+def _simulate_shard(
+    strategy: rules.Strategy,
+    number_of_rounds: int,
+    table: Table,
+    seed: int,
+    shard: int,
+) -> SimulationResult:
+    """
+    Simulate one shard of a parallel simulation.
+
+    Each shard gets its own random number generator, derived from the
+    master seed and the shard's position, so that a shard plays the same
+    rounds whichever worker it runs on.
+    """
+    rng = np.random.default_rng(
+        np.random.SeedSequence(seed, spawn_key=(shard,))
+    )
+    return simulate(strategy, number_of_rounds, table, rng)
+
+
+def simulate__parallel(  # noqa: PLR0913
+    strategy: rules.Strategy,
+    number_of_rounds: int,
+    table: Table = STANDARD_TABLE,
+    *,
+    seed: int | None = None,
+    workers: int | None = None,
+    progress: Callable[[SimulationResult], None] | None = None,
+    stop: Callable[[SimulationResult], bool] | None = None,
+) -> SimulationResult:
+    """
+    Simulate a number of rounds of Blackjack across multiple processes.
+
+    The rounds are split into shards of ``SHARD_SIZE`` rounds, independent
+    of the number of workers, and the shards' results are merged in order. This
+    means that the same seed gives the same result however many workers
+    are used.
+
+    :param strategy: The strategy that the players use. This must be
+        picklable, such as a function defined at the top level of a module.
+    :param number_of_rounds: The number of rounds to play.
+    :param table: The set-up of the table to play at.
+    :param seed: The master seed for the simulation. Defaults to a random
+        seed, which is recorded on the result so that the run can be
+        reproduced.
+    :param workers: The number of processes to use. Defaults to the
+        number of CPUs on the machine.
+    :param progress: Called with the result so far as each shard is
+        merged, for reporting on long simulations.
+    :param stop: Called with the result so far as each shard is merged,
+        to stop the simulation early once it returns true, such as
+        ``precise_to``. Only a shard for each worker is run at a time, and
+        the shards that have not been merged yet are cancelled, so the
+        simulation stops within a shard per worker and the result is still
+        the same for any number of workers.
+
+    :return: The aggregated result of all the rounds played.
+    """
+    if number_of_rounds < 0:
+        raise ValueError("The number of rounds cannot be negative")
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+
+    number_of_shards = math.ceil(number_of_rounds / SHARD_SIZE)
+    shard_rounds = [
+        min(SHARD_SIZE, number_of_rounds - shard * SHARD_SIZE)
+        for shard in range(number_of_shards)
+    ]
+
+    # Only as many shards as there are workers are submitted at a time, so
+    # that stopping early does not wait for a queue of shards to finish
+    workers = workers or os.cpu_count() or 1
+    shards = iter(range(number_of_shards))
+    result = SimulationResult(seed=seed)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        pending = collections.deque()
+        while True:
+            for shard in itertools.islice(shards, workers - len(pending)):
+                pending.append(
+                    executor.submit(
+                        _simulate_shard,
+                        strategy,
+                        shard_rounds[shard],
+                        table,
+                        seed,
+                        shard,
+                    )
+                )
+            if not pending:
+                break
+            result.merge(pending.popleft().result())
+            if progress:
+                progress(result)
+            if stop and stop(result):
+                executor.shutdown(cancel_futures=True)
+                break
+
+    return result
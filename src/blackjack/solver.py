@@ -0,0 +1,269 @@
+"""
+Derive basic strategy by dynamic programming.
+
+Basic strategy plays each hand by its total (or its pair) and the dealer's
+face-up card alone. Its expected values can be solved backwards from 21:
+the value of hitting a total only depends on the values of higher totals,
+so each total is solved once, for every dealer card at the same time.
+
+Each cell is solved for the shoe without the player's first two cards and
+the dealer's face-up card: the dealer's results are exact for that shoe,
+and each card that the player draws is drawn from it. A total's cell is
+the average over the two-card hands that make the total, weighted by how
+likely each hand is to be dealt. This is the usual basis of basic
+strategy, which does not change as the shoe is dealt.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from blackjack import (
+    constants,
+    expected_value,
+    participants,
+    probabilities,
+    strategy,
+)
+
+# The highest total that a hand can reach: a hard 21 that draws a ten
+_MAX_TOTAL = constants.BLACKJACK + 10
+# The highest hard total that a drawn Ace can count as 11 on
+_SOFT_LIMIT = constants.BLACKJACK - constants.ACE_BONUS - 1
+
+
+class _Solution:
+    """
+    The expected values of basic strategy for a shoe, with a column for
+    each dealer card in ``strategy.DEALER_CARDS`` order.
+
+    ``draws`` has the probability of drawing each card value (the rows)
+    once each dealer card (the columns) has been taken out of the shoe.
+    """
+
+    draws: npt.NDArray[np.float64]
+    stand: npt.NDArray[np.float64]
+    blackjack: npt.NDArray[np.float64]
+    hard_hit: npt.NDArray[np.float64]
+    soft_hit: npt.NDArray[np.float64]
+    hard_best: npt.NDArray[np.float64]
+    soft_best: npt.NDArray[np.float64]
+
+    def __init__(self, composition: Sequence[int]) -> None:
+        upcards = [card - 1 for card in strategy.DEALER_CARDS]
+        counts = np.array(composition, dtype=np.float64)[:, np.newaxis]
+        counts = counts - np.eye(len(probabilities.CARD_VALUES))[:, upcards]
+        self.draws = counts / counts.sum(axis=0)
+
+        results = probabilities.dealer_results__by_upcard(composition)
+        results = results[upcards]
+
+        # Standing on each total, with every bust total losing
+        columns = len(strategy.DEALER_CARDS)
+        self.stand = np.full((_MAX_TOTAL + 1, columns), -1.0)
+        self.stand[: constants.BLACKJACK + 1] = (
+            expected_value.PAYOUTS @ results.T
+        )
+        self.blackjack = (
+            self.stand[constants.BLACKJACK]
+            + results[:, probabilities.BLACKJACK]
+        )
+
+        # The best of hitting and standing, solved backwards from 21
+        self.hard_hit = np.zeros_like(self.stand)
+        self.soft_hit = np.zeros_like(self.stand)
+        self.hard_best = self.stand.copy()
+        self.soft_best = self.stand.copy()
+        for total in range(constants.BLACKJACK, _SOFT_LIMIT, -1):
+            self.hard_hit[total] = self._hit(total, soft=False)
+            self.hard_best[total] = np.maximum(
+                self.stand[total], self.hard_hit[total]
+            )
+        for total in range(constants.BLACKJACK, _SOFT_LIMIT + 1, -1):
+            self.soft_hit[total] = self._hit(total, soft=True)
+            self.soft_best[total] = np.maximum(
+                self.stand[total], self.soft_hit[total]
+            )
+        for total in range(_SOFT_LIMIT, 1, -1):
+            self.hard_hit[total] = self._hit(total, soft=False)
+            self.hard_best[total] = np.maximum(
+                self.stand[total], self.hard_hit[total]
+            )
+
+    def _after(self, total: int, soft: bool, value: int) -> tuple[int, bool]:
+        """
+        The total after drawing a card, and whether it is soft.
+        """
+        if soft:
+            if total + value > constants.BLACKJACK:
+                return total + value - constants.ACE_BONUS, False
+            return total + value, True
+        if value == 1 and total <= _SOFT_LIMIT:
+            return total + 1 + constants.ACE_BONUS, True
+        return total + value, False
+
+    def _hit(self, total: int, soft: bool) -> npt.NDArray[np.float64]:
+        hit = np.zeros(len(strategy.DEALER_CARDS))
+        for value, probability in zip(
+            probabilities.CARD_VALUES, self.draws, strict=True
+        ):
+            new_total, new_soft = self._after(total, soft, value)
+            best = self.soft_best if new_soft else self.hard_best
+            hit += probability * best[new_total]
+        return hit
+
+    def double_down(self, total: int, soft: bool) -> npt.NDArray[np.float64]:
+        """
+        The expected value of doubling down on the total.
+        """
+        double = np.zeros(len(strategy.DEALER_CARDS))
+        for value, probability in zip(
+            probabilities.CARD_VALUES, self.draws, strict=True
+        ):
+            new_total, _ = self._after(total, soft, value)
+            double += 2 * probability * self.stand[new_total]
+        return double
+
+    def options(
+        self,
+        total: int,
+        soft: bool,
+        blackjack: bool = False,
+    ) -> tuple[npt.NDArray[np.float64], ...]:
+        """
+        The expected values of standing, hitting and doubling down on the
+        total.
+        """
+        stand = self.blackjack if blackjack else self.stand[total]
+        hit = (self.soft_hit if soft else self.hard_hit)[total]
+        return stand, hit, self.double_down(total, soft)
+
+    def split(self, value: int) -> npt.NDArray[np.float64]:
+        """
+        The expected value of splitting a pair, for both hands together.
+
+        Like ``expected_value``, a split hand is not split again, and split
+        Aces get one card each.
+        """
+        split = np.zeros(len(strategy.DEALER_CARDS))
+        for second, probability in zip(
+            probabilities.CARD_VALUES, self.draws, strict=True
+        ):
+            soft = value == 1 or second == 1
+            total = value + second + (constants.ACE_BONUS if soft else 0)
+            blackjack = soft and total == constants.BLACKJACK
+            stand, hit, double = self.options(total, soft, blackjack)
+            if value == 1:
+                split += probability * stand
+            else:
+                split += probability * np.maximum.reduce([stand, hit, double])
+        return 2 * split
+
+
+def _cells(
+    stand: npt.NDArray[np.float64],
+    hit: npt.NDArray[np.float64],
+    double: npt.NDArray[np.float64],
+) -> list[str]:
+    """
+    The strategy cells for the best options, with doubling down falling
+    back to the better of hitting and standing.
+    """
+    hit_or_stand = np.where(hit > stand, "h", "s")
+    return np.where(
+        double > np.maximum(hit, stand),
+        np.char.add("d/", hit_or_stand),
+        hit_or_stand,
+    ).tolist()
+
+
+def _hands(total: int, soft: bool) -> list[tuple[int, int]]:
+    """
+    The two-card hands that make the total, as the values of their cards.
+    A soft hand has an Ace, and a Blackjack is not a soft 21.
+    """
+    hands = []
+    for first in probabilities.CARD_VALUES:
+        for second in probabilities.CARD_VALUES[first - 1 :]:
+            if first == 1:
+                hand_total = first + second + constants.ACE_BONUS
+                if soft and hand_total == total < constants.BLACKJACK:
+                    hands.append((first, second))
+            elif not soft and first + second == total:
+                hands.append((first, second))
+    return hands
+
+
+def _options(
+    solutions: dict[tuple[int, ...], _Solution],
+    shoe: tuple[int, ...],
+    total: int,
+    soft: bool,
+) -> tuple[npt.NDArray[np.float64], ...]:
+    """
+    The expected values of standing, hitting and doubling down on the
+    total, averaged over the two-card hands that make it.
+    """
+    hands = _hands(total, soft)
+    if not hands:
+        # Only a hand of three or more cards makes the total
+        return solutions[()].options(total, soft)
+
+    weights = [
+        shoe[first - 1] * (shoe[second - 1] - (first == second))
+        for first, second in hands
+    ]
+    options = [solutions[hand].options(total, soft) for hand in hands]
+    return tuple(
+        np.average(values, axis=0, weights=weights)
+        for values in zip(*options, strict=True)
+    )
+
+
+def solve(number_of_decks: int) -> strategy.Strategy:
+    """
+    Derive basic strategy for the rules in ``rules``.
+
+    :param number_of_decks: The number of 52-card decks in the shoe.
+
+    :return: The basic strategy, ready to play.
+    """
+    if number_of_decks < 1:
+        raise ValueError("There must be at least one deck")
+
+    shoe = probabilities.full_composition(number_of_decks)
+    solutions = {(): _Solution(shoe)}
+    for first in probabilities.CARD_VALUES:
+        for second in probabilities.CARD_VALUES[first - 1 :]:
+            solutions[first, second] = _Solution(
+                probabilities.without(
+                    probabilities.without(shoe, first), second
+                )
+            )
+
+    hard = {
+        total: _cells(*_options(solutions, shoe, total, soft=False))
+        for total in strategy.HARD_TOTALS
+    }
+    soft = {
+        total: _cells(*_options(solutions, shoe, total, soft=True))
+        for total in strategy.SOFT_TOTALS
+    }
+
+    pairs = {}
+    for value in strategy.PAIRS:
+        solution = solutions[value, value]
+        if value == 1:
+            options = solution.options(2 + constants.ACE_BONUS, soft=True)
+        else:
+            options = solution.options(2 * value, soft=False)
+        pairs[value] = np.where(
+            solution.split(value) > np.maximum.reduce(options),
+            participants.PlayerOption.SPLIT.value,
+            strategy.NO_SPLIT,
+        ).tolist()
+
+    return strategy.Strategy.from_matrices(hard, soft, pairs)
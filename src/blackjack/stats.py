@@ -0,0 +1,295 @@
+"""
+Streaming statistics for simulations.
+
+Simulations can play billions of hands, so their results are aggregated
+as they are played rather than stored: each hand updates a few running
+totals, in constant memory. The mean and variance are kept with Welford's
+algorithm, which stays accurate over long runs where summing squares
+would not, and two sets of statistics can be merged exactly, so workers
+can aggregate their own hands and be combined at the end.
+
+Counting simulations also keep the statistics of each bucket of true
+counts (see ``CountStatistics``), which give the return at each count that
+a bet ramp is designed from.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import statistics
+
+import numpy as np
+import numpy.typing as npt
+
+from blackjack import bankroll
+
+
+@dataclasses.dataclass
+class Statistics:
+    """
+    Running statistics of a stream of values, such as the amount won on
+    each hand.
+
+    The running total of the values is tracked too, with its lowest and
+    highest points: for the amounts won on each hand, these are the
+    extremes of the bankroll relative to where it started.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    # The sum of the squared differences from the mean
+    sum_of_squares: float = 0.0
+    total: float = 0.0
+    lowest_total: float = 0.0
+    highest_total: float = 0.0
+
+    @property
+    def variance(self) -> float:
+        """
+        The sample variance of the values.
+        """
+        if self.count <= 1:
+            return 0.0
+        return self.sum_of_squares / (self.count - 1)
+
+    @property
+    def standard_deviation(self) -> float:
+        """
+        The sample standard deviation of the values.
+        """
+        return math.sqrt(self.variance)
+
+    @property
+    def standard_error(self) -> float:
+        """
+        The standard error of the mean.
+        """
+        if not self.count:
+            return 0.0
+        return self.standard_deviation / math.sqrt(self.count)
+
+    def half_width(self, confidence: float = 0.95) -> float:
+        """
+        The half-width of the confidence interval for the mean.
+
+        The interval uses the normal approximation, which is accurate for
+        the number of values that simulations produce.
+
+        :param confidence: The probability that the interval contains the
+            true mean, between 0 and 1.
+
+        :return: The distance from the mean to either end of the interval.
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("The confidence must be between 0 and 1")
+        z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+        return z * self.standard_error
+
+    def confidence_interval(
+        self,
+        confidence: float = 0.95,
+    ) -> tuple[float, float]:
+        """
+        The confidence interval for the mean.
+
+        :param confidence: The probability that the interval contains the
+            true mean, between 0 and 1.
+
+        :return: The lower and upper ends of the interval.
+        """
+        half_width = self.half_width(confidence)
+        return self.mean - half_width, self.mean + half_width
+
+    def add(self, value: float) -> None:
+        """
+        Add a value to the statistics.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_of_squares += delta * (value - self.mean)
+
+        self.total += value
+        self.lowest_total = min(self.lowest_total, self.total)
+        self.highest_total = max(self.highest_total, self.total)
+
+    def add__many(self, values: npt.ArrayLike) -> None:
+        """
+        Add many values to the statistics, in order.
+        """
+        values = np.asarray(values, dtype=float)
+        if not values.size:
+            return
+
+        mean = values.mean()
+        totals = np.cumsum(values)
+        self.merge(
+            Statistics(
+                count=values.size,
+                mean=float(mean),
+                sum_of_squares=float(np.square(values - mean).sum()),
+                total=float(totals[-1]),
+                lowest_total=min(0.0, float(totals.min())),
+                highest_total=max(0.0, float(totals.max())),
+            )
+        )
+
+    def merge(self, other: Statistics) -> None:
+        """
+        Add the statistics of the values that follow these ones.
+
+        The mean and variance do not depend on the order of the values,
+        but the extremes of the running total do: the other values are
+        taken to come after these ones.
+        """
+        if not other.count:
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.sum_of_squares += (
+            other.sum_of_squares + delta**2 * self.count * other.count / count
+        )
+        self.count = count
+
+        self.lowest_total = min(
+            self.lowest_total,
+            self.total + other.lowest_total,
+        )
+        self.highest_total = max(
+            self.highest_total,
+            self.total + other.highest_total,
+        )
+        self.total += other.total
+
+
+@dataclasses.dataclass
+class CountStatistics:
+    """
+    Running statistics of the values at each true count, such as the
+    amount won on each hand per unit bet, keyed by the true count when the
+    bet was placed.
+
+    Bucket ``k`` holds the true counts from ``k`` up to ``k + 1``, and the
+    true counts beyond the lowest and highest buckets are put in them, so
+    the statistics take the same memory however long the simulation runs.
+    Each bucket keeps its mean and variance with Welford's algorithm, like
+    ``Statistics``, in arrays with an entry for each bucket.
+    """
+
+    lowest_true_count: int = -10
+    highest_true_count: int = 10
+    hands: npt.NDArray[np.int64] = dataclasses.field(init=False)
+    means: npt.NDArray[np.float64] = dataclasses.field(init=False)
+    # The sum of the squared differences from the mean in each bucket
+    sums_of_squares: npt.NDArray[np.float64] = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.lowest_true_count > self.highest_true_count:
+            raise ValueError(
+                "The lowest true count cannot be more than the highest"
+            )
+        buckets = self.highest_true_count - self.lowest_true_count + 1
+        self.hands = np.zeros(buckets, dtype=np.int64)
+        self.means = np.zeros(buckets)
+        self.sums_of_squares = np.zeros(buckets)
+
+    # The statistics change as values are added, so are not hashable
+    __hash__ = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CountStatistics):
+            return NotImplemented
+        return (
+            (self.lowest_true_count, self.highest_true_count)
+            == (other.lowest_true_count, other.highest_true_count)
+            and np.array_equal(self.hands, other.hands)
+            and np.array_equal(self.means, other.means)
+            and np.array_equal(self.sums_of_squares, other.sums_of_squares)
+        )
+
+    @property
+    def true_counts(self) -> npt.NDArray[np.float64]:
+        """
+        The lowest true count in each bucket.
+        """
+        return np.arange(
+            self.lowest_true_count, self.highest_true_count + 1, dtype=float
+        )
+
+    @property
+    def variances(self) -> npt.NDArray[np.float64]:
+        """
+        The sample variance of the values in each bucket, or zero for a
+        bucket with fewer than two values.
+        """
+        return np.divide(
+            self.sums_of_squares,
+            self.hands - 1,
+            out=np.zeros(len(self.hands)),
+            where=self.hands > 1,
+        )
+
+    def add(self, true_count: float, value: float) -> None:
+        """
+        Add a value to the bucket of the true count.
+        """
+        bucket = (
+            min(
+                max(math.floor(true_count), self.lowest_true_count),
+                self.highest_true_count,
+            )
+            - self.lowest_true_count
+        )
+        self.hands[bucket] += 1
+        delta = value - self.means[bucket]
+        self.means[bucket] += delta / self.hands[bucket]
+        self.sums_of_squares[bucket] += delta * (value - self.means[bucket])
+
+    def merge(self, other: CountStatistics) -> None:
+        """
+        Add the statistics of other values, in the same buckets.
+
+        Each bucket is merged like ``Statistics.merge``.
+        """
+        if (other.lowest_true_count, other.highest_true_count) != (
+            self.lowest_true_count,
+            self.highest_true_count,
+        ):
+            raise ValueError("The statistics must have the same buckets")
+
+        hands = self.hands + other.hands
+        delta = other.means - self.means
+        # The share of each bucket's merged values that are the other's
+        share = np.divide(
+            other.hands,
+            hands,
+            out=np.zeros(len(hands)),
+            where=hands > 0,
+        )
+        self.means += delta * share
+        self.sums_of_squares += (
+            other.sums_of_squares + delta**2 * self.hands * share
+        )
+        self.hands = hands
+
+    def profile(self) -> bankroll.CountProfile:
+        """
+        The count profile of the values, for designing a bet ramp with
+        ``bankroll.kelly_ramp`` or simulating one with
+        ``bankroll.simulate``.
+
+        :return: The profile, with the buckets that have any values.
+        """
+        if not self.hands.sum():
+            raise ValueError("There are no values to profile")
+
+        seen = self.hands > 0
+        return bankroll.CountProfile(
+            true_counts=self.true_counts[seen],
+            frequencies=self.hands[seen] / self.hands.sum(),
+            means=self.means[seen],
+            variances=self.variances[seen],
+        )
@@ -0,0 +1,674 @@
+"""
+Strategies as lookup tables.
+
+A strategy is written as three matrices of the player's hand against the
+dealer's face-up card: one for hard totals, one for soft totals and one
+for pairs. The matrices are compiled into a single flat array so that
+each decision is one indexed lookup rather than a chain of branches.
+
+Strategies can be kept in CSV files, with a section for each matrix::
+
+    hard,2,3,4,5,6,7,8,9,10,A
+    4,h,h,h,h,h,h,h,h,h,h
+    ...
+    soft,2,3,4,5,6,7,8,9,10,A
+    12,h,h,h,h,h,h,h,h,h,h
+    ...
+    pairs,2,3,4,5,6,7,8,9,10,A
+    A,sp,sp,sp,sp,sp,sp,sp,sp,sp,sp
+    ...
+
+Lines starting with ``#`` are comments.
+
+A cell can also carry an index play, to deviate from the cell once the
+true count (see ``Deck.true_count``) reaches an index: ``h|s@4`` means
+hit, but stand when the true count is 4 or more. Deviations are compiled
+into a second table alongside the first, so an index play costs a single
+comparison against the cell's index.
+"""
+
+from __future__ import annotations
+
+import csv
+import glob
+import hashlib
+import io
+import math
+import os
+import pathlib
+import zipfile
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from blackjack import constants, participants
+from blackjack import deck as deck_
+
+# A matrix maps the player's total (or, for pairs, the value of the paired
+# card) to its row of cells, one for each of the dealer's face-up cards
+Matrix = Mapping[int, Sequence[str]]
+
+# The dealer's face-up card values in column order, with the Ace last
+DEALER_CARDS = (2, 3, 4, 5, 6, 7, 8, 9, 10, 1)
+HARD_TOTALS = range(4, 22)
+SOFT_TOTALS = range(12, 22)
+PAIRS = range(1, 11)
+
+# Options in a cell are separated by a slash, in order of preference: for
+# example, ``d/h`` means double down if allowed, otherwise hit
+OPTION_SEPARATOR = "/"
+# A pair cell is either a split or this, to play the hand by its total
+NO_SPLIT = "-"
+# An index play follows the cell after this, as the cell to deviate to and
+# the true count to deviate at, for example ``h|s@4``
+DEVIATION_SEPARATOR = "|"
+INDEX_SEPARATOR = "@"
+
+# The sections of a strategy file, in order
+SECTIONS = ("hard", "soft", "pairs")
+# Bump this when the compiled table changes so that old caches are ignored
+CACHE_VERSION = 2
+
+# The options that the compiled table indexes into
+OPTIONS = tuple(participants.PlayerOption)
+_NO_OPTION = 255
+_MAX_CELL_OPTIONS = 2
+_SOFT_ROW = len(HARD_TOTALS)
+_PAIR_ROW = _SOFT_ROW + len(SOFT_TOTALS)
+_ROWS = _PAIR_ROW + len(PAIRS)
+
+# The entries that a mutation can change a hard or soft cell to, and a
+# pair cell to
+_HIT_INDEX = OPTIONS.index(participants.PlayerOption.HIT)
+_STAND_INDEX = OPTIONS.index(participants.PlayerOption.STAND)
+_DOUBLE_DOWN_INDEX = OPTIONS.index(participants.PlayerOption.DOUBLE_DOWN)
+_SPLIT_INDEX = OPTIONS.index(participants.PlayerOption.SPLIT)
+_MUTATIONS = np.array(
+    [
+        (_HIT_INDEX, _HIT_INDEX),
+        (_STAND_INDEX, _STAND_INDEX),
+        (_DOUBLE_DOWN_INDEX, _HIT_INDEX),
+        (_DOUBLE_DOWN_INDEX, _STAND_INDEX),
+    ],
+    dtype=np.uint8,
+)
+_PAIR_MUTATIONS = np.array(
+    [(_SPLIT_INDEX, _SPLIT_INDEX), (_NO_OPTION, _NO_OPTION)],
+    dtype=np.uint8,
+)
+
+
+def _parse_cell(cell: str, pair: bool) -> tuple[int, int]:
+    """
+    Parse a cell into the indices of its preferred and fallback options.
+    """
+    if pair:
+        if cell == NO_SPLIT:
+            return _NO_OPTION, _NO_OPTION
+        if cell == participants.PlayerOption.SPLIT.value:
+            index = OPTIONS.index(participants.PlayerOption.SPLIT)
+            return index, index
+        raise ValueError(
+            f"Pair cells must be '{participants.PlayerOption.SPLIT.value}'"
+            f" or '{NO_SPLIT}', not '{cell}'"
+        )
+
+    try:
+        options = [
+            participants.PlayerOption(value)
+            for value in cell.split(OPTION_SEPARATOR)
+        ]
+    except ValueError:
+        raise ValueError(f"The cell '{cell}' has an unknown option") from None
+
+    preferred, fallback = options[0], options[-1]
+    if len(options) > _MAX_CELL_OPTIONS or fallback not in {
+        participants.PlayerOption.HIT,
+        participants.PlayerOption.STAND,
+    }:
+        raise ValueError(
+            f"The cell '{cell}' must end with a hit or a stand, with at most"
+            f" one option before it"
+        )
+    if participants.PlayerOption.SPLIT in options:
+        raise ValueError(f"The cell '{cell}' can only split in a pair matrix")
+
+    return OPTIONS.index(preferred), OPTIONS.index(fallback)
+
+
+def _parse_indexed_cell(
+    cell: str,
+    pair: bool,
+) -> tuple[tuple[int, int], tuple[int, int], float]:
+    """
+    Parse a cell that may have an index play into its options, the options
+    to deviate to, and the true count to deviate at. A cell without an
+    index play never deviates.
+    """
+    if DEVIATION_SEPARATOR not in cell:
+        options = _parse_cell(cell, pair)
+        return options, options, math.inf
+
+    base, deviation = cell.split(DEVIATION_SEPARATOR, 1)
+    deviation, _, index = deviation.partition(INDEX_SEPARATOR)
+    try:
+        true_count = float(index)
+    except ValueError:
+        true_count = math.nan
+    if not math.isfinite(true_count):
+        raise ValueError(
+            f"The cell '{cell}' needs a true count after '{INDEX_SEPARATOR}'"
+        )
+
+    return (
+        _parse_cell(base.strip(), pair),
+        _parse_cell(deviation.strip(), pair),
+        true_count,
+    )
+
+
+def _compile_matrix(
+    matrix: Matrix,
+    rows: range,
+    pair: bool,
+) -> tuple[
+    npt.NDArray[np.uint8],
+    npt.NDArray[np.uint8],
+    npt.NDArray[np.float64],
+]:
+    """
+    Compile a matrix into its blocks of the flat lookup tables: the
+    options, the options to deviate to, and the indices to deviate at.
+    """
+    if sorted(matrix) != list(rows):
+        raise ValueError(
+            f"The matrix needs exactly one row for each of {rows.start} to"
+            f" {rows.stop - 1}"
+        )
+
+    cells = []
+    for row in rows:
+        if len(matrix[row]) != len(DEALER_CARDS):
+            raise ValueError(
+                f"Row {row} needs {len(DEALER_CARDS)} cells, one for each"
+                f" dealer card, but has {len(matrix[row])}"
+            )
+        cells += [
+            _parse_indexed_cell(cell.strip().lower(), pair)
+            for cell in matrix[row]
+        ]
+
+    options, deviations, indices = zip(*cells, strict=True)
+    return (
+        np.array(options, dtype=np.uint8),
+        np.array(deviations, dtype=np.uint8),
+        np.array(indices),
+    )
+
+
+class Strategy:
+    """
+    A strategy compiled into a flat lookup table.
+
+    The table has one entry for each row of the hard, soft and pair
+    matrices (in that order) and each dealer card: the indices into
+    ``PlayerOption`` of the preferred option and of the option to fall
+    back to when the preferred one is not available.
+
+    Index plays are compiled into a second table of the same shape, with
+    the entries to deviate to, and the true count at which each entry
+    deviates (infinity for an entry without an index play).
+
+    A strategy can be used anywhere that a ``rules.Strategy`` is expected.
+    The tables must not be changed once the strategy is made.
+    """
+
+    table: npt.NDArray[np.uint8]
+    deviations: npt.NDArray[np.uint8]
+    indices: npt.NDArray[np.float64]
+    _table: list[list[int]]
+    _deviations: list[list[int]]
+    _indices: list[float]
+
+    def __init__(
+        self,
+        table: npt.NDArray[np.uint8],
+        deviations: npt.NDArray[np.uint8] | None = None,
+        indices: npt.NDArray[np.float64] | None = None,
+    ) -> None:
+        """
+        Instantiate a strategy from compiled tables.
+
+        :param table: The compiled table, such as from another strategy.
+            Use ``Strategy.from_matrices`` to build a strategy from its
+            matrices.
+        :param deviations: The compiled table of the entries to deviate
+            to. Defaults to no index plays.
+        :param indices: The true count at which each entry deviates.
+            Defaults to no index plays.
+        """
+        if table.shape != (_ROWS * len(DEALER_CARDS), 2):
+            raise ValueError(f"The table has the wrong shape, {table.shape}")
+        if deviations is None or indices is None:
+            deviations = table
+            indices = np.full(len(table), np.inf)
+        if deviations.shape != table.shape or indices.shape != table.shape[:1]:
+            raise ValueError(
+                "The deviations and indices need an entry for each entry of"
+                " the table"
+            )
+
+        self.table = table
+        self.deviations = deviations
+        self.indices = indices
+        # Single decisions look up Python lists, which is much faster than
+        # indexing NumPy arrays one entry at a time
+        self._table = table.tolist()
+        self._deviations = deviations.tolist()
+        self._indices = indices.tolist()
+
+    @classmethod
+    def from_matrices(
+        cls,
+        hard: Matrix,
+        soft: Matrix,
+        pairs: Matrix,
+    ) -> Strategy:
+        """
+        Compile a strategy from its matrices.
+
+        Each row has one cell for each dealer card in ``DEALER_CARDS``.
+
+        :param hard: The options for each hard total from 4 to 21.
+        :param soft: The options for each soft total from 12 to 21.
+        :param pairs: Whether to split each pair, keyed by the value of
+            the paired card from Ace (1) to 10.
+
+        :return: The compiled strategy.
+        """
+        blocks = [
+            _compile_matrix(hard, HARD_TOTALS, pair=False),
+            _compile_matrix(soft, SOFT_TOTALS, pair=False),
+            _compile_matrix(pairs, PAIRS, pair=True),
+        ]
+        return cls(*map(np.concatenate, zip(*blocks, strict=True)))
+
+    def fingerprint(self) -> str:
+        """
+        A hash of the compiled tables, which is the same for any strategies
+        with the same cells and index plays, however they were made.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (self.table, self.deviations, self.indices):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def mutate(self, rng: np.random.Generator, rate: float) -> Strategy:
+        """
+        Make a copy of the strategy with some of its cells redrawn at
+        random, for searching for better strategies.
+
+        A hard or soft cell is redrawn as a hit, a stand, or a double down
+        that falls back to either, and a pair cell as a split or not. Index
+        plays are kept.
+
+        :param rng: The random number generator to pick the cells with.
+        :param rate: The probability that each cell is redrawn, between 0
+            and 1. A redrawn cell can be drawn the same as it was.
+
+        :return: The mutated strategy.
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError("The mutation rate must be between 0 and 1")
+
+        table = self.table.copy()
+        redrawn = rng.random(len(table)) < rate
+        pair = np.arange(len(table)) >= _PAIR_ROW * len(DEALER_CARDS)
+        for entries, mutations in (
+            (np.flatnonzero(redrawn & ~pair), _MUTATIONS),
+            (np.flatnonzero(redrawn & pair), _PAIR_MUTATIONS),
+        ):
+            table[entries] = mutations[
+                rng.integers(len(mutations), size=entries.size)
+            ]
+
+        # The entries without an index play deviate to themselves
+        no_index = np.isinf(self.indices)[:, np.newaxis]
+        return Strategy(
+            table,
+            np.where(no_index, table, self.deviations),
+            self.indices.copy(),
+        )
+
+    def __call__(
+        self,
+        hand: participants.PlayerHand,
+        dealer_card: deck_.Card,
+        options: list[participants.PlayerOption],
+        deck: deck_.Deck,
+    ) -> participants.PlayerOption:
+        """
+        Look up the option to take for the hand, deviating from the cell
+        if the deck's true count has reached the cell's index.
+        """
+        true_count = deck.true_count
+        column = (dealer_card.values.hard - 2) % len(DEALER_CARDS)
+        if participants.PlayerOption.SPLIT in options:
+            row = _PAIR_ROW + hand[0].values.hard - PAIRS.start
+            entry = row * len(DEALER_CARDS) + column
+            table = (
+                self._deviations
+                if true_count >= self._indices[entry]
+                else self._table
+            )
+            if table[entry][0] != _NO_OPTION:
+                return participants.PlayerOption.SPLIT
+
+        values = hand.values
+        if values.soft:
+            row = _SOFT_ROW + values.total - SOFT_TOTALS.start
+        else:
+            row = values.hard - HARD_TOTALS.start
+
+        entry = row * len(DEALER_CARDS) + column
+        table = (
+            self._deviations
+            if true_count >= self._indices[entry]
+            else self._table
+        )
+        preferred, fallback = table[entry]
+        if OPTIONS[preferred] in options:
+            return OPTIONS[preferred]
+        return OPTIONS[fallback]
+
+    def lookup(
+        self,
+        hard: npt.NDArray[np.int_],
+        ace: npt.NDArray[np.bool_],
+        pair: npt.NDArray[np.int_],
+        column: npt.NDArray[np.int_],
+        true_count: npt.NDArray[np.float64] | None = None,
+    ) -> npt.NDArray[np.uint8]:
+        """
+        Look up the options for many hands at once.
+
+        :param hard: The hard total of each hand.
+        :param ace: Whether each hand has an Ace.
+        :param pair: The value of the paired card for each hand that can be
+            split, or 0 for a hand that cannot.
+        :param column: The column of each dealer's face-up card in
+            ``DEALER_CARDS``.
+        :param true_count: The true count for each hand, to deviate at.
+            Defaults to never deviating.
+
+        :return: The indices into ``OPTIONS`` of the preferred option and
+            of the fallback option for each hand, with a row for each hand.
+        """
+        soft = ace & (hard + constants.ACE_BONUS <= constants.BLACKJACK)
+        row = np.where(
+            soft,
+            _SOFT_ROW + hard + constants.ACE_BONUS - SOFT_TOTALS.start,
+            hard - HARD_TOTALS.start,
+        )
+        cells = self._entries(row * len(DEALER_CARDS) + column, true_count)
+
+        split = pair > 0
+        pair_cells = self._entries(
+            (_PAIR_ROW + pair[split] - PAIRS.start) * len(DEALER_CARDS)
+            + column[split],
+            None if true_count is None else true_count[split],
+        )
+        split[split] = pair_cells[:, 0] != _NO_OPTION
+        cells[split] = OPTIONS.index(participants.PlayerOption.SPLIT)
+        return cells
+
+    def _entries(
+        self,
+        entries: npt.NDArray[np.int_],
+        true_count: npt.NDArray[np.float64] | None,
+    ) -> npt.NDArray[np.uint8]:
+        """
+        The entries of the table, deviating where the true count has
+        reached the entry's index.
+        """
+        if true_count is None:
+            return self.table[entries]
+        return np.where(
+            (true_count >= self.indices[entries])[:, np.newaxis],
+            self.deviations[entries],
+            self.table[entries],
+        )
+
+
+def _label(number: int) -> str:
+    return "A" if number == 1 else str(number)
+
+
+def _number(label: str) -> int:
+    return 1 if label.upper() == "A" else int(label)
+
+
+def _format_cell(preferred: int, fallback: int) -> str:
+    if preferred == _NO_OPTION:
+        return NO_SPLIT
+    if preferred == fallback:
+        return OPTIONS[preferred].value
+    return (
+        f"{OPTIONS[preferred].value}{OPTION_SEPARATOR}{OPTIONS[fallback].value}"
+    )
+
+
+def _format_indexed_cell(
+    options: npt.NDArray[np.uint8],
+    deviation: npt.NDArray[np.uint8],
+    index: float,
+) -> str:
+    cell = _format_cell(*options)
+    if math.isinf(index):
+        return cell
+    return (
+        f"{cell}{DEVIATION_SEPARATOR}{_format_cell(*deviation)}"
+        f"{INDEX_SEPARATOR}{index:g}"
+    )
+
+
+def parse(text: str) -> Strategy:
+    """
+    Parse and compile a strategy from the contents of a strategy file.
+
+    :param text: The contents of the strategy file.
+
+    :return: The compiled strategy.
+    """
+    header = [_label(card) for card in DEALER_CARDS]
+    matrices: dict[str, dict[int, list[str]]] = {}
+    matrix = None
+    for line_number, line in enumerate(csv.reader(io.StringIO(text)), 1):
+        row = [cell.strip() for cell in line]
+        if not any(row) or row[0].startswith("#"):
+            continue
+
+        label, *cells = row
+        if label.lower() in SECTIONS:
+            if [cell.upper() for cell in cells] != header:
+                raise ValueError(
+                    f"Line {line_number}: the {label} header must list the"
+                    f" dealer cards {', '.join(header)}"
+                )
+            if label.lower() in matrices:
+                raise ValueError(f"Line {line_number}: {label} is repeated")
+            matrix = matrices[label.lower()] = {}
+        elif matrix is None:
+            raise ValueError(
+                f"Line {line_number}: expected one of the headers {SECTIONS}"
+            )
+        else:
+            try:
+                key = _number(label)
+            except ValueError:
+                raise ValueError(
+                    f"Line {line_number}: '{label}' is not a total or a card"
+                ) from None
+            if key in matrix:
+                raise ValueError(f"Line {line_number}: {label} is repeated")
+            matrix[key] = cells
+
+    missing = [section for section in SECTIONS if section not in matrices]
+    if missing:
+        raise ValueError(f"The strategy is missing the sections {missing}")
+
+    return Strategy.from_matrices(**matrices)
+
+
+def dumps(strategy: Strategy) -> str:
+    """
+    Write a strategy as the contents of a strategy file.
+
+    :param strategy: The strategy to write.
+
+    :return: The contents of the strategy file, which ``parse`` reads back
+        into the same strategy.
+    """
+    # The options, deviations and indices of each row's cells
+    rows_of_cells = list(
+        zip(
+            strategy.table.reshape(-1, len(DEALER_CARDS), 2),
+            strategy.deviations.reshape(-1, len(DEALER_CARDS), 2),
+            strategy.indices.reshape(-1, len(DEALER_CARDS)),
+            strict=True,
+        )
+    )
+    header = [_label(card) for card in DEALER_CARDS]
+    offsets = (0, _SOFT_ROW, _PAIR_ROW)
+    rows = (HARD_TOTALS, SOFT_TOTALS, PAIRS)
+
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    for section, offset, numbers in zip(SECTIONS, offsets, rows, strict=True):
+        writer.writerow([section, *header])
+        for i, number in enumerate(numbers):
+            writer.writerow(
+                [
+                    _label(number) if section == "pairs" else number,
+                    *map(_format_indexed_cell, *rows_of_cells[offset + i]),
+                ]
+            )
+
+    return output.getvalue()
+
+
+def load(path: str | os.PathLike[str]) -> Strategy:
+    """
+    Load a strategy from a strategy file.
+
+    Compiling a strategy file is slow next to loading the compiled table,
+    so the compiled table is cached next to the file, named after a hash
+    of the file's contents. Editing the file changes the hash, so a cache
+    is never used for a file that it was not compiled from. If the cache
+    cannot be written, such as in a read-only directory, the strategy is
+    compiled each time instead.
+
+    :param path: The path to the strategy file.
+
+    :return: The compiled strategy.
+    """
+    path = pathlib.Path(path)
+    contents = path.read_bytes()
+    digest = hashlib.sha256(
+        f"{CACHE_VERSION}\n".encode() + contents
+    ).hexdigest()
+    cache = path.with_name(f"{path.name}.{digest[:16]}.npz")
+
+    try:
+        with np.load(cache, allow_pickle=False) as tables:
+            return Strategy(
+                tables["table"],
+                tables["deviations"],
+                tables["indices"],
+            )
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        pass
+
+    strategy = parse(contents.decode())
+    _write_cache(strategy, cache, pattern=f"{glob.escape(path.name)}.*.npz")
+    return strategy
+
+
+def _write_cache(strategy: Strategy, cache: pathlib.Path, pattern: str) -> None:
+    """
+    Write the compiled tables to the cache, and remove any stale caches.
+
+    The tables are written to a temporary file first and then moved into
+    place, so that other processes never read a partly written cache.
+    """
+    temporary = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        with temporary.open("wb") as file:
+            np.savez(
+                file,
+                table=strategy.table,
+                deviations=strategy.deviations,
+                indices=strategy.indices,
+            )
+        temporary.replace(cache)
+        for stale in cache.parent.glob(pattern):
+            if stale != cache:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+
+
+# Basic strategy for four or more decks, where the dealer stands on all
+# 17s and doubling down after splitting is allowed
+# fmt: off
+BASIC_STRATEGY = Strategy.from_matrices(
+    hard={
+        #     2      3      4      5      6      7      8      9      10     A
+        4:  ["h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h"],
+        5:  ["h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h"],
+        6:  ["h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h"],
+        7:  ["h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h"],
+        8:  ["h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h"],
+        9:  ["h",   "d/h", "d/h", "d/h", "d/h", "h",   "h",   "h",   "h",   "h"],
+        10: ["d/h", "d/h", "d/h", "d/h", "d/h", "d/h", "d/h", "d/h", "h",   "h"],
+        11: ["d/h", "d/h", "d/h", "d/h", "d/h", "d/h", "d/h", "d/h", "d/h", "h"],
+        12: ["h",   "h",   "s",   "s",   "s",   "h",   "h",   "h",   "h",   "h"],
+        13: ["s",   "s",   "s",   "s",   "s",   "h",   "h",   "h",   "h",   "h"],
+        14: ["s",   "s",   "s",   "s",   "s",   "h",   "h",   "h",   "h",   "h"],
+        15: ["s",   "s",   "s",   "s",   "s",   "h",   "h",   "h",   "h",   "h"],
+        16: ["s",   "s",   "s",   "s",   "s",   "h",   "h",   "h",   "h",   "h"],
+        17: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+        18: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+        19: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+        20: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+        21: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+    },
+    soft={
+        #     2      3      4      5      6      7      8      9      10     A
+        12: ["h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h",   "h"],
+        13: ["h",   "h",   "h",   "d/h", "d/h", "h",   "h",   "h",   "h",   "h"],
+        14: ["h",   "h",   "h",   "d/h", "d/h", "h",   "h",   "h",   "h",   "h"],
+        15: ["h",   "h",   "d/h", "d/h", "d/h", "h",   "h",   "h",   "h",   "h"],
+        16: ["h",   "h",   "d/h", "d/h", "d/h", "h",   "h",   "h",   "h",   "h"],
+        17: ["h",   "d/h", "d/h", "d/h", "d/h", "h",   "h",   "h",   "h",   "h"],
+        18: ["s",   "d/s", "d/s", "d/s", "d/s", "s",   "s",   "h",   "h",   "h"],
+        19: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+        20: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+        21: ["s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s",   "s"],
+    },
+    pairs={
+        #     2      3      4      5      6      7      8      9      10     A
+        1:  ["sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp"],
+        2:  ["sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "-",   "-",   "-",   "-"],
+        3:  ["sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "-",   "-",   "-",   "-"],
+        4:  ["-",   "-",   "-",   "sp",  "sp",  "-",   "-",   "-",   "-",   "-"],
+        5:  ["-",   "-",   "-",   "-",   "-",   "-",   "-",   "-",   "-",   "-"],
+        6:  ["sp",  "sp",  "sp",  "sp",  "sp",  "-",   "-",   "-",   "-",   "-"],
+        7:  ["sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "-",   "-",   "-",   "-"],
+        8:  ["sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp",  "sp"],
+        9:  ["sp",  "sp",  "sp",  "sp",  "sp",  "-",   "sp",  "sp",  "-",   "-"],
+        10: ["-",   "-",   "-",   "-",   "-",   "-",   "-",   "-",   "-",   "-"],
+    },
+)
+# fmt: on
@@ -0,0 +1,235 @@
+"""
+Play many strategies against the same sequence of shoes.
+
+A tournament shuffles each shoe once, up front, and every strategy plays
+every shoe from the first card to the cut card. The shoes are kept in
+shared memory, so the worker processes all read the same shuffles rather
+than each making and shuffling their own decks. Since the strategies are
+dealt the same cards until their decisions differ, the differences
+between them are measured with far less noise than independent
+simulations would give (see ``sim.compare``).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+
+import numpy as np
+import numpy.typing as npt
+
+from blackjack import deck as deck_
+from blackjack import rules, sim, stats
+
+SHOES_PER_TASK = 1_000
+
+# The shared memory with the shoes of the tournament that a worker process
+# is playing, attached to once when the worker starts. The memory is kept
+# open for as long as the worker uses the shoes.
+_memory: shared_memory.SharedMemory | None = None
+_shoes: npt.NDArray[np.uint8] | None = None
+
+
+@dataclasses.dataclass
+class Standing:
+    """
+    A strategy's place in a tournament.
+
+    ``difference`` has the statistics of the amount that the strategy won
+    on each shoe minus the amount that the leader won on it, so the
+    leader's is all zero.
+    """
+
+    name: str
+    result: sim.SimulationResult
+    difference: stats.Statistics
+
+
+@dataclasses.dataclass
+class Tournament:
+    """
+    The result of a tournament, with the strategies ranked from the most
+    to the least money won.
+    """
+
+    number_of_shoes: int
+    seed: int
+    standings: list[Standing]
+
+    def table(self, confidence: float = 0.95) -> str:
+        """
+        Format the standings as a table.
+
+        :param confidence: The confidence of the intervals, between 0 and 1.
+
+        :return: A row for each strategy, with its return per hand and how
+            far it is behind the leader per shoe, each with a confidence
+            interval.
+        """
+        width = max(len("Strategy"), *(len(s.name) for s in self.standings))
+        rows = [
+            f"{'Rank':>4}  {'Strategy':<{width}}  {'Hands':>10}"
+            f"  {'Return per hand':>17}  Behind the leader per shoe"
+        ]
+        for rank, standing in enumerate(self.standings, start=1):
+            per_hand = standing.result.per_hand
+            behind = "-"
+            if rank > 1:
+                low, high = standing.difference.confidence_interval(confidence)
+                behind = (
+                    f"{standing.difference.mean:.3f} [{low:.3f}, {high:.3f}]"
+                )
+            rows.append(
+                f"{rank:>4}  {standing.name:<{width}}"
+                f"  {standing.result.hands:>10}"
+                f"  {per_hand.mean:>8.4f} ± {per_hand.half_width(confidence):.4f}"
+                f"  {behind}"
+            )
+        return "\n".join(rows)
+
+
+def _attach(name: str, shape: tuple[int, int]) -> None:
+    """
+    Attach a worker process to the tournament's shoes.
+
+    The worker does not track the memory, so only the process that created
+    it unlinks it, once the tournament is over.
+    """
+    global _memory, _shoes  # noqa: PLW0603
+    _memory = shared_memory.SharedMemory(name, track=False)
+    _shoes = np.ndarray(shape, dtype=np.uint8, buffer=_memory.buf)
+    _shoes.flags.writeable = False
+
+
+def _play_shoes(
+    strategy: rules.Strategy,
+    table: sim.Table,
+    start: int,
+    stop: int,
+    seed: int,
+) -> tuple[sim.SimulationResult, npt.NDArray[np.float64]]:
+    """
+    Play the shoes from ``start`` up to ``stop`` with a strategy.
+
+    The deck only shuffles with its own generator if a shoe runs out part
+    way through a round, and that generator is seeded the same way for
+    every strategy.
+
+    :return: The aggregated result of the shoes, and the amount won on
+        each shoe.
+    """
+    rng = np.random.default_rng(
+        np.random.SeedSequence(seed, spawn_key=(start,))
+    )
+    game = table.new_game(rng)
+    bankrolls = {player.name: player.money for player in game.players}
+
+    result = table.new_result()
+    nets = np.empty(stop - start)
+    for i in range(stop - start):
+        net = result.net
+        game.reset_round(_shoes[start + i])
+        while True:
+            for player in game.players:
+                player.money = bankrolls[player.name]
+            sim.play_round(game, strategy, result)
+            if game.deck.needs_shuffle:
+                break
+            game.reset_round()
+        nets[i] = result.net - net
+
+    return result, nets
+
+
+def play(
+    strategies: Mapping[str, rules.Strategy],
+    number_of_shoes: int,
+    table: sim.Table = sim.STANDARD_TABLE,
+    *,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> Tournament:
+    """
+    Play a tournament between strategies, over the same shoes.
+
+    The shoes are shuffled once, into shared memory, and the worker
+    processes read them from there. Each strategy plays each shoe until
+    the cut card is reached, and the strategies are ranked by the money
+    that they won.
+
+    :param strategies: The strategies to play, by name, such as compiled
+        strategies. These must be picklable.
+    :param number_of_shoes: The number of shoes for each strategy to play.
+    :param table: The set-up of the table to play at.
+    :param seed: The seed to shuffle the shoes with. Defaults to a random
+        seed, which is recorded on the result so that the tournament can be
+        reproduced.
+    :param workers: The number of processes to use. Defaults to the
+        number of CPUs on the machine.
+
+    :return: The tournament's standings.
+    """
+    if not strategies:
+        raise ValueError("There must be at least one strategy to play")
+    if number_of_shoes < 1:
+        raise ValueError("There must be at least one shoe to play")
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+
+    shoe = np.tile(
+        np.arange(len(deck_.CARDS), dtype=np.uint8),
+        table.number_of_decks,
+    )
+    shape = (number_of_shoes, len(shoe))
+    memory = shared_memory.SharedMemory(
+        create=True, size=shoe.size * number_of_shoes
+    )
+    try:
+        shoes = np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+        shoes[:] = shoe
+        np.random.default_rng(seed).permuted(shoes, axis=1, out=shoes)
+        del shoes
+
+        with concurrent.futures.ProcessPoolExecutor(
+            workers,
+            initializer=_attach,
+            initargs=(memory.name, shape),
+        ) as executor:
+            futures = {
+                name: [
+                    executor.submit(
+                        _play_shoes,
+                        strategy,
+                        table,
+                        start,
+                        min(start + SHOES_PER_TASK, number_of_shoes),
+                        seed,
+                    )
+                    for start in range(0, number_of_shoes, SHOES_PER_TASK)
+                ]
+                for name, strategy in strategies.items()
+            }
+            results = {}
+            nets = {}
+            for name, tasks in futures.items():
+                results[name] = table.new_result()
+                shoe_nets = []
+                for task in tasks:
+                    result, task_nets = task.result()
+                    results[name].merge(result)
+                    shoe_nets.append(task_nets)
+                nets[name] = np.concatenate(shoe_nets)
+    finally:
+        memory.close()
+        memory.unlink()
+
+    ranked = sorted(strategies, key=lambda name: -results[name].net)
+    standings = []
+    for name in ranked:
+        difference = stats.Statistics()
+        difference.add__many(nets[name] - nets[ranked[0]])
+        standings.append(Standing(name, results[name], difference))
+
+    return Tournament(number_of_shoes, seed, standings)
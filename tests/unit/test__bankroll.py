@@ -0,0 +1,218 @@
+"""
+Tests for the ``blackjack.bankroll`` module.
+"""
+
+import numpy as np
+import pytest
+
+from blackjack import bankroll
+
+
+def _profile(mean: float, variance: float = 1.0) -> bankroll.CountProfile:
+    """
+    A profile with the same results at every true count.
+    """
+    return bankroll.CountProfile(
+        true_counts=np.array([-1.0, 0.0, 1.0]),
+        frequencies=np.array([0.25, 0.5, 0.25]),
+        means=np.full(3, mean),
+        variances=np.full(3, variance),
+    )
+
+
+def test__bankrolls__match_the_risk_of_ruin_formula():
+    """
+    The risk of ruin of a flat bet is close to the formula for a random
+    walk, ``exp(-2 * mean * bankroll / variance)``.
+    """
+    result = bankroll.simulate(
+        _profile(0.05),
+        ramp=lambda true_count: 1,
+        bankroll=20,
+        number_of_hands=3_000,
+        number_of_bankrolls=10_000,
+        rng=np.random.default_rng(1),
+    )
+
+    assert result.risk_of_ruin == pytest.approx(np.exp(-2), abs=0.03)
+    assert (result.final_bankroll[result.ruined] == 0).all()
+    assert (result.final_bankroll[~result.ruined] > 0).all()
+    assert 20 <= result.median_hands_to_double < 3_000
+    quantiles = result.drawdown_quantiles((0.5, 0.9))
+    assert 0 < quantiles[0.5] < quantiles[0.9]
+
+
+def test__bankrolls__only_bet_where_the_ramp_bets():
+    """
+    The bet ramp sets the bet at each true count, so a ramp that only bets
+    at a positive count only plays those hands.
+    """
+    profile = bankroll.CountProfile(
+        true_counts=np.array([-1.0, 1.0]),
+        frequencies=np.array([0.5, 0.5]),
+        means=np.array([-1.0, 1.0]),
+        variances=np.zeros(2),
+    )
+    result = bankroll.simulate(
+        profile,
+        ramp=lambda true_count: 2 if true_count > 0 else 0,
+        bankroll=10,
+        number_of_hands=40,
+        number_of_bankrolls=100,
+        rng=np.random.default_rng(1),
+    )
+
+    assert result.risk_of_ruin == 0
+    assert (result.max_drawdown == 0).all()
+    assert (result.final_bankroll > 10).all()
+    assert (result.hands_to_double >= 5).all()
+
+
+def test__bankrolls__are_simulated_in_chunks(monkeypatch: pytest.MonkeyPatch):
+    """
+    Bankrolls are simulated a few hands at a time, carrying their state
+    from one chunk to the next.
+    """
+    monkeypatch.setattr(bankroll, "CHUNK_SIZE", 100)
+    result = bankroll.simulate(
+        _profile(-0.5, variance=0),
+        ramp=lambda true_count: 1,
+        bankroll=10,
+        number_of_hands=100,
+        number_of_bankrolls=10,
+    )
+
+    assert result.ruined.all()
+    assert (result.max_drawdown == 10).all()
+    assert np.isinf(result.hands_to_double).all()
+
+
+@pytest.mark.parametrize(
+    "frequencies, variances",
+    [
+        ([0.5, 0.6], [1, 1]),
+        ([0.5, 0.5], [1, -1]),
+        ([1.0], [1, 1]),
+    ],
+)
+def test__count_profiles__are_validated(
+    frequencies: list[float],
+    variances: list[float],
+):
+    """
+    Count profiles need probabilities and variances for each true count.
+    """
+    with pytest.raises(ValueError):
+        bankroll.CountProfile(
+            true_counts=np.array([0.0, 1.0]),
+            frequencies=np.array(frequencies),
+            means=np.zeros(2),
+            variances=np.array(variances),
+        )
+
+
+@pytest.mark.parametrize(
+    "money, hands, bankrolls",
+    [(0, 10, 10), (10, -1, 10), (10, 10, 0)],
+)
+def test__bankroll_simulations_are_validated(
+    money: float,
+    hands: int,
+    bankrolls: int,
+):
+    """
+    Bankroll simulations need a positive bankroll, a non-negative number
+    of hands and at least one bankroll.
+    """
+    with pytest.raises(ValueError):
+        bankroll.simulate(
+            _profile(0.0),
+            ramp=lambda true_count: 1,
+            bankroll=money,
+            number_of_hands=hands,
+            number_of_bankrolls=bankrolls,
+        )
+
+
+def _counting_profile() -> bankroll.CountProfile:
+    """
+    A profile where the player's edge grows with the true count.
+    """
+    true_counts = np.arange(-3.0, 6.0)
+    frequencies = np.exp(-np.square(true_counts) / 8)
+    return bankroll.CountProfile(
+        true_counts=true_counts,
+        frequencies=frequencies / frequencies.sum(),
+        means=-0.005 + 0.005 * true_counts,
+        variances=np.full(len(true_counts), 1.3),
+    )
+
+
+def test__kelly_ramp__maximises_the_growth_rate():
+    """
+    The Kelly ramp bets the Kelly bet within the table's limits, and grows
+    the bankroll faster than any other ramp within the limits.
+    """
+    profile = _counting_profile()
+    ramp = bankroll.kelly_ramp(
+        profile, bankroll=10_000, min_bet=10, max_bet=100
+    )
+
+    assert ramp(-3) == ramp(-10) == 10
+    assert ramp(1) == 10
+    assert ramp(2) == pytest.approx(10_000 * 0.005 / (1.3 + 0.005**2))
+    assert ramp(2.5) == ramp(2)
+    assert ramp(4) == ramp(5) == 100
+    assert (np.diff(ramp.bets) >= 0).all()
+
+    best = bankroll.growth_rate(profile, ramp, bankroll=10_000)
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        other = bankroll.BetRamp(
+            ramp.true_counts,
+            np.clip(ramp.bets + rng.normal(0, 20, len(ramp.bets)), 10, 100),
+        )
+        assert bankroll.growth_rate(profile, other, bankroll=10_000) <= best
+
+
+def test__kelly_ramp__can_bet_a_fraction_of_kelly():
+    """
+    Fractional Kelly scales the Kelly bets down, within the limits.
+    """
+    profile = _counting_profile()
+    full = bankroll.kelly_ramp(profile, 10_000, min_bet=1, max_bet=1_000)
+    half = bankroll.kelly_ramp(profile, 10_000, 1, 1_000, fraction=0.5)
+
+    positive = profile.means > 0
+    assert half.bets[positive] == pytest.approx(full.bets[positive] / 2)
+    assert (half.bets[~positive] == 1).all()
+
+
+@pytest.mark.parametrize(
+    "money, min_bet, max_bet, fraction",
+    [
+        (0, 10, 100, 1),
+        (1_000, 0, 100, 1),
+        (1_000, 100, 10, 1),
+        (1_000, 10, 100, 0),
+        (1_000, 10, 100, 1.5),
+    ],
+)
+def test__kelly_ramp__is_validated(
+    money: float,
+    min_bet: float,
+    max_bet: float,
+    fraction: float,
+):
+    """
+    The Kelly ramp needs a positive bankroll, valid limits and a fraction
+    of Kelly between 0 and 1.
+    """
+    with pytest.raises(ValueError):
+        bankroll.kelly_ramp(
+            _counting_profile(),
+            money,
+            min_bet,
+            max_bet,
+            fraction,
+        )
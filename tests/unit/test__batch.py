@@ -0,0 +1,144 @@
+"""
+Tests for the ``blackjack.batch`` module.
+"""
+
+import numpy as np
+import pytest
+
+from blackjack import batch, sim, strategy
+
+
+def test__batches__settle_every_hand():
+    """
+    Every hand in a batch is settled, including the hands that are split,
+    and no hand wins or loses more than its stake.
+    """
+    result = batch.simulate(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=2_000,
+        table=sim.Table(number_of_players=3),
+        rng=np.random.default_rng(1),
+    )
+
+    assert result.rounds == 2_000
+    assert result.hands > 6_000
+    assert sum(result.outcomes.values()) == result.hands
+    assert result.staked > 10 * result.hands
+    assert -result.staked <= result.net <= result.staked
+    assert result.per_hand.count == result.hands
+    assert result.per_hand.total == result.net
+
+
+def test__batches__can_be_split_into_smaller_batches(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Simulations are played in batches of at most ``BATCH_SIZE`` hands, and
+    the results of the batches are added up.
+    """
+    monkeypatch.setattr(batch, "BATCH_SIZE", 100)
+    reports = []
+    result = batch.simulate(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=250,
+        rng=np.random.default_rng(1),
+        progress=lambda result: reports.append(result.rounds),
+    )
+
+    assert reports == [100, 200, 250]
+    assert result.rounds == 250
+    assert result.hands >= 250
+    assert sum(result.outcomes.values()) == result.hands
+
+
+def test__batches__count_whole_rounds_for_several_players(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    When the batch size is not a multiple of the number of players, each
+    batch is cut down to whole rounds, and every round is counted once.
+    """
+    monkeypatch.setattr(batch, "BATCH_SIZE", 100)
+    reports = []
+    result = batch.simulate(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=250,
+        table=sim.Table(number_of_players=3),
+        rng=np.random.default_rng(1),
+        progress=lambda result: reports.append(result.rounds),
+    )
+
+    assert reports == [*range(33, 250, 33), 250]
+    assert result.rounds == 250
+    assert result.hands >= 750
+    assert result.per_hand.count == result.hands
+
+
+def test__batches__can_stop_once_precise_enough(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    A batch simulation can stop after any batch once it is precise enough.
+    """
+    monkeypatch.setattr(batch, "BATCH_SIZE", 1_000)
+    result = batch.simulate(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=1_000_000,
+        rng=np.random.default_rng(1),
+        stop=sim.precise_to(0.5),
+    )
+
+    assert result.rounds < 1_000_000
+    assert result.rounds % 1_000 == 0
+    assert result.per_hand.half_width() <= 0.5
+
+
+def test__batches__are_reproducible_with_a_seeded_rng():
+    """
+    Batch simulations with identically seeded random number generators
+    give identical results.
+    """
+    results = [
+        batch.simulate(
+            strategy.BASIC_STRATEGY,
+            number_of_rounds=500,
+            rng=np.random.default_rng(7),
+        )
+        for _ in range(2)
+    ]
+
+    assert results[0] == results[1]
+
+
+def test__batches__agree_with_the_simulation():
+    """
+    The batch simulator plays the same game as ``sim.simulate``, so their
+    returns per hand agree.
+    """
+    table = sim.Table(number_of_decks=6)
+    batched = batch.simulate(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=200_000,
+        table=table,
+        rng=np.random.default_rng(1),
+    )
+    simulated = sim.simulate(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=20_000,
+        table=table,
+        rng=np.random.default_rng(1),
+    )
+
+    # Four standard errors of the (noisier) simulation
+    tolerance = 4 * 1.15 * table.min_bet / np.sqrt(simulated.hands)
+    assert batched.return_per_hand == pytest.approx(
+        simulated.return_per_hand, abs=tolerance
+    )
+
+
+def test__batches__reject_a_negative_number_of_rounds():
+    """
+    Batch simulations need a non-negative number of rounds.
+    """
+    with pytest.raises(ValueError):
+        batch.simulate(strategy.BASIC_STRATEGY, number_of_rounds=-1)
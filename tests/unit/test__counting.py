@@ -0,0 +1,41 @@
+"""
+Tests for the ``blackjack.counting`` module.
+"""
+
+import pytest
+
+from blackjack import counting
+
+
+@pytest.mark.parametrize(
+    "system, balanced, initial_count",
+    [
+        (counting.HI_LO, True, 0),
+        (counting.KO, False, -20),
+        (counting.OMEGA_II, True, 0),
+        (counting.NO_COUNT, True, 0),
+    ],
+)
+def test__counting_systems__start_at_their_initial_count(
+    system: counting.CountingSystem,
+    balanced: bool,
+    initial_count: int,
+):
+    """
+    Balanced systems start at zero, and unbalanced systems start at their
+    initial count for the number of decks.
+    """
+    assert len(system.tags) == 13
+    assert system.balanced is balanced
+    assert system.initial_count(6) == initial_count
+    # KO's count ends at +4 once the whole shoe has been dealt
+    final_count = system.initial_count(6) + 6 * 4 * sum(system.tags)
+    assert final_count == (0 if balanced else 4)
+
+
+def test__counting_systems__need_a_tag_for_each_rank():
+    """
+    Counting systems need a tag for each of the 13 ranks.
+    """
+    with pytest.raises(ValueError):
+        counting.CountingSystem("Too short", (1, -1))
@@ -2,55 +2,62 @@
 Tests for the ``blackjack.deck`` module.
 """
 
+import dataclasses
+import pickle
+
+import numpy as np
 import playing_cards
 import pytest
 
-from blackjack import deck
+from blackjack import counting, deck
 
 
 def test__values__can_be_initialised():
     """
-    Values can be initialised with a set of integers.
+    Values can be initialised with a hard total and whether there is an
+    Ace.
     """
-    value = deck.Values({1, 11})
-    assert value._values == {1, 11}
+    value = deck.Values(1, ace=True)
+    assert value.hard == 1
+    assert value.ace is True
+    assert list(value) == [1, 11]
     assert str(value) == "{1, 11}"
-    assert repr(value) == f"Value(value={value._values})"
-    assert hash(value) == hash(deck.Values({1, 11}))
+    assert repr(value) == "Values(hard=1, ace=True)"
+    assert hash(value) == hash(deck.Values(1, ace=True))
 
 
 def test__values__can_be_compared_for_equality():
     """
     Values can be compared for equality.
     """
-    value_1 = deck.Values({1})
-    value_2 = deck.Values({1})
+    value_1 = deck.Values(1)
+    value_2 = deck.Values(1)
     assert value_1 == value_2
+    assert value_1 != deck.Values(1, ace=True)
     assert (value_1 == "one") is False
 
 
 @pytest.mark.parametrize(
-    "set_1, set_2, expected",
+    "values_1, values_2, expected",
     [
-        ({1}, {2}, True),
-        ({2}, {1}, False),
-        ({3}, {1, 5}, True),
-        ({2}, {1, 3}, True),
-        ({1, 2}, {2, 3}, True),
-        ({1, 3}, {2}, False),
-        ({1, 2, 3}, {4}, True),
+        ((1, False), (2, False), True),
+        ((2, False), (1, False), False),
+        ((3, False), (1, True), True),
+        ((11, False), (2, True), True),
+        ((8, True), (17, False), False),
+        ((22, False), (12, False), False),
     ],
 )
 def test__values__can_be_compared_as_a_total_order(
-    set_1: set[int],
-    set_2: set[int],
+    values_1: tuple[int, bool],
+    values_2: tuple[int, bool],
     expected: bool,
 ):
     """
-    Values can be compared as a total order.
+    Values can be compared as a total order using their best total.
     """
-    value_1 = deck.Values(set_1)
-    value_2 = deck.Values(set_2)
+    value_1 = deck.Values(*values_1)
+    value_2 = deck.Values(*values_2)
     assert (value_1 < value_2) is expected
     assert (value_1 <= value_2) is expected
     assert (value_1 > value_2) is not expected
@@ -58,74 +65,89 @@ def test__values__can_be_compared_as_a_total_order(
 
 
 @pytest.mark.parametrize(
-    "set_1, set_2, result",
+    "values_1, values_2, result",
     [
-        ({1}, {2}, {3}),
-        ({2}, {1}, {3}),
-        ({3}, {1, 5}, {4, 8}),
-        ({2}, {1, 3}, {3, 5}),
-        ({1, 2}, {2, 3}, {3, 4, 5}),
-        ({1, 2, 3}, {4}, {5, 6, 7}),
-        ({10}, {1, 11}, {11, 21}),
-        ({1, 11}, {11, 21}, {12, 22, 32}),
+        ((1, False), (2, False), (3, False)),
+        ((3, False), (1, True), (4, True)),
+        ((10, False), (1, True), (11, True)),
+        ((1, True), (1, True), (2, True)),
+        ((12, True), (10, False), (22, True)),
     ],
 )
 def test__values__can_be_added_together(
-    set_1: set[int],
-    set_2: set[int],
-    result: set[int],
+    values_1: tuple[int, bool],
+    values_2: tuple[int, bool],
+    result: tuple[int, bool],
 ):
     """
     Values can be added together.
     """
-    value_1 = deck.Values(set_1)
-    value_2 = deck.Values(set_2)
-    expected = deck.Values(result)
+    value_1 = deck.Values(*values_1)
+    value_2 = deck.Values(*values_2)
+    expected = deck.Values(*result)
 
     assert value_1 + value_2 == expected
     assert value_2 + value_1 == expected
 
 
+def test__values__can_be_added_to_ints():
+    """
+    Values can be added to integers.
+    """
+    assert deck.Values(1, ace=True) + 10 == deck.Values(11, ace=True)
+    assert 10 + deck.Values(1, ace=True) == deck.Values(11, ace=True)
+
+
 def test__values__cannot_be_added_to_non_numerics():
     """
     Values cannot be added to non-numerics.
     """
     with pytest.raises(TypeError):
-        deck.Values({1}) + "1"  # type: ignore
+        deck.Values(1) + "1"  # type: ignore
 
 
 @pytest.mark.parametrize(
-    "values, eligible_values",
+    "values, total, soft, bust, text",
     [
-        ({1}, {1}),
-        ({1, 11}, {1, 11}),
-        ({30}, set()),
-        ({1, 11, 30}, {1, 11}),
-        ({12, 22, 32}, {12}),
+        ((0, False), 0, False, False, "{0}"),
+        ((1, True), 11, True, False, "{1, 11}"),
+        ((11, True), 21, True, False, "{11, 21}"),
+        ((12, True), 12, False, False, "{12}"),
+        ((17, False), 17, False, False, "{17}"),
+        ((21, False), 21, False, False, "{21}"),
+        ((22, False), 22, False, True, "BUST!"),
+        ((22, True), 22, False, True, "BUST!"),
     ],
 )
-def test__values__has_eligible_values(
-    values: set[int],
-    eligible_values: set[int],
+def test__values__have_a_best_total(
+    values: tuple[int, bool],
+    total: int,
+    soft: bool,
+    bust: bool,
+    text: str,
 ):
     """
-    The eligible values are the values that are lower than or equal to the
-    blackjack value.
+    The best total is the highest total that is not bust, if there is one,
+    and only the totals that are not bust are shown.
     """
-    assert deck.Values(values).eligible_values == deck.Values(eligible_values)
+    value = deck.Values(*values)
+    assert value.total == total
+    assert value.soft is soft
+    assert value.bust is bust
+    assert str(value) == text
 
 
 @pytest.mark.parametrize(
     "card, other, result",
     [
-        (deck.Card.from_id("2S"), deck.Card.from_id("TC"), {12}),
-        (deck.Card.from_id("TC"), deck.Card.from_id("TC"), {20}),
-        (deck.Card.from_id("2S"), 10, {12}),
-        (deck.Card.from_id("TC"), 10, {20}),
+        (deck.Card.from_id("2S"), deck.Card.from_id("TC"), 12),
+        (deck.Card.from_id("TC"), deck.Card.from_id("TC"), 20),
+        (deck.Card.from_id("2S"), 10, 12),
+        (deck.Card.from_id("TC"), 10, 20),
     ],
 )
 def test__card__can_be_added_to_cards_and_ints(
-    card: deck.Card, other: int | deck.Card, result: set[int]
+    card: deck.Card, other: int | deck.Card, result: int
 ):
     """
     Cards can be added to cards and integers.
@@ -146,28 +168,28 @@ def test__card__cannot_be_added_to_non_numerics():
 @pytest.mark.parametrize(
     "rank, values",
     [
-        (playing_cards.Rank.ACE, {1, 11}),
-        (playing_cards.Rank.TWO, {2}),
-        (playing_cards.Rank.THREE, {3}),
-        (playing_cards.Rank.FOUR, {4}),
-        (playing_cards.Rank.FIVE, {5}),
-        (playing_cards.Rank.SIX, {6}),
-        (playing_cards.Rank.SEVEN, {7}),
-        (playing_cards.Rank.EIGHT, {8}),
-        (playing_cards.Rank.NINE, {9}),
-        (playing_cards.Rank.TEN, {10}),
-        (playing_cards.Rank.JACK, {10}),
-        (playing_cards.Rank.QUEEN, {10}),
-        (playing_cards.Rank.KING, {10}),
+        (playing_cards.Rank.ACE, (1, True)),
+        (playing_cards.Rank.TWO, (2, False)),
+        (playing_cards.Rank.THREE, (3, False)),
+        (playing_cards.Rank.FOUR, (4, False)),
+        (playing_cards.Rank.FIVE, (5, False)),
+        (playing_cards.Rank.SIX, (6, False)),
+        (playing_cards.Rank.SEVEN, (7, False)),
+        (playing_cards.Rank.EIGHT, (8, False)),
+        (playing_cards.Rank.NINE, (9, False)),
+        (playing_cards.Rank.TEN, (10, False)),
+        (playing_cards.Rank.JACK, (10, False)),
+        (playing_cards.Rank.QUEEN, (10, False)),
+        (playing_cards.Rank.KING, (10, False)),
     ],
 )
-def test__card__has_values(rank: playing_cards.Rank, values: set[int]):
+def test__card__has_values(rank: playing_cards.Rank, values: tuple[int, bool]):
     """
     Cards have values based on their rank.
     """
     rank: playing_cards.Rank
     suit: playing_cards.Suit
-    expected = deck.Values(values)
+    expected = deck.Values(*values)
     for suit in playing_cards.Suit:
         card = deck.Card(rank, suit)
         assert card.values == expected
@@ -183,3 +205,226 @@ def test__deck__can_be_reset():
 
     deck_.reset()
     assert len(deck_) == 104
+
+
+def test__deck__deals_until_the_cut_card():
+    """
+    The deck needs a reshuffle once the cut card has been reached.
+    """
+    deck_ = deck.Deck(1, penetration=0.5)
+    assert deck_.cut_card == 26
+
+    cards = [deck_.take_card() for _ in range(25)]
+    assert deck_.needs_shuffle is False
+
+    cards.append(deck_.take_card())
+    assert deck_.needs_shuffle is True
+
+    deck_.discard(cards)
+    assert len(deck_.discards) == 26
+
+    deck_.reset()
+    assert len(deck_) == 52
+    assert deck_.discards == []
+    assert deck_.needs_shuffle is False
+
+
+def test__deck__reshuffles_the_discards_when_it_runs_out():
+    """
+    When the deck runs out, the discard pile is shuffled into the deck.
+    """
+    deck_ = deck.Deck(1)
+    deck_.discard([deck_.take_card() for _ in range(52)])
+    assert len(deck_) == 0
+
+    deck_.take_card()
+    assert len(deck_) == 51
+    assert deck_.discards == []
+
+
+def test__deck__resets_when_it_runs_out_without_discards():
+    """
+    When the deck runs out with no discard pile to shuffle in, such as
+    when every card is dealt in one round, the deck is reset.
+    """
+    deck_ = deck.Deck(1, penetration=1.0)
+    [deck_.take_card() for _ in range(52)]
+    assert len(deck_) == 0
+    assert deck_.discards == []
+
+    deck_.take_card()
+    assert len(deck_) == 51
+    assert deck_.composition.sum() == 51
+
+
+@pytest.mark.parametrize("penetration", [0, -0.5, 1.5])
+def test__deck__penetration_must_be_a_fraction(penetration: float):
+    """
+    The penetration must be greater than 0 and no more than 1.
+    """
+    with pytest.raises(ValueError):
+        deck.Deck(1, penetration=penetration)
+
+
+def test__cards__are_shared_immutable_singletons():
+    """
+    There are 52 distinct cards, which are immutable and hashable, and
+    every deck deals the same card objects.
+    """
+    assert len(deck.CARDS) == 52
+    assert len(set(deck.CARDS)) == 52
+    assert [card.code for card in deck.CARDS] == list(range(52))
+    assert deck.CARDS[deck.Card.from_id("TC").code] == deck.Card.from_id("TC")
+
+    card = deck.CARDS[0]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        card.rank = playing_cards.Rank.TWO  # type: ignore
+
+    assert pickle.loads(pickle.dumps(card)) is card  # noqa: S301
+
+    deck_ = deck.Deck(2)
+    assert all(any(card is c for c in deck.CARDS) for card in deck_.cards)
+
+
+def test__deck__takes_cards_in_bulk_as_a_view():
+    """
+    Several cards can be taken at once, as a view onto the deck.
+    """
+    deck_ = deck.Deck(1)
+    expected = deck_.cards[:5]
+
+    codes = deck_.take_cards(5)
+    assert [deck.CARDS[code] for code in codes] == expected
+    assert codes.base is deck_.codes
+    assert len(deck_) == 47
+
+    with pytest.raises(ValueError):
+        deck_.take_cards(48)
+
+
+def test__deck__takes_a_card_by_key():
+    """
+    A specific card can be taken from the deck by its key.
+    """
+    deck_ = deck.Deck(1)
+
+    assert deck_.take_card("QH") == deck.Card.from_id("QH")
+    assert deck.Card.from_id("QH") not in deck_.cards
+    assert len(set(deck_.cards)) == 51
+
+
+def test__deck__keeps_count_of_the_cards_left_of_each_rank():
+    """
+    The deck keeps count of the cards left of each rank as it deals.
+    """
+    deck_ = deck.Deck(2)
+    assert deck_.composition.tolist() == [8] * 13
+    assert deck_.value_counts.tolist() == [8] * 9 + [32]
+
+    deck_.take_card("KH")
+    deck_.take_card("AS")
+    deck_.take_cards(20)
+
+    def recount() -> list[int]:
+        return [
+            sum(card.rank == rank for card in deck_.cards)
+            for rank in playing_cards.Rank
+        ]
+
+    assert deck_.composition.sum() == 82
+    assert deck_.composition.tolist() == recount()
+
+    deck_.discard([deck_.take_card() for _ in range(82)])
+    deck_.take_card()
+    assert deck_.composition.tolist() == recount()
+
+    deck_.reset()
+    assert deck_.composition.tolist() == [8] * 13
+
+
+def test__deck__can_be_restored_to_a_snapshot():
+    """
+    A deck restored to a snapshot deals the same cards again, including
+    after it reshuffles its discards.
+    """
+    deck_ = deck.Deck(1)
+    deck_.discard([deck_.take_card() for _ in range(40)])
+    state = deck_.snapshot()
+    dealt = [deck_.take_card() for _ in range(30)]
+
+    other = deck.Deck(1)
+    for deck__ in (deck_, other):
+        deck__.restore(state)
+        assert [deck__.take_card() for _ in range(30)] == dealt
+        assert deck__.composition.tolist() == deck_.composition.tolist()
+
+
+def test__deck__can_load_a_shuffled_shoe():
+    """
+    A deck can deal from a shoe that was shuffled elsewhere, without
+    changing it, and only a full shoe can be loaded.
+    """
+    shoe = np.random.default_rng(1).permutation(
+        np.repeat(np.arange(52, dtype=np.uint8), 2)
+    )
+    deck_ = deck.Deck(2, counting_system=counting.HI_LO)
+    deck_.discard([deck_.take_card() for _ in range(10)])
+    deck_.load(shoe)
+
+    assert [card.code for card in deck_.cards] == shoe.tolist()
+    assert deck_.composition.tolist() == [8] * 13
+    assert deck_.running_count == 0
+    assert deck_.discards == []
+
+    original = shoe.copy()
+    deck_.take_card(key="AS")
+    assert shoe.tolist() == original.tolist()
+    with pytest.raises(ValueError):
+        deck_.load(shoe[:52])
+
+
+@pytest.mark.parametrize(
+    "system",
+    [counting.HI_LO, counting.KO, counting.OMEGA_II],
+)
+def test__deck__keeps_the_count_of_the_cards_dealt(
+    system: counting.CountingSystem,
+):
+    """
+    The deck keeps the running count of the cards dealt, and the true
+    count per deck left, until it is reset.
+    """
+    deck_ = deck.Deck(2, counting_system=system)
+    initial_count = system.initial_count(2)
+    assert deck_.running_count == initial_count
+
+    dealt = [deck_.take_card() for _ in range(30)]
+    dealt += [deck.CARDS[code] for code in deck_.take_cards(22)]
+
+    running_count = initial_count + sum(
+        system.tags[card.rank - 1] for card in dealt
+    )
+    assert deck_.running_count == running_count
+    assert deck_.true_count == pytest.approx(running_count / 1)
+
+    state = deck_.snapshot()
+    deck_.reset()
+    assert deck_.running_count == initial_count
+    deck_.restore(state)
+    assert deck_.running_count == running_count
+
+
+def test__deck__counts_the_cards_out_of_play_after_reshuffling_the_discards():
+    """
+    When the discards are reshuffled into the deck, the running count is
+    the count of the cards that are still out of play.
+    """
+    deck_ = deck.Deck(1, counting_system=counting.HI_LO)
+    in_play = [deck_.take_card() for _ in range(10)]
+    deck_.discard([deck_.take_card() for _ in range(42)])
+    in_play.append(deck_.take_card())
+
+    assert len(deck_) == 41
+    assert deck_.running_count == sum(
+        counting.HI_LO.tags[card.rank - 1] for card in in_play
+    )
@@ -0,0 +1,101 @@
+"""
+Tests for the ``blackjack.expected_value`` module.
+"""
+
+import pytest
+
+from blackjack import deck, expected_value, participants, probabilities
+
+# Aliases for brevity
+HIT = participants.PlayerOption.HIT
+STAND = participants.PlayerOption.STAND
+DOUBLE_DOWN = participants.PlayerOption.DOUBLE_DOWN
+SPLIT = participants.PlayerOption.SPLIT
+ONLY_TENS = (0, 0, 0, 0, 0, 0, 0, 0, 0, 32)
+
+
+def _hand(*cards: str) -> participants.PlayerHand:
+    hand = participants.PlayerHand(bet=10, from_split=False)
+    hand.cards = [deck.Card.from_id(card) for card in cards]
+    return hand
+
+
+def _six_decks_without(*cards: str) -> list[int]:
+    composition = list(probabilities.full_composition(6))
+    for card in cards:
+        composition[deck.Card.from_id(card).values.hard - 1] -= 1
+    return composition
+
+
+@pytest.mark.parametrize(
+    "cards, dealer_card, expected",
+    [
+        # The dealer always makes 20
+        (["TC", "TD"], "TS", {HIT: -1, STAND: 0, DOUBLE_DOWN: -2, SPLIT: 0}),
+        (["TC", "7D"], "TS", {HIT: -1, STAND: -1, DOUBLE_DOWN: -2}),
+        # The dealer always makes 17
+        (["TC", "9D"], "7S", {HIT: -1, STAND: 1, DOUBLE_DOWN: -2}),
+        # The dealer always makes a Blackjack
+        (["AC", "TD"], "AS", {HIT: -1, STAND: 0, DOUBLE_DOWN: -2}),
+        (["TC", "TD", "AD"], "AS", {HIT: -1, STAND: -1}),
+        # The player is bust
+        (["TC", "TD", "2D"], "7S", {STAND: -1}),
+    ],
+)
+def test__expected_values__follow_the_payouts(
+    cards: list[str],
+    dealer_card: str,
+    expected: dict[participants.PlayerOption, float],
+):
+    """
+    The expected values follow the payouts in the rules when the outcome
+    is certain.
+    """
+    values = expected_value.expected_values(
+        _hand(*cards),
+        deck.Card.from_id(dealer_card),
+        ONLY_TENS,
+    )
+
+    assert values == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "cards, dealer_card, best",
+    [
+        (["TC", "6D"], "TS", HIT),
+        (["TC", "6D"], "6S", STAND),
+        (["5C", "6D"], "6S", DOUBLE_DOWN),
+        (["AC", "7D"], "4S", DOUBLE_DOWN),
+        (["AC", "AD"], "6S", SPLIT),
+        (["9C", "9D"], "7S", STAND),
+    ],
+)
+def test__expected_values__agree_with_basic_strategy(
+    cards: list[str],
+    dealer_card: str,
+    best: participants.PlayerOption,
+):
+    """
+    The option with the highest expected value in a full six-deck shoe is
+    the basic strategy option.
+    """
+    values = expected_value.expected_values(
+        _hand(*cards),
+        deck.Card.from_id(dealer_card),
+        _six_decks_without(*cards, dealer_card),
+    )
+
+    assert max(values, key=values.__getitem__) == best
+
+
+def test__expected_values__need_a_count_for_each_card_value():
+    """
+    The composition needs a count for each card value.
+    """
+    with pytest.raises(ValueError):
+        expected_value.expected_values(
+            _hand("TC", "6D"),
+            deck.Card.from_id("TS"),
+            (1, 2, 3),
+        )
@@ -91,3 +91,69 @@ def test__game__round_can_be_played(mock_game: game.Game):
     A round of Blackjack can be played.
     """
     mock_game.play_round()
+
+
+def test__game__round_can_be_played_by_a_strategy(mock_game: game.Game):
+    """
+    A round of Blackjack can be played by a strategy, with every update
+    sent to the reporter.
+    """
+
+    class MockReporter(game.Reporter):
+        def __init__(self) -> None:
+            self.outcomes = []
+
+        def hand_settled(self, player, hand, outcome) -> None:
+            self.outcomes.append(outcome)
+
+    def always_stand(
+        hand, dealer_card, options, deck_
+    ) -> participants.PlayerOption:
+        return participants.PlayerOption.STAND
+
+    reporter = MockReporter()
+    mock_game.play_round(always_stand, reporter)
+
+    assert mock_game.round == 1
+    assert len(reporter.outcomes) == 6
+    assert all(len(player.hands[0]) == 2 for player in mock_game.players)
+    assert len(mock_game.dealer.hand) >= 2
+
+
+def test__game__reset_round_discards_the_cards_and_keeps_the_shoe(
+    mock_game: game.Game,
+):
+    """
+    Resetting a round puts the round's cards on the discard pile and keeps
+    dealing from the same shoe until the cut card is reached.
+    """
+    mock_game.players[0].add_hand(bet=10).deal(mock_game.deck)
+    mock_game.dealer.hand.deal(mock_game.deck)
+    assert len(mock_game.deck) == 52 * 6 - 4
+
+    mock_game.round = 3
+    mock_game.reset_round()
+    assert mock_game.round == 3
+    assert len(mock_game.deck) == 52 * 6 - 4
+    assert len(mock_game.deck.discards) == 4
+    assert mock_game.dealer.hand.cards == []
+    assert all(player.hands == [] for player in mock_game.players)
+
+    while not mock_game.deck.needs_shuffle:
+        mock_game.deck.take_card()
+    mock_game.reset_round()
+    assert len(mock_game.deck) == 52 * 6
+    assert mock_game.deck.discards == []
+
+
+def test__game__reset_round_can_load_a_new_shoe(mock_game: game.Game):
+    """
+    Resetting a round with a shoe deals the next round from that shoe.
+    """
+    shoe = mock_game.deck.snapshot().codes[::-1].copy()
+    mock_game.players[0].add_hand(bet=10).deal(mock_game.deck)
+
+    mock_game.reset_round(shoe)
+    assert mock_game.deck.codes.tolist() == shoe.tolist()
+    assert len(mock_game.deck) == 52 * 6
+    assert all(player.hands == [] for player in mock_game.players)
@@ -61,26 +61,27 @@ def test__hand__get_card_by_position(mock_hand: participants.Hand):
 
 
 @pytest.mark.parametrize(
-    "cards, values, eligible_values",
+    "cards, values, total",
     [
-        ([], {0}, {0}),
-        (["2S", "TC"], {12}, {12}),
-        (["TC", "AC"], {11, 21}, {11, 21}),
-        (["TC", "TD", "2C"], {22}, set()),
-        (["9D", "7H", "AS"], {17, 27}, set()),
+        ([], (0, False), 0),
+        (["2S", "TC"], (12, False), 12),
+        (["TC", "AC"], (11, True), 21),
+        (["TC", "TD", "2C"], (22, False), 22),
+        (["9D", "7H", "AS"], (17, True), 17),
     ],
 )
-def test__hand__has_values_and_eligible_values(
+def test__hand__has_values_and_a_best_total(
     mock_hand: participants.Hand,
     cards: list[str],
-    values: set[int],
-    eligible_values: set[int],
+    values: tuple[int, bool],
+    total: int,
 ):
     """
-    Hands have values and eligible values.
+    Hands have values and a best total.
     """
     mock_hand.cards = [deck.Card.from_id(card) for card in cards]
-    assert mock_hand.values == deck.Values(values)
+    assert mock_hand.values == deck.Values(*values)
+    assert mock_hand.values.total == total
 
 
 @pytest.mark.parametrize(
@@ -206,6 +207,42 @@ def test__hand__can_be_shown(
     )
 
 
+def test__hand__values_are_kept_up_to_date(mock_game: game.Game):
+    """
+    The values of a hand are kept up to date as cards are added, replaced,
+    and split off.
+    """
+    player = participants.Player("Mock Player", 500)
+    player_hand = player.add_hand(bet=10)
+    player_hand.deal(mock_game.deck, ["8C", "8D"])
+    assert player_hand.values == deck.Values(16)
+
+    player_hand.split(mock_game.deck, player)
+    hand_0, hand_1 = player.hands
+    assert hand_0.values == sum(card.values for card in hand_0.cards)
+    assert hand_1.values == sum(card.values for card in hand_1.cards)
+
+    hand_0.cards = [deck.Card.from_id("AC")]
+    assert hand_0.values == deck.Values(1, ace=True)
+    hand_0.hit(mock_game.deck, "TC")
+    assert hand_0.blackjack is True
+
+
+def test__participants__use_slots():
+    """
+    Hands, dealers, and players are slot-based, so they cannot have new
+    attributes added to them.
+    """
+    for participant in [
+        participants.Hand(bet=10),
+        participants.PlayerHand(bet=10, from_split=False),
+        participants.Dealer(),
+        participants.Player("Mock Player", 500),
+    ]:
+        with pytest.raises(AttributeError):
+            participant.nickname = "Mock"
+
+
 def test__player_hand__can_be_initialised():
     """
     Player hands can be initialised with a bet and no cards.
@@ -0,0 +1,108 @@
+"""
+Tests for the ``blackjack.probabilities`` module.
+"""
+
+import numpy as np
+import pytest
+
+from blackjack import deck, participants, probabilities, rules
+
+SIX_DECKS = probabilities.full_composition(6)
+
+
+def test__dealer_results__sum_to_one_for_every_upcard():
+    """
+    The dealer's results are a probability distribution for each upcard.
+    """
+    results = probabilities.dealer_results__by_upcard(SIX_DECKS)
+
+    assert results.shape == (10, probabilities.NUMBER_OF_RESULTS)
+    assert results.sum(axis=1) == pytest.approx(np.ones(10))
+
+
+@pytest.mark.parametrize(
+    "upcard, blackjack",
+    [
+        (1, 96 / 311),
+        (10, 24 / 311),
+        (7, 0),
+    ],
+)
+def test__dealer_results__count_blackjack_separately(
+    upcard: int,
+    blackjack: float,
+):
+    """
+    A Blackjack is only made by the hole card, and is counted separately
+    from other totals of 21.
+    """
+    results = probabilities.dealer_results__by_upcard(SIX_DECKS)[upcard - 1]
+
+    assert results[probabilities.BLACKJACK] == pytest.approx(blackjack)
+
+
+def test__dealer_results__follow_the_composition():
+    """
+    The results follow from the cards left in the shoe.
+    """
+    only_sevens = (0, 0, 0, 0, 0, 0, 8, 0, 0, 0)
+    only_sixes = (0, 0, 0, 0, 0, 8, 0, 0, 0, 0)
+
+    assert probabilities.dealer_results(10, only_sevens).tolist() == [
+        1, 0, 0, 0, 0, 0, 0,
+    ]  # fmt: skip
+    assert probabilities.dealer_results(6, only_sixes).tolist() == [
+        0, 1, 0, 0, 0, 0, 0,
+    ]  # fmt: skip
+    # A soft 17 stands
+    assert probabilities.dealer_results(1, only_sixes)[0] == 1
+
+
+@pytest.mark.parametrize(
+    "composition",
+    [
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        (1, 1, 1),
+        (-1, 4, 4, 4, 4, 4, 4, 4, 4, 16),
+    ],
+)
+def test__dealer_results__need_a_valid_composition(composition: tuple[int]):
+    """
+    The composition needs a non-negative count for each value, and cards
+    for the dealer to draw.
+    """
+    with pytest.raises(ValueError):
+        probabilities.dealer_results(10, composition)
+
+    with pytest.raises(ValueError):
+        probabilities.dealer_results(2, (0, 0, 0, 0, 0, 0, 0, 0, 1, 0))
+
+
+def test__dealer_results__match_the_dealers_play():
+    """
+    The calculated results match the results of the dealer playing by
+    ``rules.play_hand__dealer``.
+    """
+    rng = np.random.default_rng(7)
+    deck_ = deck.Deck(6, rng)
+    upcard = deck.Card.from_id("6H")
+    composition = list(probabilities.full_composition(6))
+    composition[5] -= 1
+
+    counts = np.zeros(probabilities.NUMBER_OF_RESULTS)
+    for _ in range(20_000):
+        deck_.reset()
+        deck_.take_card("6H")
+        hand = participants.Hand(bet=None)
+        hand.cards = [upcard]
+        hand.hit(deck_)
+        rules.play_hand__dealer(hand, deck_)
+        if hand.bust:
+            counts[probabilities.BUST] += 1
+        elif hand.blackjack:
+            counts[probabilities.BLACKJACK] += 1
+        else:
+            counts[hand.values.total - 17] += 1
+
+    expected = probabilities.dealer_results(6, composition)
+    assert counts / counts.sum() == pytest.approx(expected, abs=0.01)
@@ -14,6 +14,22 @@ SPLIT = participants.PlayerOption.SPLIT
 TAKE_INSURANCE = participants.PlayerOption.TAKE_INSURANCE
 
 
+def always_hit(hand, dealer_card, options, deck_) -> participants.PlayerOption:
+    """
+    A strategy that always hits.
+    """
+    return HIT
+
+
+def always_split(
+    hand, dealer_card, options, deck_
+) -> participants.PlayerOption:
+    """
+    A strategy that always splits, even when it is not allowed to.
+    """
+    return SPLIT
+
+
 def test__dealer_hand_can_be_played():
     """
     The dealer's hand can be played.
@@ -32,6 +48,23 @@ def test__dealer_hand_can_be_played():
     assert max(dealer.hand.values) >= 17
 
 
+def test__dealer_hand_keeps_hitting_a_hard_total_after_a_soft_total():
+    """
+    The dealer keeps hitting when an Ace has to go back to counting as 1.
+    """
+    game_ = game.Game(min_bet=10)
+    game_.add_deck(1)
+    dealer = game_.add_dealer()
+    dealer.hand.cards = [
+        deck.Card.from_id("5C"),
+        deck.Card.from_id("AC"),
+        deck.Card.from_id("6D"),
+    ]
+    rules.play_hand__dealer(dealer.hand, game_.deck)
+    assert len(dealer.hand) >= 4
+    assert dealer.hand.values.total >= 17
+
+
 @pytest.mark.skip("Not implemented")
 def test__player_hand_can_be_played(
     mock_game: game.Game,
@@ -48,6 +81,50 @@ def test__player_hand_can_be_played(
     )
 
 
+def test__player_hand_can_be_played_by_a_strategy(
+    mock_game: game.Game,
+    mock_player: participants.Player,
+):
+    """
+    A player hand can be played to completion by a strategy.
+    """
+    player_hand = mock_player.add_hand(bet=10)
+    player_hand.deal(mock_game.deck, ["2C", "3D"])
+    mock_game.dealer.hand.deal(mock_game.deck, ["TS", "7S"])
+
+    rules.play_hand__player(
+        player_hand,
+        mock_game.dealer.hand,
+        mock_player,
+        mock_game.deck,
+        always_hit,
+    )
+    assert player_hand.playing is False
+    assert player_hand.bust
+
+
+def test__player_hand_strategy_cannot_choose_an_unavailable_option(
+    mock_game: game.Game,
+    mock_player: participants.Player,
+):
+    """
+    A strategy that chooses an option that is not available raises an
+    error.
+    """
+    player_hand = mock_player.add_hand(bet=10)
+    player_hand.deal(mock_game.deck, ["2C", "3D"])
+    mock_game.dealer.hand.deal(mock_game.deck, ["TS", "7S"])
+
+    with pytest.raises(ValueError):
+        rules.play_hand__player(
+            player_hand,
+            mock_game.dealer.hand,
+            mock_player,
+            mock_game.deck,
+            always_split,
+        )
+
+
 @pytest.mark.parametrize(
     "option, is_playing, number_of_hands, number_of_cards",
     [
@@ -85,6 +162,26 @@ def test__player_hand_can_take_an_action(
     assert len(player_hand) == number_of_cards
 
 
+def test__player_hand_doubles_its_bet_when_doubling_down(
+    mock_game: game.Game,
+    mock_player: participants.Player,
+):
+    """
+    Doubling down doubles the hand's bet, so the outcome is applied to
+    twice the stake.
+    """
+    player_hand = mock_player.add_hand(bet=10)
+    player_hand.deal(mock_game.deck, ["5C", "6D"])
+
+    rules.action(player_hand, DOUBLE_DOWN, mock_player, mock_game.deck)
+    assert player_hand.bet == 20
+
+    rules.apply_outcome(
+        mock_player, participants.HandOutcome.WIN, player_hand.bet
+    )
+    assert mock_player.money == 520
+
+
 @pytest.mark.parametrize(
     "dealer_has_ace, cards, options",
     [
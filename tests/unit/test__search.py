@@ -0,0 +1,121 @@
+"""
+Tests for the ``blackjack.search`` module.
+"""
+
+import numpy as np
+import pytest
+
+from blackjack import search, strategy
+
+
+def _always_stand() -> strategy.Strategy:
+    """
+    A poor strategy that always stands and never splits, to improve on.
+    """
+    text = strategy.dumps(strategy.BASIC_STRATEGY)
+    header, *rows = text.splitlines()
+    cells = []
+    for row in [header, *rows]:
+        label = row.split(",")[0]
+        if label in strategy.SECTIONS:
+            cells.append(row)
+            pair = label == "pairs"
+        else:
+            cells.append(",".join([label, *["-" if pair else "s"] * 10]))
+    return strategy.parse("\n".join(cells))
+
+
+def test__search__improves_on_a_poor_strategy():
+    """
+    Each generation keeps the best strategies so far, so the best fitness
+    never gets worse, and evolving a poor strategy improves on it.
+    """
+    generations = []
+    result = search.evolve(
+        _always_stand(),
+        generations=5,
+        population=12,
+        survivors=3,
+        mutation_rate=0.1,
+        number_of_rounds=5_000,
+        seed=1,
+        workers=2,
+        progress=lambda generation, best: generations.append(generation),
+    )
+
+    assert generations == [1, 2, 3, 4, 5]
+    assert len(result.history) == 6
+    assert result.history == sorted(result.history)
+    assert result.history[-1] > result.history[0]
+    assert result.best.fitness == result.history[-1]
+
+
+def test__search__does_not_simulate_a_strategy_twice():
+    """
+    The fitness of a strategy that has already been scored comes from the
+    cache, rather than simulating it again.
+    """
+    result = search.evolve(
+        strategy.BASIC_STRATEGY,
+        generations=3,
+        population=5,
+        survivors=1,
+        mutation_rate=0,
+        number_of_rounds=1_000,
+        seed=1,
+        workers=1,
+    )
+
+    assert result.evaluations == 1
+    assert result.cache_hits == 3 * 4
+    assert result.best.strategy.fingerprint() == (
+        strategy.BASIC_STRATEGY.fingerprint()
+    )
+
+
+def test__search__is_reproducible_with_a_seed():
+    """
+    Searches with the same seed find the same strategy, however many
+    workers are used.
+    """
+    results = [
+        search.evolve(
+            strategy.BASIC_STRATEGY,
+            generations=2,
+            population=6,
+            survivors=2,
+            number_of_rounds=1_000,
+            seed=7,
+            workers=workers,
+        )
+        for workers in [1, 3]
+    ]
+
+    assert results[0].history == results[1].history
+    assert np.array_equal(
+        results[0].best.strategy.table, results[1].best.strategy.table
+    )
+
+
+@pytest.mark.parametrize(
+    "generations, population, survivors, number_of_rounds",
+    [(-1, 4, 2, 100), (1, 4, 2, 0), (1, 4, 0, 100), (1, 4, 4, 100)],
+)
+def test__search__is_validated(
+    generations: int,
+    population: int,
+    survivors: int,
+    number_of_rounds: int,
+):
+    """
+    A search needs a non-negative number of generations, fewer survivors
+    than its population, and some rounds to score each strategy with.
+    """
+    with pytest.raises(ValueError):
+        search.evolve(
+            strategy.BASIC_STRATEGY,
+            generations,
+            population=population,
+            survivors=survivors,
+            number_of_rounds=number_of_rounds,
+        )
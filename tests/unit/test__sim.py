@@ -0,0 +1,458 @@
+"""
+Tests for the ``blackjack.sim`` module.
+"""
+
+import collections
+import concurrent.futures
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from blackjack import counting, deck, game, participants, sim, strategy
+
+# Aliases for brevity
+HIT = participants.PlayerOption.HIT
+STAND = participants.PlayerOption.STAND
+
+
+def always_stand(
+    hand, dealer_card, options, deck_
+) -> participants.PlayerOption:
+    """
+    A strategy that always stands.
+    """
+    return STAND
+
+
+@pytest.mark.parametrize(
+    "cards, option",
+    [
+        (["TC", "6D"], HIT),
+        (["TC", "7D"], STAND),
+        (["AC", "6D"], STAND),
+        (["AC", "5D"], HIT),
+    ],
+)
+def test__mimic_the_dealer__hits_below_17(
+    mock_game: game.Game,
+    cards: list[str],
+    option: participants.PlayerOption,
+):
+    """
+    The dealer-mimicking strategy hits on 16 or less and stands otherwise.
+    """
+    player_hand = participants.PlayerHand(bet=10, from_split=False)
+    player_hand.cards = [deck.Card.from_id(card) for card in cards]
+
+    decision = sim.mimic_the_dealer(
+        player_hand,
+        deck.Card.from_id("TS"),
+        [HIT, STAND],
+        mock_game.deck,
+    )
+    assert decision == option
+
+
+def test__round_can_be_played_without_input(mock_game: game.Game):
+    """
+    A round can be played by strategies alone, and the outcome of every
+    hand is recorded.
+    """
+    result = sim.SimulationResult()
+    sim.play_round(mock_game, always_stand, result)
+
+    assert mock_game.round == 1
+    assert result.rounds == 1
+    assert result.hands == 6
+    assert result.staked == 60
+    assert sum(result.outcomes.values()) == 6
+    assert all(len(player.hands[0]) == 2 for player in mock_game.players)
+
+
+def test__simulation_results_can_be_merged():
+    """
+    The results of two simulations can be merged.
+    """
+    result_1 = sim.SimulationResult(
+        rounds=1,
+        hands=2,
+        staked=20,
+        net=10,
+        outcomes=collections.Counter({participants.HandOutcome.WIN: 2}),
+    )
+    result_2 = sim.SimulationResult(
+        rounds=1,
+        hands=1,
+        staked=10,
+        net=-10,
+        outcomes=collections.Counter({participants.HandOutcome.LOSE: 1}),
+    )
+    result_1.merge(result_2)
+
+    assert result_1.rounds == 2
+    assert result_1.hands == 3
+    assert result_1.staked == 30
+    assert result_1.net == 0
+    assert result_1.return_per_hand == 0
+    assert sim.SimulationResult().return_per_hand == 0
+    assert result_1.outcomes == {
+        participants.HandOutcome.WIN: 2,
+        participants.HandOutcome.LOSE: 1,
+    }
+    assert result_1.per_hand == sim.SimulationResult().per_hand
+
+
+def test__rounds_can_be_simulated():
+    """
+    Many rounds can be simulated without any input.
+    """
+    result = sim.simulate(
+        sim.mimic_the_dealer,
+        number_of_rounds=500,
+        table=sim.Table(number_of_players=2),
+    )
+
+    assert result.rounds == 500
+    assert result.hands >= 1000
+    assert sum(result.outcomes.values()) == result.hands
+    assert -result.staked <= result.net <= result.staked
+
+
+def test__simulations_keep_statistics_of_each_hand(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Simulations keep running statistics of the amount won on each hand,
+    and report their progress as they run.
+    """
+    monkeypatch.setattr(sim, "PROGRESS_INTERVAL", 100)
+    reports = []
+    result = sim.simulate(
+        sim.mimic_the_dealer,
+        number_of_rounds=300,
+        rng=np.random.default_rng(1),
+        progress=lambda result: reports.append(result.rounds),
+    )
+
+    assert reports == [100, 200, 300]
+    assert result.per_hand.count == result.hands
+    assert result.per_hand.total == result.net
+    assert result.per_hand.mean == pytest.approx(result.return_per_hand)
+    assert result.per_hand.lowest_total <= min(0, result.net)
+    assert result.per_hand.highest_total >= max(0, result.net)
+
+
+def test__counting_simulations_keep_statistics_of_each_true_count():
+    """
+    At a counted table, the amount won on each hand is also kept by the
+    true count when the bet was placed, per minimum bet.
+    """
+    table = sim.Table(counting_system=counting.HI_LO)
+    result = sim.simulate(
+        sim.mimic_the_dealer,
+        number_of_rounds=2_000,
+        table=table,
+        rng=np.random.default_rng(1),
+    )
+
+    assert (
+        sim.simulate(sim.mimic_the_dealer, number_of_rounds=10).by_count is None
+    )
+    assert sum(result.by_count.hands) == result.hands
+    assert (
+        result.by_count.hands @ result.by_count.means * table.min_bet
+        == pytest.approx(result.net)
+    )
+    # Hands are most often played near a true count of zero
+    profile = result.by_count.profile()
+    assert profile.true_counts[profile.frequencies.argmax()] in {-1, 0}
+
+
+def test__simulations_can_stop_once_precise_enough():
+    """
+    A simulation can stop early once the confidence interval of its
+    return per hand is narrow enough.
+    """
+    result = sim.simulate(
+        sim.mimic_the_dealer,
+        number_of_rounds=100_000,
+        rng=np.random.default_rng(1),
+        stop=sim.precise_to(1.0),
+    )
+
+    assert sim.MIN_HANDS_TO_STOP <= result.rounds < 100_000
+    assert result.rounds % sim.STOP_INTERVAL == 0
+    assert result.per_hand.half_width() <= 1.0
+
+
+@pytest.mark.parametrize(
+    "half_width, confidence",
+    [(0, 0.95), (-1, 0.95), (1, 0), (1, 1)],
+)
+def test__stopping_rules_are_validated(half_width: float, confidence: float):
+    """
+    Stopping rules need a positive half-width and a confidence between 0
+    and 1.
+    """
+    with pytest.raises(ValueError):
+        sim.precise_to(half_width, confidence)
+
+
+def test__simulations_are_reproducible_with_a_seeded_rng():
+    """
+    Simulations with identically seeded random number generators give
+    identical results.
+    """
+    rng_1 = np.random.default_rng(1)
+    rng_2 = np.random.default_rng(1)
+    result_1 = sim.simulate(sim.mimic_the_dealer, 200, rng=rng_1)
+    result_2 = sim.simulate(sim.mimic_the_dealer, 200, rng=rng_2)
+
+    assert result_1 == result_2
+
+
+def test__strategies_can_be_compared_on_the_same_cards():
+    """
+    Strategies compared on the same cards are dealt the same cards, so the
+    same strategy always has the same result.
+    """
+    comparison = sim.compare(
+        [sim.mimic_the_dealer, sim.mimic_the_dealer, always_stand],
+        number_of_rounds=300,
+        rng=np.random.default_rng(1),
+    )
+    same, other = comparison.differences[1:]
+
+    assert comparison.results[0] == comparison.results[1]
+    assert same.count == 300
+    assert same.total == same.sum_of_squares == 0
+    assert other.total == comparison.results[2].net - comparison.results[0].net
+    assert other.variance > 0
+
+
+def test__comparisons_need_a_strategy():
+    """
+    Comparisons need at least one strategy.
+    """
+    with pytest.raises(ValueError):
+        sim.compare([], number_of_rounds=10)
+
+
+def test__simulations_can_resume_from_a_checkpoint(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    """
+    A simulation that stops part way through resumes from its last
+    checkpoint, and plays the same rounds as one that did not stop.
+    """
+    monkeypatch.setattr(sim, "CHECKPOINT_INTERVAL", 100)
+    expected = sim.simulate__resumable(
+        sim.mimic_the_dealer,
+        number_of_rounds=300,
+        path=tmp_path / "expected.pkl",
+        rng=np.random.default_rng(1),
+    )
+
+    rounds = 0
+    play_round = sim.play_round
+
+    def stops_part_way(*args: object) -> None:
+        nonlocal rounds
+        rounds += 1
+        if rounds > 250:
+            raise KeyboardInterrupt
+        play_round(*args)
+
+    path = tmp_path / "checkpoint.pkl"
+    with monkeypatch.context() as patch, pytest.raises(KeyboardInterrupt):
+        patch.setattr(sim, "play_round", stops_part_way)
+        sim.simulate__resumable(
+            sim.mimic_the_dealer,
+            number_of_rounds=300,
+            path=path,
+            rng=np.random.default_rng(1),
+        )
+    result = sim.simulate__resumable(
+        sim.mimic_the_dealer,
+        number_of_rounds=300,
+        path=path,
+    )
+
+    assert result == expected
+    assert not list(tmp_path.glob("*.tmp"))
+    with pytest.raises(ValueError):
+        sim.simulate__resumable(
+            sim.mimic_the_dealer,
+            number_of_rounds=400,
+            path=path,
+        )
+
+
+def test__simulations_only_resume_the_same_simulation(tmp_path):
+    """
+    A checkpoint is only resumed by a simulation of the same number of
+    rounds, with the same strategy, at the same table.
+    """
+    path = tmp_path / "checkpoint.pkl"
+    sim.simulate__resumable(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=50,
+        path=path,
+        rng=np.random.default_rng(1),
+    )
+
+    resumed = sim.simulate__resumable(
+        strategy.BASIC_STRATEGY,
+        number_of_rounds=50,
+        path=path,
+    )
+    assert resumed.rounds == 50
+    for strategy_, table in [
+        (sim.mimic_the_dealer, sim.STANDARD_TABLE),
+        (
+            strategy.BASIC_STRATEGY.mutate(np.random.default_rng(1), 1.0),
+            sim.STANDARD_TABLE,
+        ),
+        (strategy.BASIC_STRATEGY, sim.Table(number_of_decks=2)),
+    ]:
+        with pytest.raises(ValueError):
+            sim.simulate__resumable(
+                strategy_,
+                number_of_rounds=50,
+                path=path,
+                table=table,
+            )
+
+
+@pytest.fixture
+def small_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Split parallel simulations into shards of 20 rounds.
+    """
+    monkeypatch.setattr(sim, "SHARD_SIZE", 20)
+
+
+@pytest.mark.usefixtures("small_shards")
+def test__parallel_simulations_do_not_depend_on_the_number_of_workers():
+    """
+    Parallel simulations with the same seed give the same result however
+    many workers are used.
+    """
+    results = [
+        sim.simulate__parallel(
+            sim.mimic_the_dealer,
+            number_of_rounds=110,
+            seed=42,
+            workers=workers,
+        )
+        for workers in [1, 3]
+    ]
+
+    assert results[0].rounds == 110
+    assert results[0] == results[1]
+
+
+@pytest.mark.usefixtures("small_shards")
+def test__parallel_counting_simulations_merge_the_true_counts():
+    """
+    The statistics of each true count are merged across the shards.
+    """
+    result = sim.simulate__parallel(
+        sim.mimic_the_dealer,
+        number_of_rounds=50,
+        table=sim.Table(counting_system=counting.HI_LO),
+        seed=42,
+        workers=2,
+    )
+
+    assert sum(result.by_count.hands) == result.hands
+
+
+@pytest.mark.usefixtures("small_shards")
+def test__parallel_simulations_can_stop_once_precise_enough():
+    """
+    A parallel simulation stops merging shards once it is precise enough,
+    and stops at the same shard however many workers are used.
+    """
+    results = [
+        sim.simulate__parallel(
+            sim.mimic_the_dealer,
+            number_of_rounds=2_000,
+            seed=42,
+            workers=workers,
+            stop=lambda result: result.rounds >= 50,
+        )
+        for workers in [1, 2]
+    ]
+
+    assert results[0].rounds == 60
+    assert results[0] == results[1]
+
+
+@pytest.mark.usefixtures("small_shards")
+def test__parallel_simulations_submit_a_shard_per_worker_at_a_time(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    A parallel simulation only keeps a shard for each worker in flight, so
+    it stops within a shard per worker of being precise enough.
+    """
+    submitted = []
+
+    class Executor(concurrent.futures.ThreadPoolExecutor):
+        def submit(
+            self,
+            fn: Callable[..., sim.SimulationResult],
+            /,
+            *args: object,
+        ) -> concurrent.futures.Future[sim.SimulationResult]:
+            submitted.append(args[-1])
+            return super().submit(fn, *args)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", Executor)
+    result = sim.simulate__parallel(
+        sim.mimic_the_dealer,
+        number_of_rounds=2_000,
+        seed=42,
+        workers=2,
+        stop=lambda result: result.rounds >= 50,
+    )
+
+    assert result.rounds == 60
+    assert submitted == [0, 1, 2, 3]
+
+
+@pytest.mark.usefixtures("small_shards")
+def test__unseeded_parallel_simulations_record_their_seed():
+    """
+    A parallel simulation without a seed records the seed it chose, which
+    reproduces the simulation.
+    """
+    result = sim.simulate__parallel(
+        sim.mimic_the_dealer,
+        number_of_rounds=50,
+        workers=1,
+    )
+    rerun = sim.simulate__parallel(
+        sim.mimic_the_dealer,
+        number_of_rounds=50,
+        seed=result.seed,
+        workers=1,
+    )
+
+    assert result.seed is not None
+    assert rerun == result
+
+
+def test__parallel_simulations_reject_a_negative_number_of_rounds():
+    """
+    Parallel simulations need a non-negative number of rounds.
+    """
+    with pytest.raises(ValueError):
+        sim.simulate__parallel(
+            sim.mimic_the_dealer,
+            number_of_rounds=-1,
+            seed=1,
+        )
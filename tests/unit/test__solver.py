@@ -0,0 +1,153 @@
+"""
+Tests for the ``blackjack.solver`` module.
+"""
+
+import pytest
+
+from blackjack import (
+    deck,
+    expected_value,
+    participants,
+    probabilities,
+    solver,
+    strategy,
+)
+
+# Aliases for brevity
+HIT = participants.PlayerOption.HIT
+STAND = participants.PlayerOption.STAND
+DOUBLE_DOWN = participants.PlayerOption.DOUBLE_DOWN
+SPLIT = participants.PlayerOption.SPLIT
+
+
+@pytest.fixture(scope="module")
+def six_deck_strategy() -> strategy.Strategy:
+    """
+    The basic strategy for six decks.
+    """
+    return solver.solve(6)
+
+
+@pytest.mark.parametrize(
+    "cards, dealer_card, expected",
+    [
+        (["TC", "6D"], "TS", HIT),
+        (["TC", "2D"], "4S", STAND),
+        (["5C", "6D"], "6S", DOUBLE_DOWN),
+        (["AC", "7D"], "4S", DOUBLE_DOWN),
+        (["AC", "7D"], "9S", HIT),
+        (["AC", "2D"], "5S", DOUBLE_DOWN),
+        (["AC", "AD"], "6S", SPLIT),
+        (["TC", "TD"], "6S", STAND),
+        # Dealer Blackjacks are not checked for until the end of the round,
+        # so the player loses everything they've added to the bet
+        (["5C", "6D"], "TS", HIT),
+        (["8C", "8D"], "TS", HIT),
+    ],
+)
+def test__solved_strategy__plays_basic_strategy(
+    six_deck_strategy: strategy.Strategy,
+    cards: list[str],
+    dealer_card: str,
+    expected: participants.PlayerOption,
+):
+    """
+    The solved strategy plays basic strategy for the rules.
+    """
+    hand = participants.PlayerHand(bet=10, from_split=False)
+    hand.cards = [deck.Card.from_id(card) for card in cards]
+    options = [HIT, STAND, DOUBLE_DOWN]
+    if hand[0].rank == hand[1].rank:
+        options.append(SPLIT)
+
+    decision = six_deck_strategy(
+        hand,
+        deck.Card.from_id(dealer_card),
+        options,
+        deck.Deck(1),
+    )
+    assert decision == expected
+
+
+@pytest.mark.parametrize(
+    "cards",
+    [["TC", "6D"], ["9C", "3D"], ["AC", "6D"], ["4C", "4D"], ["9C", "9D"]],
+)
+@pytest.mark.parametrize("dealer_card", ["6S", "TS"])
+def test__solved_strategy__is_close_to_the_exact_best_option(
+    six_deck_strategy: strategy.Strategy,
+    cards: list[str],
+    dealer_card: str,
+):
+    """
+    The solved strategy's options are the best options, or close to them,
+    when the exact cards in the shoe are taken into account.
+    """
+    hand = participants.PlayerHand(bet=10, from_split=False)
+    hand.cards = [deck.Card.from_id(card) for card in cards]
+    composition = list(probabilities.full_composition(6))
+    for card in [*cards, dealer_card]:
+        composition[deck.Card.from_id(card).values.hard - 1] -= 1
+
+    values = expected_value.expected_values(
+        hand,
+        deck.Card.from_id(dealer_card),
+        composition,
+    )
+    decision = six_deck_strategy(
+        hand,
+        deck.Card.from_id(dealer_card),
+        list(values),
+        deck.Deck(1),
+    )
+    assert values[decision] == pytest.approx(max(values.values()), abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "cards, dealer_card",
+    [
+        (["AC", "2D"], "5S"),
+        (["AC", "AD"], "6S"),
+        (["6C", "5D"], "TS"),
+        (["9C", "2D"], "AS"),
+        (["8C", "8D"], "TS"),
+        (["TC", "2D"], "3S"),
+        (["AC", "7D"], "2S"),
+    ],
+)
+def test__solved_strategy__plays_the_exact_best_option(
+    six_deck_strategy: strategy.Strategy,
+    cards: list[str],
+    dealer_card: str,
+):
+    """
+    The solved strategy takes the hand's cards and the dealer's face-up
+    card out of the shoe, so it picks the exact best option even when the
+    options are within a fraction of a percent of each other.
+    """
+    hand = participants.PlayerHand(bet=10, from_split=False)
+    hand.cards = [deck.Card.from_id(card) for card in cards]
+    composition = list(probabilities.full_composition(6))
+    for card in [*cards, dealer_card]:
+        composition[deck.Card.from_id(card).values.hard - 1] -= 1
+
+    values = expected_value.expected_values(
+        hand,
+        deck.Card.from_id(dealer_card),
+        composition,
+    )
+    decision = six_deck_strategy(
+        hand,
+        deck.Card.from_id(dealer_card),
+        list(values),
+        deck.Deck(1),
+    )
+    assert decision == max(values, key=values.__getitem__)
+
+
+def test__solver__needs_a_deck():
+    """
+    Strategies can only be solved for at least one deck.
+    """
+    with pytest.raises(ValueError):
+        solver.solve(0)
@@ -0,0 +1,167 @@
+"""
+Tests for the ``blackjack.stats`` module.
+"""
+
+import numpy as np
+import pytest
+
+from blackjack import stats
+
+VALUES = [10, -10, -20, 0, 10, -10, 20, 10, -10, -10]
+
+
+def test__statistics__match_the_stored_values():
+    """
+    The running statistics match the statistics of the values, had they
+    been stored.
+    """
+    statistics = stats.Statistics()
+    for value in VALUES:
+        statistics.add(value)
+
+    assert statistics.count == len(VALUES)
+    assert statistics.mean == pytest.approx(np.mean(VALUES))
+    assert statistics.variance == pytest.approx(np.var(VALUES, ddof=1))
+    assert statistics.standard_error == pytest.approx(
+        np.std(VALUES, ddof=1) / np.sqrt(len(VALUES))
+    )
+    assert statistics.total == sum(VALUES)
+    assert statistics.lowest_total == -20
+    assert statistics.highest_total == 10
+
+
+def test__statistics__can_be_merged():
+    """
+    Merging the statistics of consecutive values gives the statistics of
+    all the values, however they were added.
+    """
+    expected = stats.Statistics()
+    expected.add__many(VALUES)
+    first, second = stats.Statistics(), stats.Statistics()
+    for value in VALUES[:4]:
+        first.add(value)
+    second.add__many(VALUES[4:])
+    first.merge(second)
+    first.merge(stats.Statistics())
+
+    assert first.count == expected.count
+    assert first.mean == pytest.approx(expected.mean)
+    assert first.sum_of_squares == pytest.approx(expected.sum_of_squares)
+    assert first.total == expected.total
+    assert first.lowest_total == expected.lowest_total == -20
+    assert first.highest_total == expected.highest_total == 10
+
+
+def test__statistics__have_a_confidence_interval():
+    """
+    The confidence interval is centred on the mean, and is wider for a
+    higher confidence.
+    """
+    statistics = stats.Statistics()
+    statistics.add__many(VALUES)
+
+    low, high = statistics.confidence_interval(0.95)
+    assert (low + high) / 2 == pytest.approx(statistics.mean)
+    assert (high - low) / 2 == pytest.approx(
+        1.959964 * statistics.standard_error
+    )
+    assert statistics.half_width(0.99) > statistics.half_width(0.95)
+    assert stats.Statistics().confidence_interval() == (0, 0)
+
+
+@pytest.mark.parametrize("confidence", [0, 1, 1.5])
+def test__statistics__reject_an_invalid_confidence(confidence: float):
+    """
+    The confidence must be between 0 and 1.
+    """
+    with pytest.raises(ValueError):
+        stats.Statistics().half_width(confidence)
+
+
+def test__count_statistics__are_kept_for_each_bucket():
+    """
+    Each value goes in the bucket of its true count, rounded down, with the
+    true counts beyond the lowest and highest buckets in those buckets.
+    """
+    statistics = stats.CountStatistics(
+        lowest_true_count=-2, highest_true_count=2
+    )
+    for true_count, value in [
+        (-5, -1),
+        (-1.5, 1),
+        (-2, -1),
+        (0.5, 1),
+        (0, -1),
+        (0.99, 2),
+        (7, 1),
+    ]:
+        statistics.add(true_count, value)
+
+    assert statistics.true_counts.tolist() == [-2, -1, 0, 1, 2]
+    assert statistics.hands.tolist() == [3, 0, 3, 0, 1]
+    assert statistics.means == pytest.approx([-1 / 3, 0, 2 / 3, 0, 1])
+    assert statistics.variances == pytest.approx(
+        [np.var([-1, 1, -1], ddof=1), 0, np.var([1, -1, 2], ddof=1), 0, 0]
+    )
+
+
+def test__count_statistics__merge_like_adding_the_values():
+    """
+    Merging the statistics of two sets of values gives the same statistics
+    as adding all of the values, and stays accurate for values far from
+    zero.
+    """
+    values = 1e9 + np.random.default_rng(1).normal(size=(2, 100))
+    true_counts = np.random.default_rng(2).integers(-3, 3, size=(2, 100))
+    first, second, expected = (
+        stats.CountStatistics(lowest_true_count=-2, highest_true_count=2)
+        for _ in range(3)
+    )
+    for statistics, counts, values_ in [
+        (first, true_counts[0], values[0]),
+        (second, true_counts[1], values[1]),
+        (expected, true_counts.ravel(), values.ravel()),
+    ]:
+        for true_count, value in zip(counts, values_, strict=True):
+            statistics.add(true_count, value)
+    first.merge(second)
+
+    assert first.hands.tolist() == expected.hands.tolist()
+    assert first.means == pytest.approx(expected.means)
+    assert first.variances == pytest.approx(expected.variances)
+    bucket = np.clip(true_counts.ravel(), -2, 2) == 0
+    assert first.variances[2] == pytest.approx(
+        np.var(values.ravel()[bucket], ddof=1)
+    )
+
+
+def test__count_statistics__give_a_count_profile():
+    """
+    The count profile has the buckets that have any values, with their
+    frequencies, means and variances.
+    """
+    first = stats.CountStatistics(lowest_true_count=-1, highest_true_count=1)
+    second = stats.CountStatistics(lowest_true_count=-1, highest_true_count=1)
+    for value in [1, -1, 1]:
+        first.add(1, value)
+    second.add(-1, -1)
+    first.merge(second)
+    profile = first.profile()
+
+    assert profile.true_counts.tolist() == [-1, 1]
+    assert profile.frequencies == pytest.approx([0.25, 0.75])
+    assert profile.means == pytest.approx([-1, 1 / 3])
+    assert profile.variances == pytest.approx([0, np.var([1, -1, 1], ddof=1)])
+
+
+def test__count_statistics__are_validated():
+    """
+    The buckets must be in order, only statistics with the same buckets can
+    be merged, and a profile needs at least one value.
+    """
+    with pytest.raises(ValueError):
+        stats.CountStatistics(lowest_true_count=1, highest_true_count=0)
+    with pytest.raises(ValueError):
+        stats.CountStatistics().merge(stats.CountStatistics(-5, 5))
+    with pytest.raises(ValueError):
+        stats.CountStatistics().profile()
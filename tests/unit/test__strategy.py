@@ -0,0 +1,329 @@
+"""
+Tests for the ``blackjack.strategy`` module.
+"""
+
+import numpy as np
+import pytest
+
+from blackjack import deck, participants, sim, strategy
+
+# Aliases for brevity
+HIT = participants.PlayerOption.HIT
+STAND = participants.PlayerOption.STAND
+DOUBLE_DOWN = participants.PlayerOption.DOUBLE_DOWN
+SPLIT = participants.PlayerOption.SPLIT
+TAKE_INSURANCE = participants.PlayerOption.TAKE_INSURANCE
+NO_PAIR = [HIT, STAND, DOUBLE_DOWN]
+PAIR = [HIT, STAND, DOUBLE_DOWN, SPLIT]
+
+
+def _matrices() -> dict[str, dict[int, list[str]]]:
+    """
+    Matrices that always stand and never split.
+    """
+    return {
+        "hard": {total: ["s"] * 10 for total in strategy.HARD_TOTALS},
+        "soft": {total: ["s"] * 10 for total in strategy.SOFT_TOTALS},
+        "pairs": {value: ["-"] * 10 for value in strategy.PAIRS},
+    }
+
+
+@pytest.mark.parametrize(
+    "cards, dealer_card, options, expected",
+    [
+        (["TC", "6D"], "TS", [HIT, STAND], HIT),
+        (["TC", "6D"], "6S", [HIT, STAND], STAND),
+        (["5C", "6D"], "AS", NO_PAIR, HIT),
+        (["5C", "6D"], "TS", NO_PAIR, DOUBLE_DOWN),
+        (["5C", "6D"], "TS", [HIT, STAND], HIT),
+        (["AC", "7D"], "3S", NO_PAIR, DOUBLE_DOWN),
+        (["AC", "7D"], "3S", [HIT, STAND], STAND),
+        (["AC", "7D"], "9S", NO_PAIR, HIT),
+        (["8C", "8D"], "TS", PAIR, SPLIT),
+        (["8C", "8D"], "TS", [HIT, STAND], HIT),
+        (["5C", "5D"], "6S", PAIR, DOUBLE_DOWN),
+        (["TC", "TD"], "6S", PAIR, STAND),
+        (["AC", "AD"], "AS", [*PAIR, TAKE_INSURANCE], SPLIT),
+        (["AC", "AD"], "AS", [HIT, STAND, TAKE_INSURANCE], HIT),
+    ],
+)
+def test__basic_strategy__looks_up_the_option(
+    cards: list[str],
+    dealer_card: str,
+    options: list[participants.PlayerOption],
+    expected: participants.PlayerOption,
+):
+    """
+    The basic strategy looks up the option for the hand, falling back when
+    its preferred option is not available.
+    """
+    hand = participants.PlayerHand(bet=10, from_split=False)
+    hand.cards = [deck.Card.from_id(card) for card in cards]
+
+    decision = strategy.BASIC_STRATEGY(
+        hand,
+        deck.Card.from_id(dealer_card),
+        options,
+        deck.Deck(1),
+    )
+    assert decision == expected
+
+
+def test__strategy__can_play_a_simulation():
+    """
+    A compiled strategy can be used as the strategy for a simulation.
+    """
+    result = sim.simulate(strategy.BASIC_STRATEGY, number_of_rounds=200)
+
+    assert result.rounds == 200
+    assert sum(result.outcomes.values()) == result.hands
+
+
+@pytest.mark.parametrize(
+    "matrix, row, cells",
+    [
+        ("hard", 10, ["x"] * 10),
+        ("hard", 10, ["d"] * 10),
+        ("hard", 10, ["d/s/h"] * 10),
+        ("hard", 10, ["sp/h"] * 10),
+        ("hard", 10, ["s"] * 9),
+        ("soft", 22, ["s"] * 10),
+        ("pairs", 8, ["h"] * 10),
+    ],
+)
+def test__strategy__matrices_are_validated(
+    matrix: str,
+    row: int,
+    cells: list[str],
+):
+    """
+    Strategies can only be compiled from complete matrices of valid cells.
+    """
+    matrices = _matrices()
+    matrices[matrix][row] = cells
+
+    with pytest.raises(ValueError):
+        strategy.Strategy.from_matrices(**matrices)
+
+
+def test__strategy__can_be_rebuilt_from_its_table():
+    """
+    A strategy can be rebuilt from its compiled table, which must have the
+    right shape.
+    """
+    compiled = strategy.Strategy.from_matrices(**_matrices())
+    rebuilt = strategy.Strategy(compiled.table)
+
+    assert (rebuilt.table == compiled.table).all()
+    with pytest.raises(ValueError):
+        strategy.Strategy(compiled.table[:-1])
+
+
+def test__strategy__can_be_written_to_and_read_from_a_file():
+    """
+    A strategy written as a strategy file reads back as the same strategy.
+    """
+    text = strategy.dumps(strategy.BASIC_STRATEGY)
+    assert text.startswith("hard,2,3,4,5,6,7,8,9,10,A\n4,h,h,")
+    assert "\npairs,2,3,4,5,6,7,8,9,10,A\nA,sp," in text
+
+    commented = "# Basic strategy\n\n" + text.replace("d/h", " D/H ")
+    parsed = strategy.parse(commented)
+    assert (parsed.table == strategy.BASIC_STRATEGY.table).all()
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ("hard,2,3,4,5,6,7,8,9,10,A\n", ""),
+        ("hard,2,3,4,5,6,7,8,9,10,A", "hard,2,3,4,5,6,7,8,9,T,A"),
+        ("soft,2,3,4,5,6,7,8,9,10,A", "hard,2,3,4,5,6,7,8,9,10,A"),
+        ("\n13,", "\n12,"),
+        ("\n13,", "\nthirteen,"),
+        ("\n13,h", "\n13,x"),
+        ("pairs,2,3,4,5,6,7,8,9,10,A", ""),
+    ],
+)
+def test__strategy_files__are_validated(old: str, new: str):
+    """
+    Strategy files must have every section, with valid rows and cells.
+    """
+    text = strategy.dumps(strategy.BASIC_STRATEGY).replace(old, new, 1)
+
+    with pytest.raises(ValueError):
+        strategy.parse(text)
+
+
+def test__strategy_files__are_compiled_once_and_cached(tmp_path):
+    """
+    Loading a strategy file caches its compiled table, which is used until
+    the file changes.
+    """
+    path = tmp_path / "basic.csv"
+    path.write_text(strategy.dumps(strategy.BASIC_STRATEGY))
+
+    loaded = strategy.load(path)
+    caches = list(tmp_path.glob("basic.csv.*.npz"))
+    assert (loaded.table == strategy.BASIC_STRATEGY.table).all()
+    assert len(caches) == 1
+
+    reloaded = strategy.load(path)
+    assert (reloaded.table == loaded.table).all()
+    assert list(tmp_path.glob("basic.csv.*.npz")) == caches
+
+    path.write_text(strategy.dumps(strategy.BASIC_STRATEGY).replace("d/s", "s"))
+    changed = strategy.load(path)
+    assert (changed.table != loaded.table).any()
+    assert len(list(tmp_path.glob("basic.csv.*.npz"))) == 1
+    assert not caches[0].exists()
+
+
+def test__strategy__looks_up_many_hands_at_once():
+    """
+    Looking up many hands at once gives the same cells as looking them up
+    one at a time, with a split for the pairs that split.
+    """
+    table = strategy.BASIC_STRATEGY.table
+    hard = np.array([16, 11, 7, 16, 4, 20])
+    ace = np.array([False, False, True, False, False, False])
+    pair = np.array([0, 0, 0, 8, 2, 10])
+    column = np.array([8, 8, 1, 8, 0, 4])
+
+    cells = strategy.BASIC_STRATEGY.lookup(hard, ace, pair, column)
+
+    split = strategy.OPTIONS.index(SPLIT)
+    assert cells.tolist() == [
+        table[(16 - 4) * 10 + 8].tolist(),
+        table[(11 - 4) * 10 + 8].tolist(),
+        table[(len(strategy.HARD_TOTALS) + 17 - 12) * 10 + 1].tolist(),
+        [split, split],
+        [split, split],
+        table[(20 - 4) * 10 + 4].tolist(),
+    ]
+
+
+@pytest.mark.parametrize(
+    "cards, dealer_card, running_count, expected",
+    [
+        (["TC", "6D"], "TS", -1, HIT),
+        (["TC", "6D"], "TS", 0, STAND),
+        (["TC", "2D"], "4S", -1, HIT),
+        (["TC", "2D"], "4S", 0, STAND),
+        (["TC", "TD"], "6S", 23, STAND),
+        (["TC", "TD"], "6S", 24, SPLIT),
+    ],
+)
+def test__strategy__deviates_at_the_cells_index(
+    cards: list[str],
+    dealer_card: str,
+    running_count: int,
+    expected: participants.PlayerOption,
+):
+    """
+    A strategy deviates from a cell with an index play once the deck's
+    true count reaches the cell's index.
+    """
+    matrices = _matrices()
+    matrices["hard"][16][8] = "h|s@0"
+    matrices["hard"][12][2] = "h|s@0"
+    matrices["pairs"][10][4] = "-|sp@4"
+    indexed = strategy.Strategy.from_matrices(**matrices)
+
+    hand = participants.PlayerHand(bet=10, from_split=False)
+    hand.cards = [deck.Card.from_id(card) for card in cards]
+    deck_ = deck.Deck(6)
+    deck_.running_count = running_count
+
+    dealer_value = deck.Card.from_id(dealer_card).values.hard
+    decision = indexed(hand, deck.Card.from_id(dealer_card), PAIR, deck_)
+    assert decision == expected
+
+    true_count = np.array([running_count / 6])
+    cells = indexed.lookup(
+        np.array([hand.values.hard]),
+        np.array([hand.values.ace]),
+        np.array([hand[0].values.hard if hand[0].rank == hand[1].rank else 0]),
+        np.array([strategy.DEALER_CARDS.index(dealer_value)]),
+        true_count,
+    )
+    assert strategy.OPTIONS[cells[0, 0]] == expected
+
+
+def test__strategy__index_plays_can_be_written_to_and_read_from_a_file():
+    """
+    Index plays are written to strategy files, and read back from them.
+    """
+    text = strategy.dumps(strategy.BASIC_STRATEGY)
+    text = text.replace(
+        "\n16,s,s,s,s,s,h,h,h,h,h", "\n16,s,s,s,s,s,h,h,h|s@4, H | S @ 0 ,h"
+    )
+    text = text.replace("\n10,-,-,-,-,-,", "\n10,-,-,-,-|sp@5.5,-,")
+
+    parsed = strategy.parse(text)
+    assert strategy.dumps(parsed) == text.replace(" H | S @ 0 ", "h|s@0")
+    assert (parsed.table == strategy.BASIC_STRATEGY.table).all()
+    assert np.isfinite(parsed.indices).sum() == 3
+
+
+@pytest.mark.parametrize("cell", ["h|s", "h|s@", "h|s@x", "h|s@inf", "h|x@1"])
+def test__strategy__index_plays_are_validated(cell: str):
+    """
+    Index plays need a valid cell to deviate to and a finite true count.
+    """
+    matrices = _matrices()
+    matrices["hard"][16][8] = cell
+
+    with pytest.raises(ValueError):
+        strategy.Strategy.from_matrices(**matrices)
+
+
+def test__strategy__has_a_fingerprint_of_its_tables():
+    """
+    Strategies with the same tables have the same fingerprint, however
+    they were made, and different tables have different fingerprints.
+    """
+    text = strategy.dumps(strategy.BASIC_STRATEGY)
+    indexed = strategy.parse(
+        text.replace("\n16,s,s,s,s,s,h,h,h,h,h", "\n16,s,s,s,s,s,h,h,h|s@4,h,h")
+    )
+
+    assert (
+        strategy.parse(text).fingerprint()
+        == strategy.BASIC_STRATEGY.fingerprint()
+    )
+    assert indexed.fingerprint() != strategy.BASIC_STRATEGY.fingerprint()
+
+
+def test__strategy__can_be_mutated():
+    """
+    Mutating a strategy redraws some of its cells as valid cells, and
+    keeps its index plays.
+    """
+    text = strategy.dumps(strategy.BASIC_STRATEGY)
+    indexed = strategy.parse(
+        text.replace("\n16,s,s,s,s,s,h,h,h,h,h", "\n16,s,s,s,s,s,h,h,h|s@4,h,h")
+    )
+    rng = np.random.default_rng(1)
+
+    unchanged = indexed.mutate(rng, rate=0)
+    assert unchanged.fingerprint() == indexed.fingerprint()
+
+    mutated = indexed.mutate(rng, rate=0.5)
+    changed = (mutated.table != indexed.table).any(axis=1)
+    assert 0.1 * len(changed) < changed.sum() < 0.5 * len(changed)
+    assert (mutated.indices == indexed.indices).all()
+    # The mutated strategy is still a valid strategy file
+    assert strategy.parse(strategy.dumps(mutated)).fingerprint() == (
+        mutated.fingerprint()
+    )
+    # Pair cells are only ever split or not
+    pair_cells = strategy.dumps(mutated).split("pairs")[1].split("\n")[2:]
+    assert {
+        cell.split("|")[0]
+        for row in pair_cells
+        if row
+        for cell in row.split(",")[1:]
+    } <= {"sp", "-"}
+
+    with pytest.raises(ValueError):
+        indexed.mutate(rng, rate=1.5)
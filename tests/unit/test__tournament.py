@@ -0,0 +1,102 @@
+"""
+Tests for the ``blackjack.tournament`` module.
+"""
+
+import pytest
+
+from blackjack import sim, strategy, tournament
+
+
+@pytest.fixture
+def small_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Split tournaments into small tasks, so that tests use several of them.
+    """
+    monkeypatch.setattr(tournament, "SHOES_PER_TASK", 7)
+
+
+@pytest.mark.usefixtures("small_tasks")
+def test__tournaments_play_every_strategy_on_the_same_shoes():
+    """
+    Every strategy plays the same shoes, so a strategy entered twice gets
+    the same result, and the strategies are ranked by the money they won.
+    """
+    result = tournament.play(
+        {
+            "dealer": sim.mimic_the_dealer,
+            "basic": strategy.BASIC_STRATEGY,
+            "basic again": strategy.BASIC_STRATEGY,
+        },
+        number_of_shoes=20,
+        seed=1,
+        workers=2,
+    )
+
+    standings = {standing.name: standing for standing in result.standings}
+    assert standings["basic"].result == standings["basic again"].result
+    assert standings["basic"].result.rounds > 20
+    assert [standing.result.net for standing in result.standings] == sorted(
+        (standing.result.net for standing in result.standings),
+        reverse=True,
+    )
+
+    leader = result.standings[0]
+    assert leader.difference.count == 20
+    assert leader.difference.sum_of_squares == 0
+    for standing in result.standings:
+        assert standing.difference.total == pytest.approx(
+            standing.result.net - leader.result.net
+        )
+
+
+@pytest.mark.usefixtures("small_tasks")
+def test__tournaments_do_not_depend_on_the_number_of_workers():
+    """
+    Tournaments with the same seed give the same standings however many
+    workers are used.
+    """
+    results = [
+        tournament.play(
+            {"dealer": sim.mimic_the_dealer, "basic": strategy.BASIC_STRATEGY},
+            number_of_shoes=15,
+            seed=42,
+            workers=workers,
+        )
+        for workers in [1, 3]
+    ]
+
+    assert results[0] == results[1]
+
+
+def test__tournaments_can_be_shown_as_a_table():
+    """
+    The table has a row for each strategy, in the order of the standings.
+    """
+    result = tournament.play(
+        {"dealer": sim.mimic_the_dealer, "basic": strategy.BASIC_STRATEGY},
+        number_of_shoes=5,
+        seed=1,
+        workers=1,
+    )
+    rows = result.table().splitlines()
+
+    assert len(rows) == 3
+    for row, standing in zip(rows[1:], result.standings, strict=True):
+        assert standing.name in row
+    assert rows[1].endswith("-")
+    assert "[" in rows[2]
+
+
+@pytest.mark.parametrize(
+    "strategies, number_of_shoes",
+    [({}, 10), ({"dealer": sim.mimic_the_dealer}, 0)],
+)
+def test__tournaments_are_validated(
+    strategies: dict[str, sim.rules.Strategy],
+    number_of_shoes: int,
+):
+    """
+    A tournament needs at least one strategy and one shoe.
+    """
+    with pytest.raises(ValueError):
+        tournament.play(strategies, number_of_shoes)